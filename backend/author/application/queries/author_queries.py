@@ -4,6 +4,7 @@ from author.domain.author_entities import Author
 from author.domain.author_query_interface import AuthorQueryInterface
 from author.infrastructure.author_model import AuthorModel
 from author.infrastructure.author_repository import AuthorRepository
+from config.conditional import ResourceVersion
 
 
 class AuthorQueries(AuthorQueryInterface):
@@ -24,3 +25,6 @@ class AuthorQueries(AuthorQueryInterface):
         except AuthorModel.DoesNotExist:
             self.logger.warning(f"[AuthorQueries] Author with ID {author_id} not found")
             return None
+
+    def get_version(self, author_id: int | None = None) -> ResourceVersion:
+        return self.repository.get_version(author_id)
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Cast, Upper
 
 
 class AuthorModel(models.Model):
@@ -9,3 +11,13 @@ class AuthorModel(models.Model):
 
     def __str__(self):
         return self.name
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['name'], name='author_name_trgm_gin', opclasses=['gin_trgm_ops']),
+            models.Index(
+                OpClass(Upper(Cast('name', models.TextField())), name='text_pattern_ops'),
+                name='author_name_prefix_idx',
+            ),
+            models.Index(fields=['updated_at'], name='author_updated_at_idx'),
+        ]
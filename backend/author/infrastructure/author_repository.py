@@ -1,13 +1,20 @@
 import logging
 
+from django.db.models import Count, Max
+from django.utils import timezone
+
 from author.domain.author_command_interface import AuthorCommandInterface
 from author.domain.author_entities import Author
 from author.domain.author_query_interface import AuthorQueryInterface
+from book.infrastructure.cache.book_cache import BookCache
+from book.infrastructure.repository.book_model import BookModel
+from config.conditional import ResourceVersion
 from .author_model import AuthorModel
 
 
 class AuthorRepository(AuthorCommandInterface, AuthorQueryInterface):
     def __init__(self):
+        self.book_cache = BookCache()
         self.logger = logging.getLogger(__name__)
 
     def get_all(self) -> list[Author]:
@@ -27,6 +34,10 @@ class AuthorRepository(AuthorCommandInterface, AuthorQueryInterface):
             self.logger.exception(f"[AuthorRepository] Unexpected error fetching author {author_id}")
             raise
 
+    def get_version(self, author_id: int | None = None) -> ResourceVersion:
+        queryset = AuthorModel.objects.all() if author_id is None else AuthorModel.objects.filter(id=author_id)
+        return ResourceVersion(**queryset.aggregate(last_modified=Max("updated_at"), count=Count("id")))
+
     def create(self, author: Author) -> Author:
         try:
             data = author.__dict__.copy()
@@ -42,12 +53,13 @@ class AuthorRepository(AuthorCommandInterface, AuthorQueryInterface):
         try:
             data = author.__dict__.copy()
             data.pop("id", None)
-            updated = AuthorModel.objects.filter(id=author_id).update(**data)
+            updated = AuthorModel.objects.filter(id=author_id).update(**data, updated_at=timezone.now())
             if updated == 0:
                 self.logger.warning(f"[AuthorRepository] Author {author_id} not found for update")
                 raise AuthorModel.DoesNotExist(f"Author {author_id} not found")
 
             obj = AuthorModel.objects.get(id=author_id)
+            self.book_cache.invalidate(*self.book_cache.book_ids_for_author(author_id))
             self.logger.info(f"[AuthorRepository] Author {author_id} updated successfully")
             return self._to_entity(obj)
         except Exception:
@@ -56,10 +68,14 @@ class AuthorRepository(AuthorCommandInterface, AuthorQueryInterface):
 
     def delete(self, author_id: int) -> None:
         try:
+            affected_books = self.book_cache.book_ids_for_author(author_id)
             deleted, _ = AuthorModel.objects.filter(id=author_id).delete()
             if deleted == 0:
                 self.logger.warning(f"[AuthorRepository] Author {author_id} not found for deletion")
                 raise AuthorModel.DoesNotExist(f"Author {author_id} not found")
+            # The link rows are gone; bump the books so reindex_books --since picks them up.
+            BookModel.objects.filter(id__in=affected_books).update(updated_at=timezone.now())
+            self.book_cache.invalidate(*affected_books)
             self.logger.info(f"[AuthorRepository] Author {author_id} deleted successfully")
         except Exception:
             self.logger.exception(f"[AuthorRepository] Unexpected error deleting author {author_id}")
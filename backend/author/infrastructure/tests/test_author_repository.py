@@ -5,6 +5,7 @@ from unittest.mock import Mock
 from author.domain.author_entities import Author
 from author.infrastructure.author_model import AuthorModel
 from author.infrastructure.author_repository import AuthorRepository
+from config.conditional import ResourceVersion
 
 
 @pytest.fixture
@@ -20,6 +21,12 @@ def mock_author_model():
     return mock
 
 
+@pytest.fixture(autouse=True)
+def mock_book_cache(mocker):
+    cache = mocker.patch("author.infrastructure.author_repository.BookCache")
+    return cache.return_value
+
+
 @pytest.fixture
 def repository():
     return AuthorRepository()
@@ -111,6 +118,7 @@ def test_update_author_success(repository, mocker):
     assert isinstance(result, Author)
     assert result.id == 1
     assert result.name == "Updated Author"
+    assert "updated_at" in mock_filter.return_value.update.call_args.kwargs
 
 
 def test_update_author_not_found(repository, mocker):
@@ -153,3 +161,39 @@ def test_delete_author_unexpected_exception(repository, mocker):
 
     with pytest.raises(Exception, match="delete failed"):
         repository.delete(1)
+
+
+def test_update_author_invalidates_cached_books(repository, mocker, mock_book_cache):
+    mock_filter = mocker.patch("author.infrastructure.author_repository.AuthorModel.objects.filter")
+    mock_filter.return_value.update.return_value = 1
+    mocker.patch("author.infrastructure.author_repository.AuthorModel.objects.get", return_value=Mock(id=1, name="A"))
+    mock_book_cache.book_ids_for_author.return_value = [10, 11]
+
+    repository.update(1, Author(id=1, name="A"))
+
+    mock_book_cache.book_ids_for_author.assert_called_once_with(1)
+    mock_book_cache.invalidate.assert_called_once_with(10, 11)
+
+
+def test_delete_author_invalidates_cached_books(repository, mocker, mock_book_cache):
+    mock_filter = mocker.patch("author.infrastructure.author_repository.AuthorModel.objects.filter")
+    mock_filter.return_value.delete.return_value = (1, {})
+    mock_book_filter = mocker.patch("author.infrastructure.author_repository.BookModel.objects.filter")
+    mock_book_cache.book_ids_for_author.return_value = [10]
+
+    repository.delete(1)
+
+    mock_book_filter.assert_called_once_with(id__in=[10])
+    assert "updated_at" in mock_book_filter.return_value.update.call_args.kwargs
+    mock_book_cache.invalidate.assert_called_once_with(10)
+
+
+def test_get_version_for_list_and_detail(repository, mocker):
+    stamp = datetime(2024, 1, 2, 12, 0)
+    mock_objects = mocker.patch("author.infrastructure.author_repository.AuthorModel.objects")
+    mock_objects.all.return_value.aggregate.return_value = {"last_modified": stamp, "count": 2}
+    mock_objects.filter.return_value.aggregate.return_value = {"last_modified": None, "count": 0}
+
+    assert repository.get_version() == ResourceVersion(last_modified=stamp, count=2)
+    assert repository.get_version(9) == ResourceVersion(last_modified=None, count=0)
+    mock_objects.filter.assert_called_once_with(id=9)
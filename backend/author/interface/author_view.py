@@ -4,11 +4,14 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from django.conf import settings
+
 from author.application.commands.author_commands import AuthorCommands
 from author.application.queries.author_queries import AuthorQueries
 from author.domain.author_entities import Author
 from author.interface.serializer.author_input_serializer import AuthorInputSerializer
 from author.interface.serializer.author_output_serializer import AuthorOutputSerializer
+from config.conditional import ConditionalGet
 
 
 class AuthorView(APIView):
@@ -24,11 +27,19 @@ class AuthorView(APIView):
         if author_id:
             self.logger.info(f"[AuthorView] GET /author/{author_id} requested")
             try:
+                conditional = ConditionalGet(
+                    request, self.author_queries.get_version(author_id), settings.AUTHOR_HTTP_CACHE_CONTROL
+                )
+                not_modified = conditional.not_modified()
+                if not_modified is not None:
+                    self.logger.info(f"[AuthorView] Author {author_id} not modified")
+                    return not_modified
+
                 author = self.author_queries.get_by_id(author_id)
                 if author:
                     self.logger.info(f"[AuthorView] Author {author_id} found")
                     serializer = AuthorOutputSerializer(author)
-                    return Response(serializer.data)
+                    return conditional.apply(Response(serializer.data))
                 self.logger.warning(f"[AuthorView] Author {author_id} not found")
                 return Response({"detail": "Author not found"}, status=status.HTTP_404_NOT_FOUND)
             except Exception:
@@ -37,10 +48,16 @@ class AuthorView(APIView):
 
         self.logger.info("[AuthorView] GET /author list requested")
         try:
+            conditional = ConditionalGet(request, self.author_queries.get_version(), settings.AUTHOR_HTTP_CACHE_CONTROL)
+            not_modified = conditional.not_modified()
+            if not_modified is not None:
+                self.logger.info("[AuthorView] Authors list not modified")
+                return not_modified
+
             authors = self.author_queries.get_all()
             self.logger.info(f"[AuthorView] Returned {len(authors)} authors")
             serializer = AuthorOutputSerializer(authors, many=True)
-            return Response(serializer.data)
+            return conditional.apply(Response(serializer.data))
         except Exception:
             self.logger.exception("[AuthorView] Error retrieving author list")
             return Response({"detail": "Error retrieving author list"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
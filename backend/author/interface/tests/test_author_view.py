@@ -1,7 +1,12 @@
+from datetime import datetime, timezone
+
 import pytest
 from rest_framework.test import APIClient
 
 from author.domain.author_entities import Author
+from config.conditional import ResourceVersion
+
+VERSION = ResourceVersion(last_modified=datetime(2024, 1, 1, tzinfo=timezone.utc), count=1)
 
 
 @pytest.fixture
@@ -26,6 +31,7 @@ def make_author():
 
 def test_get_author_found(client, mocker, make_author):
     mock_query = mocker.patch("author.interface.author_view.AuthorQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.return_value = make_author()
 
     response = client.get("/api/author/1/")
@@ -36,6 +42,7 @@ def test_get_author_found(client, mocker, make_author):
 
 def test_get_author_not_found(client, mocker):
     mock_query = mocker.patch("author.interface.author_view.AuthorQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.return_value = None
 
     response = client.get("/api/author/999/")
@@ -46,6 +53,7 @@ def test_get_author_not_found(client, mocker):
 
 def test_get_author_exception(client, mocker):
     mock_query = mocker.patch("author.interface.author_view.AuthorQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.side_effect = Exception("error")
 
     response = client.get("/api/author/1/")
@@ -56,6 +64,7 @@ def test_get_author_exception(client, mocker):
 
 def test_get_all_authors(client, mocker, make_author):
     mock_query = mocker.patch("author.interface.author_view.AuthorQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_all.return_value = [
         make_author(),
         make_author(id=2, name="Author B")
@@ -71,6 +80,7 @@ def test_get_all_authors(client, mocker, make_author):
 
 def test_get_all_authors_exception(client, mocker):
     mock_query = mocker.patch("author.interface.author_view.AuthorQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_all.side_effect = Exception("db error")
 
     response = client.get("/api/author/")
@@ -171,3 +181,15 @@ def test_delete_author_exception(client, mocker):
 
     assert response.status_code == 500
     assert response.data["detail"] == "Error deleting author"
+
+
+def test_get_author_not_modified(client, mocker, make_author):
+    mock_query = mocker.patch("author.interface.author_view.AuthorQueries")
+    mock_query().get_version.return_value = VERSION
+    mock_query().get_by_id.return_value = make_author()
+
+    etag = client.get("/api/author/1/")["ETag"]
+    response = client.get("/api/author/1/", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert mock_query().get_by_id.call_count == 1
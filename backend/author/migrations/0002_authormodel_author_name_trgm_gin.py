@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('author', '0001_initial'),
+        # pg_trgm is enabled by the book app's initial migration.
+        ('book', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='authormodel',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='author_name_trgm_gin', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:20
+
+from django.contrib.postgres.indexes import OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models.functions import Cast, Upper
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('author', '0002_authormodel_author_name_trgm_gin'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='authormodel',
+            index=models.Index(
+                OpClass(Upper(Cast('name', models.TextField())), name='text_pattern_ops'),
+                name='author_name_prefix_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('author', '0003_authormodel_author_name_prefix_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='authormodel',
+            index=models.Index(fields=['updated_at'], name='author_updated_at_idx'),
+        ),
+    ]
@@ -2,11 +2,17 @@ import logging
 from datetime import date, datetime
 from abc import ABC
 
+from django.conf import settings
+from django.db import transaction
+
 from book.domain.book_command_interface import BookCommandInterface
-from book.domain.book_entities import Book
+from book.domain.book_entities import Book, BookBulkJob
+from book.infrastructure.repository.book_bulk_job_repository import BookBulkJobRepository
 from book.infrastructure.repository.book_repository import BookRepository
-from book.infrastructure.repository.book_search_repository import BookSearchRepository
 from book.application.task.create_book_task import create_book_task
+from book.application.task.create_books_batch_task import create_books_batch_task
+from book.application.task.flush_book_index_task import flush_book_index_task, queue_book_index
+from book.infrastructure.repository.book_index_outbox_repository import BookIndexOutboxRepository
 from book.application.event.book_created_event import book_created_event
 from book.application.event.book_deleted_event import book_deleted_event
 from book.application.event.book_updated_event import book_updated_event
@@ -19,15 +25,26 @@ class BookCommands(BookCommandInterface, ABC):
 
     def create(self, book: Book) -> Book:
         self.logger.info(f"[BookCommands] Queuing book for creation: {book.title}")
-        data = {
-            k: (v.isoformat() if isinstance(v, (date, datetime)) else v)
-            for k, v in book.__dict__.items()
-        }
+        data = self._to_message(book)
         create_book_task.send(data)
         # book_created_event.send(data)
 
         return Book(**data)
 
+    def create_many(self, books: list[tuple[int, Book]], errors: list[dict] = ()) -> BookBulkJob:
+        """Queues ``(request index, book)`` pairs in batches under a job whose results can be polled."""
+        batch_size = settings.BOOK_BULK_BATCH_SIZE
+        self.logger.info(f"[BookCommands] Queuing {len(books)} books for bulk creation")
+        batches = [books[start:start + batch_size] for start in range(0, len(books), batch_size)]
+        job = BookBulkJobRepository().create(len(books) + len(errors), len(batches), list(errors))
+        for number, batch in enumerate(batches):
+            create_books_batch_task.send(
+                [self._to_message(book) for _, book in batch], job.id, number, [index for index, _ in batch]
+            )
+
+        self.logger.info(f"[BookCommands] Queued {len(batches)} book batches for job {job.id}")
+        return job
+
     def update(self, book_id: int, book: Book) -> Book:
         self.logger.info(f"[BookCommands] Updating book with ID: {book_id}")
         existing = self.repository.get_by_id(book_id)
@@ -37,17 +54,13 @@ class BookCommands(BookCommandInterface, ABC):
             raise ValueError("Book not found")
 
         book.id = book_id
-        updated = self.repository.update(book_id, book)
+        with transaction.atomic():
+            updated = self.repository.update(book_id, book)
+            entries = [(book_id, updated.isbn, "index")]
+            if existing.isbn != updated.isbn:
+                entries.append((book_id, existing.isbn, "delete"))
+            queue_book_index(entries)
         self.logger.info(f"[BookCommands] Book ID {book_id} updated successfully")
-
-        BookSearchRepository().index_book({
-            "isbn": updated.isbn,
-            "title": updated.title,
-            "synopsis": updated.synopsis,
-            "authors": [a.name for a in updated.authors],
-            "categories": [c.name for c in updated.categories],
-            "publication_date": updated.publication_date,
-        })
         # book_updated_event.send(data)
 
         return updated
@@ -59,7 +72,22 @@ class BookCommands(BookCommandInterface, ABC):
             self.logger.warning(f"[BookCommands] Attempt to delete non-existent book ID: {book_id}")
             raise ValueError("Book not found")
 
-        self.repository.delete(book_id)
-        BookSearchRepository.delete_book(book.isbn)
+        with transaction.atomic():
+            self.repository.delete(book_id)
+            queue_book_index([(book_id, book.isbn, "delete")])
         # book_deleted_event.send(data)
         self.logger.info(f"[BookCommands] Book ID {book_id} deleted successfully")
+
+    def requeue_index_dead_letters(self) -> int:
+        requeued = BookIndexOutboxRepository().requeue_dead()
+        self.logger.info(f"[BookCommands] Requeued {requeued} dead-lettered index mutations")
+        if requeued:
+            flush_book_index_task.send()
+        return requeued
+
+    @staticmethod
+    def _to_message(book: Book) -> dict:
+        return {
+            k: (v.isoformat() if isinstance(v, (date, datetime)) else v)
+            for k, v in book.__dict__.items()
+        }
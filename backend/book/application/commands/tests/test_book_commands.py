@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from book.domain.book_entities import Book
+from book.domain.book_entities import Book, BookBulkJob
 from book.application.commands.book_commands import BookCommands
 
 
@@ -25,6 +25,11 @@ def make_book():
     return _make
 
 
+@pytest.fixture(autouse=True)
+def mock_atomic(mocker):
+    return mocker.patch("book.application.commands.book_commands.transaction.atomic")
+
+
 @pytest.fixture
 def commands(mocker):
     mocker.patch("book.application.commands.book_commands.BookRepository")
@@ -44,6 +49,26 @@ def test_create_book_sends_task(commands, mocker, make_book):
     log_spy.assert_any_call("[BookCommands] Queuing book for creation: Clean Code")
 
 
+def test_create_many_sends_batches_under_a_job(commands, mocker, make_book, settings):
+    settings.BOOK_BULK_BATCH_SIZE = 2
+    books = [(index, make_book(isbn=str(index))) for index in (0, 1, 3, 4, 5)]
+    errors = [{"index": 2, "errors": {"isbn": ["This field is required."]}}]
+    mock_jobs = mocker.patch("book.application.commands.book_commands.BookBulkJobRepository").return_value
+    mock_jobs.create.return_value = BookBulkJob(id="job-1", status="pending", total=6, batches=3)
+    mock_send = mocker.patch("book.application.commands.book_commands.create_books_batch_task.send")
+
+    job = commands.create_many(books, errors)
+
+    assert job.id == "job-1"
+    mock_jobs.create.assert_called_once_with(6, 3, errors)
+    assert [len(call.args[0]) for call in mock_send.call_args_list] == [2, 2, 1]
+    assert mock_send.call_args_list[0].args[0][0]["publication_date"] == "2008-08-01"
+    # Each batch carries the job, its number and the request indexes of its books.
+    assert [call.args[1:] for call in mock_send.call_args_list] == [
+        ("job-1", 0, [0, 1]), ("job-1", 1, [3, 4]), ("job-1", 2, [5]),
+    ]
+
+
 def test_update_book_success(commands, mocker, make_book):
     book_id = 1
     updated_input = make_book()
@@ -53,7 +78,7 @@ def test_update_book_success(commands, mocker, make_book):
     mock_repo.get_by_id.return_value = updated_input
     mock_repo.update.return_value = updated_result
 
-    mock_search_repo = mocker.patch("book.application.commands.book_commands.BookSearchRepository")
+    mock_queue = mocker.patch("book.application.commands.book_commands.queue_book_index")
 
     log_spy = mocker.spy(commands.logger, "info")
 
@@ -63,7 +88,7 @@ def test_update_book_success(commands, mocker, make_book):
     assert updated_input.id == book_id
     mock_repo.get_by_id.assert_called_once_with(book_id)
     mock_repo.update.assert_called_once_with(book_id, updated_input)
-    mock_search_repo.return_value.index_book.assert_called_once()
+    mock_queue.assert_called_once_with([(1, updated_result.isbn, "index")])
     log_spy.assert_any_call("[BookCommands] Updating book with ID: 1")
     log_spy.assert_any_call("[BookCommands] Book ID 1 updated successfully")
 
@@ -81,20 +106,21 @@ def test_update_book_not_found(commands, mocker, make_book):
     log_spy.assert_called_once_with("[BookCommands] Attempt to update non-existent book ID: 999")
 
 
-def test_delete_book_success(commands, mocker, make_book):
+def test_delete_book_success(commands, mocker, make_book, mock_atomic):
     book_id = 1
     book = make_book(id=book_id, isbn="123")
     mock_repo = commands.repository
     mock_repo.get_by_id.return_value = book
 
-    mock_delete_book = mocker.patch("book.application.commands.book_commands.BookSearchRepository.delete_book")
+    mock_queue = mocker.patch("book.application.commands.book_commands.queue_book_index")
     log_spy = mocker.spy(commands.logger, "info")
 
     commands.delete(book_id)
 
     mock_repo.get_by_id.assert_called_once_with(book_id)
     mock_repo.delete.assert_called_once_with(book_id)
-    mock_delete_book.assert_called_once_with("123")
+    mock_queue.assert_called_once_with([(1, "123", "delete")])
+    mock_atomic.assert_called_once_with()
     log_spy.assert_any_call("[BookCommands] Deleting book with ID: 1")
     log_spy.assert_any_call("[BookCommands] Book ID 1 deleted successfully")
 
@@ -109,3 +135,22 @@ def test_delete_book_not_found(commands, mocker):
 
     mock_repo.get_by_id.assert_called_once_with(999)
     log_spy.assert_called_once_with("[BookCommands] Attempt to delete non-existent book ID: 999")
+
+
+def test_update_book_isbn_change_deletes_old_document(commands, mocker, make_book):
+    commands.repository.get_by_id.return_value = make_book(id=1, isbn="old")
+    commands.repository.update.return_value = make_book(id=1, isbn="new")
+    mock_queue = mocker.patch("book.application.commands.book_commands.queue_book_index")
+
+    commands.update(1, make_book(isbn="new"))
+
+    mock_queue.assert_called_once_with([(1, "new", "index"), (1, "old", "delete")])
+
+
+def test_requeue_index_dead_letters_triggers_flush(commands, mocker):
+    mock_outbox = mocker.patch("book.application.commands.book_commands.BookIndexOutboxRepository")
+    mock_outbox.return_value.requeue_dead.return_value = 3
+    mock_flush = mocker.patch("book.application.commands.book_commands.flush_book_index_task")
+
+    assert commands.requeue_index_dead_letters() == 3
+    mock_flush.send.assert_called_once()
@@ -1,22 +1,105 @@
 import logging
+from typing import Iterator
+from urllib.parse import quote
 
-from book.domain.book_entities import Book
+from django.conf import settings
+from django.core.cache import caches
+from elasticsearch import ApiError, TransportError
+
+from book.domain.book_entities import Book, BookBulkJob, BookPage, BookSearchResult, BookSuggestions
 from book.domain.book_query_interface import BookQueryInterface
+from book.infrastructure.repository.book_bulk_job_repository import BookBulkJobRepository
+from book.infrastructure.repository.book_index_outbox_repository import BookIndexOutboxRepository
 from book.infrastructure.repository.book_model import BookModel
 from book.infrastructure.repository.book_repository import BookRepository
+from book.infrastructure.repository.book_search_repository import BookSearchRepository
+from config.conditional import ResourceVersion
+from config.pagination import decode_cursor, decode_search_after, encode_cursor, encode_search_after
 
 
 class BookQueries(BookQueryInterface):
     def __init__(self):
         self.repository = BookRepository()
+        self.search_repository = BookSearchRepository()
         self.logger = logging.getLogger(__name__)
 
-    def get_all(self) -> list[Book]:
+    def get_all(self, fields: frozenset[str] | None = None) -> list[Book]:
         self.logger.info("[BookQueries] get_all() called")
-        books = self.repository.get_all()
+        books = self.repository.get_all(fields)
         self.logger.info(f"[BookQueries] get_all() returned {len(books)} records")
         return books
 
+    def get_page(self, cursor: str | None, limit: int, fields: frozenset[str] | None = None) -> BookPage:
+        self.logger.info(f"[BookQueries] get_page(limit={limit}) called")
+        after_id = decode_cursor(cursor)
+        books = self.repository.get_page(after_id, limit + 1, fields)
+
+        next_cursor = None
+        if len(books) > limit:
+            books = books[:limit]
+            next_cursor = encode_cursor(books[-1].id)
+
+        self.logger.info(f"[BookQueries] get_page() returned {len(books)} records")
+        return BookPage(items=books, next_cursor=next_cursor)
+
+    def iterate_all(self, chunk_size: int) -> Iterator[Book]:
+        self.logger.info(f"[BookQueries] iterate_all(chunk_size={chunk_size}) called")
+        return self.repository.iterate_all(chunk_size)
+
+    def search(self, query: str, filters: dict, size: int, page: int = 1,
+               cursor: str | None = None, facets: list[str] = ()) -> BookSearchResult:
+        self.logger.info(f"[BookQueries] search('{query}', facets={facets}) called")
+        search_after = decode_search_after(cursor)
+        offset = (page - 1) * size
+        facet_size = settings.BOOK_FACET_SIZE
+
+        try:
+            total, hits, last_sort, facet_counts = self.search_repository.search(
+                query, filters, size, offset, search_after, facets, facet_size
+            )
+            next_cursor = encode_search_after(last_sort) if last_sort else None
+            return BookSearchResult(
+                total=total, hits=hits, source="elasticsearch", next_cursor=next_cursor, facets=facet_counts
+            )
+        except (TransportError, ApiError) as e:
+            if isinstance(e, ApiError) and e.status_code < 500:
+                raise
+            self.logger.warning(f"[BookQueries] Elasticsearch unavailable, falling back to trigram search: {e}")
+
+        total, books, facet_counts = self.repository.search_trigram(query, filters, size, offset, facets, facet_size)
+        hits = [
+            {
+                **{field: document[field] for field in BookSearchRepository.HIT_FIELDS},
+                "highlight": {},
+            }
+            for document in map(BookSearchRepository.to_document, books)
+        ]
+        return BookSearchResult(total=total, hits=hits, source="postgres", facets=facet_counts)
+
+    def suggest(self, prefix: str, size: int) -> BookSuggestions:
+        prefix = " ".join(prefix.split())
+        cache = caches[settings.BOOK_SUGGEST_CACHE_ALIAS]
+        key = f"suggest:{size}:{quote(prefix.casefold())}"
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            titles, authors = self.search_repository.suggest(prefix, size)
+            suggestions = BookSuggestions(titles=titles, authors=authors, source="elasticsearch")
+        except Exception as e:
+            self.logger.warning(f"[BookQueries] Elasticsearch suggest failed, falling back to prefix index: {e}")
+            titles, authors = self.repository.suggest_prefix(prefix, size)
+            suggestions = BookSuggestions(titles=titles, authors=authors, source="postgres")
+
+        cache.set(key, suggestions)
+        return suggestions
+
+    def search_trigram(self, query: str, limit: int, fields: frozenset[str] | None = None) -> list[Book]:
+        self.logger.info(f"[BookQueries] search_trigram('{query}') called")
+        _, books, _ = self.repository.search_trigram(query, {}, limit, fields=fields)
+        return books
+
     def get_by_id(self, book_id: int) -> Book | None:
         self.logger.info(f"[BookQueries] get_by_id({book_id}) called")
         try:
@@ -30,6 +113,18 @@ class BookQueries(BookQueryInterface):
             self.logger.exception(f"[BookQueries] Unexpected error retrieving book {book_id}")
             return None
 
+    def get_version(self, book_id: int | None = None) -> ResourceVersion:
+        return self.repository.get_version(book_id)
+
     def get_queryset(self):
         self.logger.info("[BookQueries] get_queryset() called")
         return self.repository.get_queryset()
+
+    def get_bulk_job(self, job_id: str) -> BookBulkJob | None:
+        self.logger.info(f"[BookQueries] get_bulk_job({job_id}) called")
+        return BookBulkJobRepository().get(job_id)
+
+    def get_index_status(self) -> dict:
+        stats = BookIndexOutboxRepository().stats()
+        self.logger.info(f"[BookQueries] Index queue status: {stats}")
+        return stats
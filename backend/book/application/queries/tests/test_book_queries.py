@@ -1,7 +1,11 @@
 import pytest
+from elasticsearch import ApiError, ConnectionError
+
 from book.application.queries.book_queries import BookQueries
 from book.domain.book_entities import Book
 from book.infrastructure.repository.book_model import BookModel
+from book.infrastructure.repository.book_search_repository import BookSearchRepository
+from config.pagination import decode_search_after, encode_search_after
 
 
 @pytest.fixture
@@ -106,3 +110,156 @@ def test_get_queryset(queries, mock_repository, mocker):
     mock_repository.get_queryset.assert_called_once()
     log_spy.assert_called_once_with("[BookQueries] get_queryset() called")
     assert result == fake_queryset
+
+
+def test_get_page_with_next_cursor(queries, mock_repository, make_book):
+    mock_repository.get_page.return_value = [make_book(id=1), make_book(id=2), make_book(id=3)]
+
+    page = queries.get_page(None, 2)
+
+    mock_repository.get_page.assert_called_once_with(None, 3, None)
+    assert [book.id for book in page.items] == [1, 2]
+    assert page.next_cursor is not None
+
+    queries.get_page(page.next_cursor, 2)
+    mock_repository.get_page.assert_called_with(2, 3, None)
+
+
+def test_get_page_last_page(queries, mock_repository, make_book):
+    mock_repository.get_page.return_value = [make_book(id=1)]
+
+    page = queries.get_page(None, 2)
+
+    assert len(page.items) == 1
+    assert page.next_cursor is None
+
+
+def test_get_page_invalid_cursor(queries, mock_repository):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        queries.get_page("not-a-cursor", 2)
+
+    mock_repository.get_page.assert_not_called()
+
+
+def test_iterate_all(queries, mock_repository, make_book):
+    mock_repository.iterate_all.return_value = iter([make_book()])
+
+    result = list(queries.iterate_all(500))
+
+    mock_repository.iterate_all.assert_called_once_with(500)
+    assert result[0].title == "Clean Code"
+
+
+@pytest.fixture
+def mock_search_repository(mocker):
+    repo = mocker.patch("book.application.queries.book_queries.BookSearchRepository", autospec=True)
+    repo.HIT_FIELDS = BookSearchRepository.HIT_FIELDS
+    repo.to_document.side_effect = BookSearchRepository.to_document
+    return repo.return_value
+
+
+@pytest.fixture
+def search_queries(mock_repository, mock_search_repository):
+    return BookQueries()
+
+
+@pytest.fixture(autouse=True)
+def facet_size(settings):
+    settings.BOOK_FACET_SIZE = 20
+
+
+def test_search_uses_elasticsearch(search_queries, mock_search_repository, mock_repository):
+    mock_search_repository.search.return_value = (12, [{"id": 1, "title": "Clean Code"}], [1.2, 1], {})
+
+    result = search_queries.search("clean", {"language": "English"}, size=1, page=3)
+
+    mock_search_repository.search.assert_called_once_with("clean", {"language": "English"}, 1, 2, None, (), 20)
+    mock_repository.search_trigram.assert_not_called()
+    assert result.source == "elasticsearch"
+    assert result.total == 12
+    assert decode_search_after(result.next_cursor) == [1.2, 1]
+
+
+def test_search_passes_search_after(search_queries, mock_search_repository):
+    mock_search_repository.search.return_value = (0, [], None, {})
+
+    result = search_queries.search("clean", {}, size=10, cursor=encode_search_after([0.5, 9]))
+
+    assert mock_search_repository.search.call_args.args[4] == [0.5, 9]
+    assert result.next_cursor is None
+
+
+def test_search_falls_back_to_trigram(search_queries, mock_search_repository, mock_repository, make_book, mocker):
+    mock_search_repository.search.side_effect = ConnectionError("ES down")
+    mock_repository.search_trigram.return_value = (1, [make_book()], {})
+    log_spy = mocker.spy(search_queries.logger, "warning")
+
+    result = search_queries.search("clean", {}, size=10, page=2)
+
+    mock_repository.search_trigram.assert_called_once_with("clean", {}, 10, 10, (), 20)
+    assert result.source == "postgres"
+    assert result.hits[0]["title"] == "Clean Code"
+    assert result.hits[0]["highlight"] == {}
+    assert "synopsis" not in result.hits[0]
+    assert log_spy.call_count == 1
+
+
+def test_search_does_not_hide_bad_requests(search_queries, mock_search_repository, mock_repository, mocker):
+    mock_search_repository.search.side_effect = ApiError("bad query", meta=mocker.Mock(status=400), body={})
+
+    with pytest.raises(ApiError):
+        search_queries.search("clean", {}, size=10)
+
+    mock_repository.search_trigram.assert_not_called()
+
+
+def test_search_trigram(queries, mock_repository, make_book):
+    mock_repository.search_trigram.return_value = (1, [make_book()], {})
+
+    result = queries.search_trigram("clean", 50)
+
+    mock_repository.search_trigram.assert_called_once_with("clean", {}, 50, fields=None)
+    assert result[0].title == "Clean Code"
+
+
+def test_suggest_uses_elasticsearch_and_caches(search_queries, mock_search_repository, mock_repository):
+    mock_search_repository.suggest.return_value = (["Clean Code"], ["Robert C. Martin"])
+
+    first = search_queries.suggest("  Clean   co", 5)
+    second = search_queries.suggest("clean co", 5)
+
+    assert first == second
+    assert (first.titles, first.authors, first.source) == (["Clean Code"], ["Robert C. Martin"], "elasticsearch")
+    mock_search_repository.suggest.assert_called_once_with("Clean co", 5)
+    mock_repository.suggest_prefix.assert_not_called()
+
+
+def test_suggest_falls_back_to_prefix_index(search_queries, mock_search_repository, mock_repository):
+    mock_search_repository.suggest.side_effect = ConnectionError("ES down")
+    mock_repository.suggest_prefix.return_value = (["Clean Code"], [])
+
+    result = search_queries.suggest("clean", 5)
+
+    mock_repository.suggest_prefix.assert_called_once_with("clean", 5)
+    assert (result.titles, result.source) == (["Clean Code"], "postgres")
+
+
+def test_search_returns_facets(search_queries, mock_search_repository):
+    facets = {"language": [{"value": "English", "count": 3}]}
+    mock_search_repository.search.return_value = (3, [], None, facets)
+
+    result = search_queries.search("", {}, size=10, facets=["language"])
+
+    assert mock_search_repository.search.call_args.args[5:] == (["language"], 20)
+    assert result.facets == facets
+
+
+def test_search_fallback_returns_facets(search_queries, mock_search_repository, mock_repository):
+    facets = {"category": [{"value": "Software", "count": 1}]}
+    mock_search_repository.search.side_effect = ConnectionError("ES down")
+    mock_repository.search_trigram.return_value = (0, [], facets)
+
+    result = search_queries.search("clean", {}, size=10, facets=["category"])
+
+    mock_repository.search_trigram.assert_called_once_with("clean", {}, 10, 0, ["category"], 20)
+    assert (result.source, result.facets) == ("postgres", facets)
@@ -1,8 +1,9 @@
 import logging
 import dramatiq
+from django.db import transaction
 
+from book.application.task.flush_book_index_task import queue_book_index
 from book.domain.book_entities import Book
-from book.infrastructure.repository.book_search_repository import BookSearchRepository
 from book.infrastructure.repository.book_repository import BookRepository
 
 logger = logging.getLogger(__name__)
@@ -14,22 +15,13 @@ def create_book_task(book_data: dict):
     try:
         book = Book(**book_data)
         repository = BookRepository()
-        created = repository.create(book)
+        with transaction.atomic():
+            created = repository.create(book)
+            if not created:
+                logger.error("[BookWorker] Book creation failed, skipping Elasticsearch indexing.")
+                return
+            queue_book_index([(created.id, created.isbn, "index")])
 
-        if not created:
-            logger.error("[BookWorker] Book creation failed, skipping Elasticsearch indexing.")
-            return
-
-        logger.info(f"[BookWorker] Book created with ID {created.id}")
-
-        BookSearchRepository().index_book({
-            "isbn": created.isbn,
-            "title": created.title,
-            "synopsis": created.synopsis,
-            "authors": [a.name for a in created.authors],
-            "categories": [c.name for c in created.categories],
-            "publication_date": created.publication_date,
-        })
         logger.info(f"[BookWorker] Book created with ID {created.id}")
 
     except Exception:
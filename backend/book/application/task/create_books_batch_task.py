@@ -0,0 +1,33 @@
+import logging
+import dramatiq
+from django.db import transaction
+
+from book.application.task.flush_book_index_task import queue_book_index
+from book.domain.book_entities import Book
+from book.infrastructure.repository.book_bulk_job_repository import BookBulkJobRepository
+from book.infrastructure.repository.book_repository import BookRepository
+
+logger = logging.getLogger(__name__)
+
+@dramatiq.actor(queue_name="books_bulk", max_retries=3, retry_when=lambda e: True)
+def create_books_batch_task(books_data: list[dict], job_id: str | None = None, batch: int = 0,
+                            indexes: list[int] | None = None):
+    logger.info(f"[BookBatchWorker] Processing batch of {len(books_data)} books")
+
+    try:
+        books = [Book(**data) for data in books_data]
+        with transaction.atomic():
+            results = BookRepository().bulk_create(books)
+            created = [result.book for result in results if result.status == "created"]
+            if created:
+                queue_book_index([(book.id, book.isbn, "index") for book in created])
+            if job_id is not None:
+                BookBulkJobRepository().record_batch(job_id, batch, indexes or list(range(len(books))), results)
+    except Exception:
+        logger.exception("[BookBatchWorker] Failed to create book batch")
+        raise
+
+    for result in results:
+        if result.status != "created":
+            logger.warning(f"[BookBatchWorker] Book {result.isbn} {result.status}: {result.error}")
+    logger.info(f"[BookBatchWorker] Created {len(created)} of {len(books_data)} books")
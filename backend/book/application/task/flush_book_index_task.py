@@ -0,0 +1,73 @@
+import logging
+from datetime import datetime
+
+import dramatiq
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from book.infrastructure.repository.book_index_outbox_repository import BookIndexOutboxRepository
+
+logger = logging.getLogger(__name__)
+
+FLUSH_SCHEDULED_KEY = "book-index:flush-scheduled"
+RECOVERY_SCHEDULED_KEY = "book-index:flush-recovery"
+
+
+@dramatiq.actor(queue_name="books_index", max_retries=3)
+def flush_book_index_task():
+    repository = BookIndexOutboxRepository()
+    try:
+        result = repository.flush(
+            settings.BOOK_INDEX_BATCH_SIZE, settings.BOOK_INDEX_MAX_ATTEMPTS, settings.BOOK_INDEX_CLAIM_TTL_MS,
+            settings.BOOK_INDEX_RETRY_DELAY_MS, settings.BOOK_INDEX_RETRY_MAX_DELAY_MS,
+        )
+    except Exception:
+        # Dramatiq drops the message once max_retries run out; keep a later flush queued so
+        # the pending rows are not stranded until the next write.
+        delay_ms = settings.BOOK_INDEX_RETRY_MAX_DELAY_MS
+        if cache.add(RECOVERY_SCHEDULED_KEY, True, timeout=delay_ms / 1000):
+            flush_book_index_task.send_with_options(delay=delay_ms)
+        raise
+
+    if result.claimed:
+        logger.info(
+            f"[BookIndexWorker] Flushed {result.claimed} queued mutations: {result.applied} applied, "
+            f"{result.failed} failed ({result.unavailable} cluster unavailable), lag {result.lag_seconds:.3f}s"
+        )
+
+    if result.has_more:
+        flush_book_index_task.send()
+    else:
+        schedule_due_book_index_flush(repository.next_due())
+
+
+def queue_book_index(entries: list[tuple[int, str, str]]) -> None:
+    """Record ``(book_id, isbn, action)`` index mutations and make sure a flush is coming.
+
+    Call it inside the transaction that writes the books: the outbox rows commit or roll back
+    with them, and the flush is only sent once they are visible to the worker.
+    """
+    if not entries:
+        return
+    BookIndexOutboxRepository().enqueue(entries)
+    transaction.on_commit(schedule_book_index_flush)
+
+
+def schedule_book_index_flush() -> None:
+    # One delayed flush per half window per process; mutations committed before the marker
+    # expires are always older than the flush it scheduled.
+    window_ms = settings.BOOK_INDEX_FLUSH_WINDOW_MS
+    if cache.add(FLUSH_SCHEDULED_KEY, True, timeout=window_ms / 2000):
+        flush_book_index_task.send_with_options(delay=window_ms)
+
+
+def schedule_due_book_index_flush(due: datetime | None) -> None:
+    """Send a flush for when the earliest backed-off row becomes claimable again."""
+    if due is None:
+        return
+    delay_ms = max(int((due - timezone.now()).total_seconds() * 1000), settings.BOOK_INDEX_FLUSH_WINDOW_MS)
+    # Every flush that sees the same earliest row converges on a single delayed message.
+    if cache.add(f"book-index:flush-at:{due.timestamp():.0f}", True, timeout=delay_ms / 1000 + 1):
+        flush_book_index_task.send_with_options(delay=delay_ms)
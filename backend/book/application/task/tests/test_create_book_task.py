@@ -2,6 +2,11 @@ import pytest
 from book.application.task import create_book_task
 
 
+@pytest.fixture(autouse=True)
+def mock_atomic(mocker):
+    return mocker.patch("book.application.task.create_book_task.transaction.atomic")
+
+
 @pytest.fixture
 def valid_book_data():
     return {
@@ -21,7 +26,7 @@ def valid_book_data():
 
 def test_create_book_success(mocker, valid_book_data):
     mock_repo = mocker.patch("book.application.task.create_book_task.BookRepository")
-    mock_index = mocker.patch("book.application.task.create_book_task.BookSearchRepository")
+    mock_queue = mocker.patch("book.application.task.create_book_task.queue_book_index")
 
     created_book = mocker.Mock()
     created_book.id = 1
@@ -38,7 +43,7 @@ def test_create_book_success(mocker, valid_book_data):
     create_book_task.create_book_task.fn(valid_book_data)
 
     mock_repo.return_value.create.assert_called_once()
-    mock_index.return_value.index_book.assert_called_once()
+    mock_queue.assert_called_once_with([(1, "1234567890123", "index")])
     assert any("[BookWorker] Book created with ID 1" in str(c.args[0]) for c in log_spy.call_args_list)
     assert any("[BookWorker] Processing new book:" in str(c.args[0]) for c in log_spy.call_args_list)
 
@@ -46,14 +51,14 @@ def test_create_book_success(mocker, valid_book_data):
 def test_create_book_fails_to_create(mocker, valid_book_data):
     mock_repo = mocker.patch("book.application.task.create_book_task.BookRepository")
     mock_repo.return_value.create.return_value = None
-    mock_index = mocker.patch("book.application.task.create_book_task.BookSearchRepository")
+    mock_queue = mocker.patch("book.application.task.create_book_task.queue_book_index")
 
     log_spy = mocker.spy(create_book_task.logger, "error")
 
     create_book_task.create_book_task.fn(valid_book_data)
 
     mock_repo.return_value.create.assert_called_once()
-    mock_index.return_value.index_book.assert_not_called()
+    mock_queue.assert_not_called()
     log_spy.assert_called_once_with("[BookWorker] Book creation failed, skipping Elasticsearch indexing.")
 
 
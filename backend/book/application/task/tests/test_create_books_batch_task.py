@@ -0,0 +1,102 @@
+import pytest
+
+from book.application.task import create_books_batch_task
+from book.domain.book_entities import Book, BookBulkResult
+
+
+@pytest.fixture(autouse=True)
+def mock_atomic(mocker):
+    return mocker.patch("book.application.task.create_books_batch_task.transaction.atomic")
+
+
+@pytest.fixture
+def valid_book_data():
+    return {
+        "id": None,
+        "title": "Clean Code",
+        "isbn": "1234567890123",
+        "publisher": "Prentice Hall",
+        "edition": "1st",
+        "language": "English",
+        "book_type": "Technical",
+        "synopsis": "A book about writing clean code.",
+        "publication_date": "2008-08-01",
+        "authors": [],
+        "categories": []
+    }
+
+
+def test_batch_creates_and_queues_indexing(mocker, valid_book_data):
+    mock_repo = mocker.patch("book.application.task.create_books_batch_task.BookRepository")
+    mock_queue = mocker.patch("book.application.task.create_books_batch_task.queue_book_index")
+    created_book = Book(**{**valid_book_data, "id": 7})
+    mock_repo.return_value.bulk_create.return_value = [
+        BookBulkResult(isbn="1234567890123", status="created", id=7, book=created_book),
+        BookBulkResult(isbn="999", status="skipped", error="ISBN already exists"),
+    ]
+    log_spy = mocker.spy(create_books_batch_task.logger, "warning")
+
+    create_books_batch_task.create_books_batch_task.fn([valid_book_data, {**valid_book_data, "isbn": "999"}])
+
+    books = mock_repo.return_value.bulk_create.call_args.args[0]
+    assert [book.isbn for book in books] == ["1234567890123", "999"]
+    mock_queue.assert_called_once_with([(7, "1234567890123", "index")])
+    log_spy.assert_called_once_with("[BookBatchWorker] Book 999 skipped: ISBN already exists")
+
+
+def test_batch_nothing_created_skips_indexing(mocker, valid_book_data):
+    mock_repo = mocker.patch("book.application.task.create_books_batch_task.BookRepository")
+    mock_queue = mocker.patch("book.application.task.create_books_batch_task.queue_book_index")
+    mock_repo.return_value.bulk_create.return_value = [
+        BookBulkResult(isbn="1234567890123", status="skipped", error="ISBN already exists"),
+    ]
+
+    create_books_batch_task.create_books_batch_task.fn([valid_book_data])
+
+    mock_queue.assert_not_called()
+
+
+def test_batch_queue_failure_rolls_back_and_raises(mocker, valid_book_data, mock_atomic):
+    mock_repo = mocker.patch("book.application.task.create_books_batch_task.BookRepository")
+    mock_queue = mocker.patch("book.application.task.create_books_batch_task.queue_book_index")
+    mock_repo.return_value.bulk_create.return_value = [
+        BookBulkResult(isbn="1234567890123", status="created", id=7, book=Book(**valid_book_data)),
+    ]
+    mock_queue.side_effect = Exception("DB error")
+
+    with pytest.raises(Exception, match="DB error"):
+        create_books_batch_task.create_books_batch_task.fn([valid_book_data])
+
+    # The books and their outbox rows share the transaction, so the failure leaves neither behind.
+    exc_type = mock_atomic.return_value.__exit__.call_args.args[0]
+    assert exc_type is Exception
+
+
+def test_batch_database_failure_raises(mocker, valid_book_data):
+    mock_repo = mocker.patch("book.application.task.create_books_batch_task.BookRepository")
+    mock_repo.return_value.bulk_create.side_effect = Exception("DB error")
+
+    with pytest.raises(Exception, match="DB error"):
+        create_books_batch_task.create_books_batch_task.fn([valid_book_data])
+
+
+def test_batch_records_results_under_its_job(mocker, valid_book_data):
+    mock_repo = mocker.patch("book.application.task.create_books_batch_task.BookRepository")
+    mocker.patch("book.application.task.create_books_batch_task.queue_book_index")
+    mock_jobs = mocker.patch("book.application.task.create_books_batch_task.BookBulkJobRepository").return_value
+    results = [BookBulkResult(isbn="1234567890123", status="failed", error="Unknown authors [9] or categories []")]
+    mock_repo.return_value.bulk_create.return_value = results
+
+    create_books_batch_task.create_books_batch_task.fn([valid_book_data], "job-1", 2, [7])
+
+    mock_jobs.record_batch.assert_called_once_with("job-1", 2, [7], results)
+
+
+def test_batch_without_job_records_nothing(mocker, valid_book_data):
+    mock_repo = mocker.patch("book.application.task.create_books_batch_task.BookRepository")
+    mock_jobs = mocker.patch("book.application.task.create_books_batch_task.BookBulkJobRepository")
+    mock_repo.return_value.bulk_create.return_value = []
+
+    create_books_batch_task.create_books_batch_task.fn([valid_book_data])
+
+    mock_jobs.assert_not_called()
@@ -0,0 +1,99 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from book.application.task import flush_book_index_task as module
+from book.domain.book_entities import BookIndexFlushResult
+
+
+@pytest.fixture
+def mock_outbox(mocker):
+    return mocker.patch("book.application.task.flush_book_index_task.BookIndexOutboxRepository")
+
+
+def test_queue_book_index_schedules_one_flush_per_window(mocker, mock_outbox, settings):
+    settings.BOOK_INDEX_FLUSH_WINDOW_MS = 500
+    mock_send = mocker.patch.object(module.flush_book_index_task, "send_with_options")
+    mock_on_commit = mocker.patch("book.application.task.flush_book_index_task.transaction.on_commit")
+
+    module.queue_book_index([(1, "111", "index")])
+    module.queue_book_index([(2, "222", "index")])
+
+    assert mock_outbox.return_value.enqueue.call_count == 2
+    # Nothing is sent until the transaction holding the outbox rows commits.
+    mock_send.assert_not_called()
+    for call in mock_on_commit.call_args_list:
+        call.args[0]()
+    mock_send.assert_called_once_with(delay=500)
+    assert cache.get(module.FLUSH_SCHEDULED_KEY) is True
+
+
+def test_queue_book_index_ignores_empty_batches(mocker, mock_outbox):
+    mock_send = mocker.patch.object(module.flush_book_index_task, "send_with_options")
+
+    module.queue_book_index([])
+
+    mock_outbox.return_value.enqueue.assert_not_called()
+    mock_send.assert_not_called()
+
+
+def test_flush_resends_when_batch_was_full(mocker, mock_outbox):
+    mock_outbox.return_value.flush.return_value = BookIndexFlushResult(claimed=500, applied=500, has_more=True)
+    mock_send = mocker.patch.object(module.flush_book_index_task, "send")
+
+    module.flush_book_index_task.fn()
+
+    mock_send.assert_called_once_with()
+
+
+def test_flush_schedules_next_flush_when_backed_off_rows_are_due(mocker, mock_outbox, settings):
+    settings.BOOK_INDEX_FLUSH_WINDOW_MS = 500
+    mock_outbox.return_value.flush.return_value = BookIndexFlushResult(claimed=3, applied=1, failed=2)
+    mock_outbox.return_value.next_due.return_value = timezone.now() + timedelta(seconds=20)
+    mock_send = mocker.patch.object(module.flush_book_index_task, "send")
+    mock_send_delayed = mocker.patch.object(module.flush_book_index_task, "send_with_options")
+
+    module.flush_book_index_task.fn()
+    module.flush_book_index_task.fn()
+
+    # Both runs see the same earliest row and converge on one delayed flush.
+    mock_send_delayed.assert_called_once()
+    assert 19000 < mock_send_delayed.call_args.kwargs["delay"] <= 20000
+    mock_send.assert_not_called()
+
+
+def test_flush_waits_at_least_one_window_for_overdue_rows(mocker, mock_outbox, settings):
+    settings.BOOK_INDEX_FLUSH_WINDOW_MS = 500
+    mock_outbox.return_value.flush.return_value = BookIndexFlushResult()
+    mock_outbox.return_value.next_due.return_value = timezone.now() - timedelta(seconds=5)
+    mock_send_delayed = mocker.patch.object(module.flush_book_index_task, "send_with_options")
+
+    module.flush_book_index_task.fn()
+
+    mock_send_delayed.assert_called_once_with(delay=500)
+
+
+def test_flush_stops_when_only_dead_letters_remain(mocker, mock_outbox):
+    mock_outbox.return_value.flush.return_value = BookIndexFlushResult(claimed=1, failed=1, dead_lettered=1)
+    mock_outbox.return_value.next_due.return_value = None
+    mock_send = mocker.patch.object(module.flush_book_index_task, "send")
+    mock_send_delayed = mocker.patch.object(module.flush_book_index_task, "send_with_options")
+
+    module.flush_book_index_task.fn()
+
+    mock_send.assert_not_called()
+    mock_send_delayed.assert_not_called()
+
+
+def test_flush_failure_keeps_a_recovery_flush_scheduled(mocker, mock_outbox, settings):
+    settings.BOOK_INDEX_RETRY_MAX_DELAY_MS = 300000
+    mock_outbox.return_value.flush.side_effect = RuntimeError("database unavailable")
+    mock_send_delayed = mocker.patch.object(module.flush_book_index_task, "send_with_options")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            module.flush_book_index_task.fn()
+
+    mock_send_delayed.assert_called_once_with(delay=300000)
@@ -5,4 +5,4 @@ class BookConfig(AppConfig):
     name = 'book'
 
     def ready(self):
-        from book.application.task import create_book_task
+        from book.application.task import create_book_task, create_books_batch_task, flush_book_index_task
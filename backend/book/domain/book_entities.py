@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
@@ -6,6 +6,12 @@ from author.domain.author_entities import Author
 from book_category.domain.book_category_entities import BookCategory
 
 
+BOOK_FIELDS = frozenset({
+    "id", "title", "isbn", "publisher", "edition", "language", "book_type", "synopsis", "publication_date",
+    "authors", "categories",
+})
+
+
 @dataclass
 class Book:
     title: str
@@ -19,3 +25,56 @@ class Book:
     authors: list[Author]
     categories: list[BookCategory]
     id: Optional[int] = None
+
+
+@dataclass
+class BookPage:
+    items: list[Book]
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class BookBulkResult:
+    isbn: str
+    status: str
+    id: Optional[int] = None
+    error: Optional[str] = None
+    book: Optional[Book] = None
+
+
+@dataclass
+class BookBulkJob:
+    id: str
+    status: str
+    total: int
+    batches: int
+    batches_done: int = 0
+    results: list[dict] = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class BookSearchResult:
+    total: int
+    hits: list[dict]
+    source: str
+    next_cursor: Optional[str] = None
+    facets: dict[str, list[dict]] = field(default_factory=dict)
+
+
+@dataclass
+class BookSuggestions:
+    titles: list[str]
+    authors: list[str]
+    source: str
+
+
+@dataclass
+class BookIndexFlushResult:
+    claimed: int = 0
+    applied: int = 0
+    failed: int = 0
+    dead_lettered: int = 0
+    unavailable: int = 0
+    lag_seconds: float = 0.0
+    has_more: bool = False
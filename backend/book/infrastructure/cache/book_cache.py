@@ -0,0 +1,83 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from book.infrastructure.repository.book_model import BookModel
+from config.conditional import ResourceVersion
+
+
+class BookCache:
+    """Book payloads and the validators they were built from, in the shared ``books`` cache.
+
+    Each entry keeps the payload's ResourceVersion next to it, and the version of the whole
+    catalogue is kept under one more key, so conditional GETs validate without a query. Any
+    invalidation drops the catalogue version as well, since every book list embeds the book.
+    """
+
+    KEY_PREFIX = "book"
+    LIST_VERSION_KEY = "book:list-version"
+
+    def __init__(self):
+        self.cache = caches[settings.BOOK_CACHE_ALIAS]
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, book_id: int) -> tuple[dict, ResourceVersion] | None:
+        try:
+            entry = self.cache.get(self._key(book_id))
+        except Exception:
+            self.logger.exception(f"[BookCache] Failed to read book {book_id} from cache")
+            return None
+        self.logger.info(f"[BookCache] Book {book_id} cache {'hit' if entry is not None else 'miss'}")
+        return entry
+
+    def set(self, book_id: int, payload: dict, version: ResourceVersion) -> None:
+        try:
+            self.cache.set(self._key(book_id), (payload, version))
+        except Exception:
+            self.logger.exception(f"[BookCache] Failed to cache book {book_id}")
+
+    def get_list_version(self) -> ResourceVersion | None:
+        try:
+            return self.cache.get(self.LIST_VERSION_KEY)
+        except Exception:
+            self.logger.exception("[BookCache] Failed to read the book list version from cache")
+            return None
+
+    def set_list_version(self, version: ResourceVersion) -> None:
+        try:
+            self.cache.set(self.LIST_VERSION_KEY, version)
+        except Exception:
+            self.logger.exception("[BookCache] Failed to cache the book list version")
+
+    def invalidate(self, *book_ids: int) -> None:
+        if not book_ids:
+            return
+        self.logger.info(f"[BookCache] Invalidating {len(book_ids)} cached books")
+        keys = [self._key(book_id) for book_id in book_ids] + [self.LIST_VERSION_KEY]
+        self._delete(keys)
+        if transaction.get_connection().in_atomic_block:
+            # Readers may refill the keys from the pre-commit rows until the write commits.
+            transaction.on_commit(lambda: self._delete(keys))
+
+    def book_ids_for_author(self, author_id: int) -> list[int]:
+        return list(
+            BookModel.authors.through.objects.filter(authormodel_id=author_id).values_list("bookmodel_id", flat=True)
+        )
+
+    def book_ids_for_category(self, category_id: int) -> list[int]:
+        return list(
+            BookModel.categories.through.objects.filter(
+                bookcategorymodel_id=category_id
+            ).values_list("bookmodel_id", flat=True)
+        )
+
+    def _delete(self, keys: list[str]) -> None:
+        try:
+            self.cache.delete_many(keys)
+        except Exception:
+            self.logger.exception(f"[BookCache] Failed to invalidate {keys}")
+
+    def _key(self, book_id: int) -> str:
+        return f"{self.KEY_PREFIX}:{book_id}"
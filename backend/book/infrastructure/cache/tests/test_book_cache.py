@@ -0,0 +1,92 @@
+import pytest
+
+from book.infrastructure.cache.book_cache import BookCache
+from config.conditional import ResourceVersion
+
+VERSION = ResourceVersion(last_modified=None, count=1)
+
+
+@pytest.fixture
+def book_cache(shared_book_cache):
+    return BookCache()
+
+
+def test_get_miss_then_hit(book_cache):
+    assert book_cache.get(1) is None
+
+    book_cache.set(1, {"id": 1, "title": "Clean Code"}, VERSION)
+
+    assert book_cache.get(1) == ({"id": 1, "title": "Clean Code"}, VERSION)
+
+
+def test_invalidate(book_cache):
+    book_cache.set(1, {"id": 1}, VERSION)
+    book_cache.set(2, {"id": 2}, VERSION)
+    book_cache.set_list_version(VERSION)
+
+    book_cache.invalidate(1, 2)
+
+    assert book_cache.get(1) is None
+    assert book_cache.get(2) is None
+    assert book_cache.get_list_version() is None
+
+
+def test_invalidate_again_on_commit(book_cache, mocker):
+    mocker.patch("book.infrastructure.cache.book_cache.transaction.get_connection").return_value.in_atomic_block = True
+    mock_on_commit = mocker.patch("book.infrastructure.cache.book_cache.transaction.on_commit")
+
+    book_cache.invalidate(1)
+    # Refilled from pre-commit rows by a concurrent reader.
+    book_cache.set(1, {"id": 1}, VERSION)
+    mock_on_commit.call_args.args[0]()
+
+    assert book_cache.get(1) is None
+
+
+def test_invalidate_nothing(book_cache, mocker):
+    mock_delete = mocker.patch.object(book_cache.cache, "delete_many")
+
+    book_cache.invalidate()
+
+    mock_delete.assert_not_called()
+
+
+def test_backend_errors_are_not_raised(book_cache, mocker):
+    mocker.patch.object(book_cache.cache, "get", side_effect=Exception("redis down"))
+    mocker.patch.object(book_cache.cache, "set", side_effect=Exception("redis down"))
+    mocker.patch.object(book_cache.cache, "delete_many", side_effect=Exception("redis down"))
+    log_spy = mocker.spy(book_cache.logger, "exception")
+
+    assert book_cache.get(1) is None
+    book_cache.set(1, {"id": 1}, VERSION)
+    book_cache.invalidate(1)
+
+    assert log_spy.call_count == 3
+
+
+def test_book_ids_for_author(book_cache, mocker):
+    mock_filter = mocker.patch(
+        "book.infrastructure.cache.book_cache.BookModel.authors.through.objects.filter"
+    )
+    mock_filter.return_value.values_list.return_value = [1, 2]
+
+    assert book_cache.book_ids_for_author(7) == [1, 2]
+    mock_filter.assert_called_once_with(authormodel_id=7)
+
+
+def test_book_ids_for_category(book_cache, mocker):
+    mock_filter = mocker.patch(
+        "book.infrastructure.cache.book_cache.BookModel.categories.through.objects.filter"
+    )
+    mock_filter.return_value.values_list.return_value = [3]
+
+    assert book_cache.book_ids_for_category(9) == [3]
+    mock_filter.assert_called_once_with(bookcategorymodel_id=9)
+
+
+def test_disabled_without_shared_backend():
+    book_cache = BookCache()
+
+    book_cache.set(1, {"id": 1}, VERSION)
+
+    assert book_cache.get(1) is None
@@ -0,0 +1,19 @@
+import uuid
+
+from django.db import models
+
+
+class BookBulkJobModel(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    total = models.PositiveIntegerField()
+    batches = models.PositiveIntegerField()
+    # Validation errors from the request, and per-item outcomes keyed by batch number, so a
+    # redelivered batch overwrites its own entry instead of counting twice.
+    errors = models.JSONField(default=list)
+    results = models.JSONField(default=dict)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.id} ({len(self.results)}/{self.batches} batches)"
@@ -0,0 +1,57 @@
+import logging
+from dataclasses import asdict
+
+from book.domain.book_entities import BookBulkJob, BookBulkResult
+from .book_bulk_job_model import BookBulkJobModel
+
+
+class BookBulkJobRepository:
+    """Per-item outcomes of a bulk book import, recorded by the batch workers as they finish."""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def create(self, total: int, batches: int, errors: list[dict]) -> BookBulkJob:
+        self.logger.info(f"[BookBulkJobRepository] Creating bulk job for {total} books in {batches} batches")
+        try:
+            obj = BookBulkJobModel.objects.create(total=total, batches=batches, errors=errors)
+        except Exception:
+            self.logger.exception("[BookBulkJobRepository] Failed to create bulk job")
+            raise
+        return self._to_entity(obj)
+
+    def record_batch(self, job_id: str, batch: int, indexes: list[int], results: list[BookBulkResult]) -> None:
+        """Stores one batch's outcomes; call inside the transaction that created its books."""
+        self.logger.info(f"[BookBulkJobRepository] Recording batch {batch} of job {job_id}")
+        items = [
+            {"index": index, **{k: v for k, v in asdict(result).items() if k != "book"}}
+            for index, result in zip(indexes, results)
+        ]
+        try:
+            obj = BookBulkJobModel.objects.select_for_update().get(id=job_id)
+        except BookBulkJobModel.DoesNotExist:
+            self.logger.warning(f"[BookBulkJobRepository] Bulk job {job_id} not found, batch {batch} not recorded")
+            return
+        obj.results[str(batch)] = items
+        obj.save(update_fields=["results", "updated_at"])
+
+    def get(self, job_id: str) -> BookBulkJob | None:
+        self.logger.info(f"[BookBulkJobRepository] Fetching bulk job {job_id}")
+        try:
+            return self._to_entity(BookBulkJobModel.objects.get(id=job_id))
+        except BookBulkJobModel.DoesNotExist:
+            self.logger.warning(f"[BookBulkJobRepository] Bulk job {job_id} not found")
+            return None
+
+    @staticmethod
+    def _to_entity(obj: BookBulkJobModel) -> BookBulkJob:
+        batches_done = len(obj.results)
+        return BookBulkJob(
+            id=str(obj.id),
+            status="done" if batches_done >= obj.batches else "pending",
+            total=obj.total,
+            batches=obj.batches,
+            batches_done=batches_done,
+            results=sorted((item for items in obj.results.values() for item in items), key=lambda item: item["index"]),
+            errors=obj.errors,
+        )
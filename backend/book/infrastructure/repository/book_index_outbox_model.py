@@ -0,0 +1,32 @@
+from django.db import models
+from django.db.models import Q
+
+
+class BookIndexOutboxModel(models.Model):
+    ACTIONS = (
+        ('index', 'Index'),
+        ('delete', 'Delete'),
+    )
+
+    book_id = models.BigIntegerField()
+    isbn = models.CharField(max_length=20)
+    action = models.CharField(max_length=10, choices=ACTIONS)
+    # Failures caused by the document count towards dead-lettering; every failure, including
+    # cluster outages, counts towards the retry backoff.
+    attempts = models.PositiveIntegerField(default=0)
+    retries = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    dead = models.BooleanField(default=False)
+    # Lease held by the flush currently sending this row; expired leases are claimable again.
+    claimed_until = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.action} {self.isbn}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["id"], condition=Q(dead=False), name="book_index_outbox_pending_idx"),
+        ]
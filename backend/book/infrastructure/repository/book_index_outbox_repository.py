@@ -0,0 +1,168 @@
+import logging
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Min, Q
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from book.domain.book_entities import BookIndexFlushResult
+from .book_index_outbox_model import BookIndexOutboxModel
+from .book_repository import BookRepository
+from .book_search_repository import BookSearchRepository
+
+
+class BookIndexOutboxRepository:
+    """Durable queue of pending search-index mutations, drained in batches by the flush worker.
+
+    Rows are keyed by document id (ISBN); when a batch holds several mutations for the same
+    document only the latest one is sent to Elasticsearch. A flush claims its batch with a
+    short-lived lease and commits before calling Elasticsearch, so no transaction or row lock
+    is held across the bulk request. Failed rows are retried with exponential backoff.
+    """
+
+    def __init__(self):
+        self.book_repository = BookRepository()
+        self.search_repository = BookSearchRepository()
+        self.logger = logging.getLogger(__name__)
+
+    def enqueue(self, entries: list[tuple[int, str, str]]) -> None:
+        self.logger.info(f"[BookIndexOutboxRepository] Enqueuing {len(entries)} index mutations")
+        try:
+            BookIndexOutboxModel.objects.bulk_create([
+                BookIndexOutboxModel(book_id=book_id, isbn=isbn, action=action)
+                for book_id, isbn, action in entries
+            ])
+        except Exception:
+            self.logger.exception("[BookIndexOutboxRepository] Failed to enqueue index mutations")
+            raise
+
+    def flush(self, batch_size: int, max_attempts: int, claim_ttl_ms: int, retry_delay_ms: int,
+              retry_max_delay_ms: int) -> BookIndexFlushResult:
+        rows, lease = self._claim(batch_size, claim_ttl_ms)
+        if not rows:
+            return BookIndexFlushResult()
+
+        latest = {row.isbn: row for row in rows}
+        actions = self._build_actions(latest)
+        failures = self._apply(actions)
+
+        now = timezone.now()
+        done = [row.id for row in rows if row.isbn not in failures]
+        failed_rows = [row for row in rows if row.isbn in failures]
+        for row in failed_rows:
+            error, unavailable = failures[row.isbn]
+            row.retries += 1
+            # An unreachable or overloaded cluster says nothing about the document; only
+            # document-level failures move it towards the dead letter.
+            if not unavailable:
+                row.attempts += 1
+            row.last_error = error[:2000]
+            row.dead = row.attempts >= max_attempts
+            row.next_attempt_at = now + timedelta(
+                milliseconds=min(retry_delay_ms * 2 ** (row.retries - 1), retry_max_delay_ms)
+            )
+            row.claimed_until = None
+        with transaction.atomic():
+            # A row whose lease ran out may have been re-claimed meanwhile; that flush owns it now.
+            BookIndexOutboxModel.objects.filter(id__in=done, claimed_until=lease).delete()
+            BookIndexOutboxModel.objects.bulk_update(
+                failed_rows, ["attempts", "retries", "next_attempt_at", "last_error", "dead", "claimed_until"]
+            )
+
+        result = BookIndexFlushResult(
+            claimed=len(rows),
+            applied=len(actions) - len(failures),
+            failed=len(failures),
+            dead_lettered=len({row.isbn for row in failed_rows if row.dead}),
+            unavailable=sum(1 for _, unavailable in failures.values() if unavailable),
+            lag_seconds=(now - rows[0].created_at).total_seconds(),
+            has_more=len(rows) == batch_size,
+        )
+        if result.dead_lettered:
+            self.logger.error(
+                f"[BookIndexOutboxRepository] Dead-lettered {result.dead_lettered} documents after {max_attempts} attempts"
+            )
+        return result
+
+    def next_due(self) -> datetime | None:
+        """When the earliest pending row becomes claimable, once its backoff and any lease have run out."""
+        return BookIndexOutboxModel.objects.filter(dead=False).aggregate(
+            due=Min(Greatest(
+                Coalesce("next_attempt_at", "created_at"),
+                Coalesce("claimed_until", "created_at"),
+            ))
+        )["due"]
+
+    def stats(self) -> dict:
+        pending = BookIndexOutboxModel.objects.filter(dead=False).aggregate(oldest=Min("created_at"))
+        return {
+            "pending": BookIndexOutboxModel.objects.filter(dead=False).count(),
+            "dead": BookIndexOutboxModel.objects.filter(dead=True).count(),
+            "lag_seconds": (timezone.now() - pending["oldest"]).total_seconds() if pending["oldest"] else 0.0,
+        }
+
+    def requeue_dead(self) -> int:
+        requeued = BookIndexOutboxModel.objects.filter(dead=True).update(
+            dead=False, attempts=0, retries=0, next_attempt_at=None, last_error=""
+        )
+        self.logger.info(f"[BookIndexOutboxRepository] Requeued {requeued} dead-lettered mutations")
+        return requeued
+
+    def _claim(self, batch_size: int, claim_ttl_ms: int) -> tuple[list[BookIndexOutboxModel], datetime]:
+        now = timezone.now()
+        lease = now + timedelta(milliseconds=claim_ttl_ms)
+        with transaction.atomic():
+            rows = list(
+                BookIndexOutboxModel.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(claimed_until__isnull=True) | Q(claimed_until__lt=now),
+                    Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now),
+                    dead=False,
+                )
+                .order_by("id")[:batch_size]
+            )
+            if rows:
+                BookIndexOutboxModel.objects.filter(id__in=[row.id for row in rows]).update(claimed_until=lease)
+        return rows, lease
+
+    def _build_actions(self, latest: dict[str, BookIndexOutboxModel]) -> list[dict]:
+        index_ids = [row.book_id for row in latest.values() if row.action == "index"]
+        books = {book.id: book for book in self.book_repository.get_many(index_ids)} if index_ids else {}
+        delete_isbns = [isbn for isbn, row in latest.items() if row.action == "delete"]
+        reused = self.book_repository.existing_isbns(delete_isbns) if delete_isbns else set()
+
+        actions = []
+        for isbn, row in latest.items():
+            if row.action == "delete":
+                if isbn in reused:
+                    # Another book took the ISBN since; a backed-off delete must not remove its document.
+                    continue
+                actions.append({"_op_type": "delete", "_id": isbn})
+                continue
+
+            book = books.get(row.book_id)
+            if book is None or book.isbn != isbn:
+                # Deleted or re-keyed since it was queued; a later mutation covers it.
+                continue
+            actions.append({"_op_type": "index", "_id": isbn, "_source": self.search_repository.to_document(book)})
+        return actions
+
+    def _apply(self, actions: list[dict]) -> dict[str, tuple[str, bool]]:
+        """Send the actions; failed ones map document id to ``(error, cluster_unavailable)``."""
+        if not actions:
+            return {}
+        try:
+            errors = self.search_repository.bulk_apply(actions)
+        except Exception as e:
+            unavailable = self.search_repository.is_unavailable(e)
+            return {action["_id"]: (str(e) or type(e).__name__, unavailable) for action in actions}
+
+        failures = {}
+        for error in errors:
+            op_type, item = next(iter(error.items()))
+            status = item.get("status")
+            if op_type == "delete" and status == 404:
+                continue
+            failures[item["_id"]] = (str(item.get("error") or status), self.search_repository.is_unavailable(status))
+        return failures
@@ -1,5 +1,6 @@
 from django.db import models
-from django.contrib.postgres.indexes import GinIndex, Index
+from django.contrib.postgres.indexes import GinIndex, Index, OpClass
+from django.db.models.functions import Cast, Upper
 
 from author.infrastructure.author_model import AuthorModel
 from book_category.infrastructure.book_category_model import BookCategoryModel
@@ -32,5 +33,12 @@ class BookModel(models.Model):
     class Meta:
         indexes = [
             GinIndex(fields=['title'], name='book_title_trgm_gin', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['synopsis'], name='book_synopsis_trgm_gin', opclasses=['gin_trgm_ops']),
             Index(fields=["isbn"], name="book_isbn_idx"),
+            Index(fields=["updated_at"], name="book_updated_at_idx"),
+            # Matches the UPPER(title::text) LIKE 'X%' that istartswith generates.
+            Index(
+                OpClass(Upper(Cast("title", models.TextField())), name="text_pattern_ops"),
+                name="book_title_prefix_idx",
+            ),
         ]
\ No newline at end of file
@@ -1,21 +1,92 @@
 import logging
+from dataclasses import replace
+from datetime import datetime
+from typing import Iterator
 
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Q, QuerySet, TextField
+from django.db.models.functions import Cast, Upper
+from django.utils import timezone
 
+from author.infrastructure.author_model import AuthorModel
 from book.domain.book_command_interface import BookCommandInterface
-from book.domain.book_entities import Book
+from book.domain.book_entities import BOOK_FIELDS, Book, BookBulkResult
 from book.domain.book_query_interface import BookQueryInterface
+from book.infrastructure.cache.book_cache import BookCache
+from book_category.infrastructure.book_category_model import BookCategoryModel
+from config.conditional import ResourceVersion
 from .book_model import BookModel
+from .book_trigram_search import BookTrigramSearch
 
 
 class BookRepository(BookCommandInterface, BookQueryInterface):
+    RELATIONS = ("authors", "categories")
+    COLUMNS = BOOK_FIELDS - {"id", *RELATIONS}
+
     def __init__(self):
+        self.cache = BookCache()
         self.logger = logging.getLogger(__name__)
 
-    def get_all(self) -> list[Book]:
-        self.logger.info("[BookRepository] get_all() called")
-        books = BookModel.objects.all()
-        return [self._to_entity(obj) for obj in books]
+    def get_all(self, fields: frozenset[str] | None = None) -> list[Book]:
+        self.logger.info(f"[BookRepository] get_all(fields={sorted(fields) if fields is not None else 'all'}) called")
+        books = self._fieldset_queryset(fields)
+        return [self._to_entity(obj, fields) for obj in books]
+
+    def get_page(self, after_id: int | None, limit: int, fields: frozenset[str] | None = None) -> list[Book]:
+        self.logger.info(f"[BookRepository] get_page(after_id={after_id}, limit={limit}) called")
+        queryset = self._fieldset_queryset(fields).order_by("id")
+        if after_id is not None:
+            queryset = queryset.filter(id__gt=after_id)
+        return [self._to_entity(obj, fields) for obj in queryset[:limit]]
+
+    def iterate_all(self, chunk_size: int, updated_since: datetime | None = None) -> Iterator[Book]:
+        self.logger.info(f"[BookRepository] iterate_all(chunk_size={chunk_size}, updated_since={updated_since}) called")
+        queryset = BookModel.objects.prefetch_related("authors", "categories").order_by("id")
+        if updated_since is not None:
+            queryset = self._changed_since(queryset, updated_since)
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            yield self._to_entity(obj)
+
+    def count(self, updated_since: datetime | None = None) -> int:
+        queryset = BookModel.objects.all()
+        if updated_since is not None:
+            queryset = self._changed_since(queryset, updated_since)
+        return queryset.count()
+
+    def all_isbns(self) -> set[str]:
+        return set(BookModel.objects.values_list("isbn", flat=True))
+
+    def get_many(self, book_ids: list[int]) -> list[Book]:
+        self.logger.info(f"[BookRepository] get_many({len(book_ids)} ids) called")
+        queryset = BookModel.objects.prefetch_related("authors", "categories").filter(id__in=book_ids)
+        return [self._to_entity(obj) for obj in queryset]
+
+    def existing_isbns(self, isbns: list[str]) -> set[str]:
+        return set(BookModel.objects.filter(isbn__in=isbns).values_list("isbn", flat=True))
+
+    def search_trigram(self, query: str, filters: dict, limit: int, offset: int = 0, facets: list[str] = (),
+                       facet_size: int = 10,
+                       fields: frozenset[str] | None = None) -> tuple[int, list[Book], dict[str, list[dict]]]:
+        self.logger.info(f"[BookRepository] search_trigram('{query}', filters={filters}, facets={facets}) called")
+        total, objs, facet_counts = BookTrigramSearch(query).run(
+            filters, limit, offset, facets, facet_size, shape=lambda queryset: self._fieldset_queryset(fields, queryset)
+        )
+        return total, [self._to_entity(obj, fields) for obj in objs], facet_counts
+
+    def suggest_prefix(self, prefix: str, limit: int) -> tuple[list[str], list[str]]:
+        """Titles and author names starting with ``prefix``, read in order from the UPPER(...) prefix indexes."""
+        self.logger.info(f"[BookRepository] suggest_prefix('{prefix}', limit={limit}) called")
+        titles = (
+            BookModel.objects.filter(title__istartswith=prefix)
+            .order_by(Upper(Cast("title", TextField())))
+            .values_list("title", flat=True)[:limit]
+        )
+        authors = (
+            AuthorModel.objects.filter(name__istartswith=prefix)
+            .order_by(Upper(Cast("name", TextField())))
+            .values_list("name", flat=True)[:limit]
+        )
+        return list(dict.fromkeys(titles)), list(dict.fromkeys(authors))
 
     def get_queryset(self):
         self.logger.info("[BookRepository] get_queryset() called")
@@ -34,6 +105,28 @@ class BookRepository(BookCommandInterface, BookQueryInterface):
             self.logger.exception(f"[BookRepository] Unexpected error fetching book {book_id}")
             raise
 
+    def get_version(self, book_id: int | None = None) -> ResourceVersion:
+        """Version of the book payload(s), which embed author and category names as well."""
+        if book_id is None:
+            return ResourceVersion.combine(*[
+                ResourceVersion(**model.objects.aggregate(last_modified=Max("updated_at"), count=Count("id")))
+                for model in (BookModel, AuthorModel, BookCategoryModel)
+            ])
+
+        row = BookModel.objects.filter(id=book_id).aggregate(
+            book=Max("updated_at"),
+            authors=Max("authors__updated_at"),
+            categories=Max("categories__updated_at"),
+            books=Count("id", distinct=True),
+            author_count=Count("authors", distinct=True),
+            category_count=Count("categories", distinct=True),
+        )
+        return ResourceVersion.combine(
+            ResourceVersion(last_modified=row["book"], count=row["books"]),
+            ResourceVersion(last_modified=row["authors"], count=row["author_count"]),
+            ResourceVersion(last_modified=row["categories"], count=row["category_count"]),
+        )
+
     def create(self, book: Book) -> Book:
         self.logger.info(f"[BookRepository] create() called with ISBN: {book.isbn}")
         try:
@@ -45,6 +138,7 @@ class BookRepository(BookCommandInterface, BookQueryInterface):
             obj = BookModel.objects.create(**data)
             obj.authors.set(authors)
             obj.categories.set(categories)
+            self.cache.invalidate(obj.id)
 
             self.logger.info(f"[BookRepository] Book created with ID {obj.id}")
             return self._to_entity(obj)
@@ -56,6 +150,75 @@ class BookRepository(BookCommandInterface, BookQueryInterface):
             self.logger.exception("[BookRepository] Unexpected error creating book")
             raise
 
+    def bulk_create(self, books: list[Book]) -> list[BookBulkResult]:
+        self.logger.info(f"[BookRepository] bulk_create() called with {len(books)} books")
+        isbns = [book.isbn for book in books]
+        existing = set(BookModel.objects.filter(isbn__in=isbns).values_list("isbn", flat=True))
+        authors = AuthorModel.objects.in_bulk({a for book in books for a in book.authors})
+        categories = BookCategoryModel.objects.in_bulk({c for book in books for c in book.categories})
+
+        results: list[BookBulkResult] = []
+        pending: list[tuple[BookBulkResult, BookModel, Book]] = []
+        seen = set()
+        for book in books:
+            result = BookBulkResult(isbn=book.isbn, status="skipped")
+            results.append(result)
+
+            missing_authors = [a for a in book.authors if a not in authors]
+            missing_categories = [c for c in book.categories if c not in categories]
+            if book.isbn in existing:
+                result.error = "ISBN already exists"
+            elif book.isbn in seen:
+                result.error = "Duplicate ISBN in batch"
+            elif missing_authors or missing_categories:
+                result.status = "failed"
+                result.error = f"Unknown authors {missing_authors} or categories {missing_categories}"
+            else:
+                seen.add(book.isbn)
+                data = book.__dict__.copy()
+                data.pop("id", None)
+                data.pop("authors", None)
+                data.pop("categories", None)
+                pending.append((result, BookModel(**data), book))
+
+        if not pending:
+            self.logger.info("[BookRepository] bulk_create() found nothing to insert")
+            return results
+
+        try:
+            with transaction.atomic():
+                created = BookModel.objects.bulk_create([obj for _, obj, _ in pending])
+                BookModel.authors.through.objects.bulk_create([
+                    BookModel.authors.through(bookmodel_id=obj.id, authormodel_id=author_id)
+                    for obj, (_, _, book) in zip(created, pending)
+                    for author_id in dict.fromkeys(book.authors)
+                ])
+                BookModel.categories.through.objects.bulk_create([
+                    BookModel.categories.through(bookmodel_id=obj.id, bookcategorymodel_id=category_id)
+                    for obj, (_, _, book) in zip(created, pending)
+                    for category_id in dict.fromkeys(book.categories)
+                ])
+                self.cache.invalidate(*[obj.id for obj in created])
+        except IntegrityError:
+            self.logger.warning("[BookRepository] Duplicate key error during bulk_create")
+            raise
+        except Exception:
+            self.logger.exception("[BookRepository] Unexpected error during bulk_create")
+            raise
+
+        for obj, (result, _, book) in zip(created, pending):
+            result.status = "created"
+            result.id = obj.id
+            result.book = replace(
+                book,
+                id=obj.id,
+                authors=[authors[a] for a in dict.fromkeys(book.authors)],
+                categories=[categories[c] for c in dict.fromkeys(book.categories)],
+            )
+
+        self.logger.info(f"[BookRepository] bulk_create() inserted {len(created)} of {len(books)} books")
+        return results
+
     def update(self, book_id: int, book: Book) -> Book:
         self.logger.info(f"[BookRepository] update({book_id}) called with ISBN: {book.isbn}")
         try:
@@ -64,7 +227,8 @@ class BookRepository(BookCommandInterface, BookQueryInterface):
             authors = data.pop("authors", [])
             categories = data.pop("categories", [])
 
-            updated = BookModel.objects.filter(id=book_id).update(**data)
+            # QuerySet.update() skips auto_now; reindex_books --since relies on updated_at.
+            updated = BookModel.objects.filter(id=book_id).update(**data, updated_at=timezone.now())
             if updated == 0:
                 self.logger.warning(f"[BookRepository] Book {book_id} not found for update")
                 raise BookModel.DoesNotExist(f"Book {book_id} not found")
@@ -72,6 +236,7 @@ class BookRepository(BookCommandInterface, BookQueryInterface):
             obj = BookModel.objects.get(id=book_id)
             obj.authors.set(authors)
             obj.categories.set(categories)
+            self.cache.invalidate(book_id)
 
             self.logger.info(f"[BookRepository] Book {book_id} updated successfully")
             return self._to_entity(obj)
@@ -88,22 +253,35 @@ class BookRepository(BookCommandInterface, BookQueryInterface):
                 self.logger.warning(f"[BookRepository] Book {book_id} not found for deletion")
                 raise BookModel.DoesNotExist(f"Book {book_id} not found")
 
+            self.cache.invalidate(book_id)
             self.logger.info(f"[BookRepository] Book {book_id} deleted successfully")
         except Exception:
             self.logger.exception(f"[BookRepository] Unexpected error deleting book {book_id}")
             raise
 
-    def _to_entity(self, obj: BookModel) -> Book:
+    @staticmethod
+    def _changed_since(queryset, since: datetime):
+        # Renaming an author or category changes the documents of its books, not their rows.
+        return queryset.filter(
+            Q(updated_at__gte=since) | Q(authors__updated_at__gte=since) | Q(categories__updated_at__gte=since)
+        ).distinct()
+
+    def _fieldset_queryset(self, fields: frozenset[str] | None, queryset: QuerySet | None = None):
+        """Select only the requested columns and prefetch only the requested relations."""
+        queryset = BookModel.objects if queryset is None else queryset
+        if fields is None:
+            return queryset.prefetch_related(*self.RELATIONS)
+        queryset = queryset.only("id", *sorted(fields & self.COLUMNS))
+        return queryset.prefetch_related(*[relation for relation in self.RELATIONS if relation in fields])
+
+    def _to_entity(self, obj: BookModel, fields: frozenset[str] | None = None) -> Book:
+        # Columns left out by only() stay None instead of being lazily loaded one query per row.
+        def wanted(name: str) -> bool:
+            return fields is None or name in fields
+
         return Book(
             id=obj.id,
-            title=obj.title,
-            isbn=obj.isbn,
-            publisher=obj.publisher,
-            edition=obj.edition,
-            language=obj.language,
-            book_type=obj.book_type,
-            synopsis=obj.synopsis,
-            publication_date=obj.publication_date,
-            authors=list(obj.authors.all()),
-            categories=list(obj.categories.all()),
+            **{name: getattr(obj, name) if wanted(name) else None for name in sorted(self.COLUMNS)},
+            authors=list(obj.authors.all()) if wanted("authors") else [],
+            categories=list(obj.categories.all()) if wanted("categories") else [],
         )
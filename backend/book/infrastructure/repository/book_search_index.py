@@ -0,0 +1,100 @@
+from django.conf import settings
+
+TEMPLATE_NAME = "books"
+AUTOCOMPLETE_MAX_GRAM = 15
+
+
+def books_index_template(alias: str) -> dict:
+    """Composable index template applied to the ``books`` alias target and every versioned index."""
+    return {
+        "name": TEMPLATE_NAME,
+        "index_patterns": [alias, f"{alias}_*"],
+        "priority": 100,
+        "template": {
+            "settings": {
+                "number_of_shards": settings.ELASTICSEARCH_BOOKS_SHARDS,
+                "number_of_replicas": settings.ELASTICSEARCH_BOOKS_REPLICAS,
+                "refresh_interval": settings.ELASTICSEARCH_BOOKS_REFRESH_INTERVAL,
+                "analysis": _analysis(),
+            },
+            "mappings": _mappings(),
+        },
+    }
+
+
+def _analysis() -> dict:
+    return {
+        "filter": {
+            "book_edge_ngram": {"type": "edge_ngram", "min_gram": 2, "max_gram": AUTOCOMPLETE_MAX_GRAM},
+            # Longer query words are cut to the longest indexed prefix, or they could never match.
+            "book_autocomplete_truncate": {"type": "truncate", "length": AUTOCOMPLETE_MAX_GRAM},
+        },
+        "analyzer": {
+            "book_text": {"tokenizer": "standard", "filter": ["lowercase", "asciifolding"]},
+            "book_autocomplete": {
+                "tokenizer": "standard",
+                "filter": ["lowercase", "asciifolding", "book_edge_ngram"],
+            },
+            "book_autocomplete_search": {
+                "tokenizer": "standard",
+                "filter": ["lowercase", "asciifolding", "book_autocomplete_truncate"],
+            },
+        },
+        "normalizer": {
+            "book_keyword": {"type": "custom", "filter": ["lowercase", "asciifolding"]},
+        },
+    }
+
+
+def _mappings() -> dict:
+    stemmed = {"type": "text", "analyzer": settings.ELASTICSEARCH_BOOKS_LANGUAGE}
+    return {
+        # Unknown fields stay in _source but are not indexed, so new document keys cannot grow the mapping.
+        "dynamic": False,
+        "properties": {
+            "id": {"type": "integer"},
+            "isbn": {"type": "keyword", "doc_values": False},
+            "title": {
+                "type": "text",
+                "analyzer": "book_text",
+                "fields": {
+                    "stemmed": stemmed,
+                    "autocomplete": {
+                        "type": "text",
+                        "analyzer": "book_autocomplete",
+                        "search_analyzer": "book_autocomplete_search",
+                        "norms": False,
+                    },
+                },
+            },
+            "synopsis": {"type": "text", "analyzer": "book_text", "fields": {"stemmed": stemmed}},
+            "authors": {
+                "type": "text",
+                "analyzer": "book_text",
+                "fields": {
+                    "keyword": {"type": "keyword", "ignore_above": 256},
+                    "autocomplete": {
+                        "type": "text",
+                        "analyzer": "book_autocomplete",
+                        "search_analyzer": "book_autocomplete_search",
+                        "norms": False,
+                    },
+                },
+            },
+            "categories": {
+                "type": "text",
+                "analyzer": "book_text",
+                "norms": False,
+                "fields": {"keyword": {"type": "keyword", "ignore_above": 256}},
+            },
+            # Facets and filters use the stored value, as the Postgres fallback does; the normalized
+            # field stays available for case-insensitive matching.
+            "language": {
+                "type": "keyword",
+                "normalizer": "book_keyword",
+                "fields": {"raw": {"type": "keyword", "ignore_above": 256}},
+            },
+            "book_type": {"type": "keyword"},
+            "publication_date": {"type": "date", "doc_values": False},
+        },
+    }
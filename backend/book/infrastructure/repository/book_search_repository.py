@@ -1,9 +1,35 @@
 import logging
-from config.es_client import es_client
+import re
+import unicodedata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator
+
+from django.conf import settings
+from django.utils import timezone
+from elasticsearch import ApiError, TransportError
+from elasticsearch.helpers import bulk, scan, streaming_bulk
+
+from book.domain.book_entities import Book
+from config.es_client import get_es_client
+from .book_search_index import books_index_template
 
 
 class BookSearchRepository:
     INDEX = "books"
+    MAX_RESULT_WINDOW = 10000
+    SEARCH_FIELDS = ["title^3", "title.stemmed^2", "synopsis", "synopsis.stemmed", "authors"]
+    HIT_FIELDS = ["id", "isbn", "title", "authors", "categories", "language", "book_type", "publication_date"]
+    FILTER_FIELDS = {
+        "language": "language.raw",
+        "book_type": "book_type",
+        "category": "categories.keyword",
+        "author": "authors.keyword",
+    }
+    FACET_FIELDS = FILTER_FIELDS
+    # Cluster overloaded or unreachable rather than a problem with the documents themselves.
+    UNAVAILABLE_STATUSES = frozenset({429, 502, 503, 504})
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -11,21 +37,128 @@ class BookSearchRepository:
     def index_book(self, book: dict):
         self.logger.info(f"[BookSearchRepository] Indexing book with ISBN {book.get('isbn')}")
         try:
-            es_client.index(index=self.INDEX, id=book["isbn"], document=book)
+            get_es_client().index(index=self.INDEX, id=book["isbn"], document=book)
             self.logger.info(f"[BookSearchRepository] Book {book['isbn']} indexed successfully")
         except Exception:
             self.logger.exception(f"[BookSearchRepository] Failed to index book {book.get('isbn')}")
             raise
 
+    def bulk_apply(self, actions: list[dict]) -> list[dict]:
+        self.logger.info(f"[BookSearchRepository] Applying {len(actions)} bulk actions")
+        try:
+            applied, errors = bulk(get_es_client(), actions, index=self.INDEX, raise_on_error=False)
+            self.logger.info(f"[BookSearchRepository] Bulk applied {applied} actions with {len(errors)} errors")
+            return errors
+        except Exception:
+            self.logger.exception(f"[BookSearchRepository] Failed to apply {len(actions)} bulk actions")
+            raise
+
+    @classmethod
+    def is_unavailable(cls, error: Exception | int) -> bool:
+        """Whether a bulk failure (an exception, or a per-item status) means the cluster can't take writes now."""
+        if isinstance(error, int):
+            return error in cls.UNAVAILABLE_STATUSES
+        if isinstance(error, ApiError):
+            return error.status_code in cls.UNAVAILABLE_STATUSES
+        return isinstance(error, TransportError)
+
+    def parallel_index(self, index: str, documents: Iterable[dict], thread_count: int,
+                       chunk_size: int) -> Iterator[tuple[bool, dict]]:
+        """Index documents into ``index`` from ``thread_count`` bulk workers, yielding one result per document.
+
+        ``documents`` is consumed and chunked on the calling thread, so a database cursor behind it
+        never runs on (and leaves a connection open in) a worker thread.
+        """
+        self.logger.info(f"[BookSearchRepository] Parallel indexing into {index} with {thread_count} workers")
+        client = get_es_client()
+        actions = ({"_index": index, "_id": doc["isbn"], "_source": doc} for doc in documents)
+        with ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix="bulk-index") as executor:
+            in_flight = deque()
+            while chunk := list(islice(actions, chunk_size)):
+                in_flight.append(executor.submit(self._bulk_chunk, client, chunk))
+                if len(in_flight) >= thread_count * 2:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+
+    @staticmethod
+    def _bulk_chunk(client, chunk: list[dict]) -> list[tuple[bool, dict]]:
+        return list(streaming_bulk(client, chunk, chunk_size=len(chunk), raise_on_error=False))
+
+    def document_ids(self, index: str) -> set[str]:
+        self.logger.info(f"[BookSearchRepository] Listing document ids in {index}")
+        hits = scan(get_es_client(), index=index, query={"query": {"match_all": {}}}, _source=False)
+        return {hit["_id"] for hit in hits}
+
+    def delete_documents(self, index: str, ids: list[str]) -> None:
+        self.logger.info(f"[BookSearchRepository] Deleting {len(ids)} documents from {index}")
+        actions = ({"_op_type": "delete", "_index": index, "_id": doc_id} for doc_id in ids)
+        _, errors = bulk(get_es_client(), actions, raise_on_error=False)
+        errors = [error for error in errors if error["delete"].get("status") != 404]
+        if errors:
+            raise RuntimeError(f"Failed to delete {len(errors)} documents from {index}: {errors[:3]}")
+
+    def put_index_template(self) -> None:
+        self.logger.info(f"[BookSearchRepository] Putting index template for {self.INDEX}")
+        get_es_client().indices.put_index_template(**books_index_template(self.INDEX))
+
+    def ensure_index(self) -> str | None:
+        """Install the template and, if nothing answers to ``books`` yet, create an empty versioned index behind it."""
+        self.put_index_template()
+        client = get_es_client()
+        if client.indices.exists(index=self.INDEX):
+            return None
+        name = f"{self.INDEX}_{timezone.now():%Y%m%d%H%M%S}"
+        client.indices.create(index=name, aliases={self.INDEX: {}})
+        self.logger.info(f"[BookSearchRepository] Created {name} behind alias {self.INDEX}")
+        return name
+
+    def create_versioned_index(self) -> str:
+        self.put_index_template()
+        name = f"{self.INDEX}_{timezone.now():%Y%m%d%H%M%S}"
+        self.logger.info(f"[BookSearchRepository] Creating index {name}")
+        # Mappings come from the template; no replicas and no refresh while bulk loading.
+        get_es_client().indices.create(index=name, settings={"number_of_replicas": 0, "refresh_interval": "-1"})
+        return name
+
+    def finalize_index(self, index: str) -> None:
+        self.logger.info(f"[BookSearchRepository] Finalizing index {index}")
+        client = get_es_client()
+        client.indices.put_settings(index=index, settings={
+            "number_of_replicas": settings.ELASTICSEARCH_BOOKS_REPLICAS,
+            "refresh_interval": settings.ELASTICSEARCH_BOOKS_REFRESH_INTERVAL,
+        })
+        client.indices.refresh(index=index)
+
+    def swap_alias(self, index: str) -> list[str]:
+        """Atomically point the ``books`` alias at ``index``; returns the indices it was moved away from."""
+        client = get_es_client()
+        actions = [{"add": {"index": index, "alias": self.INDEX}}]
+        previous = []
+        if client.indices.exists_alias(name=self.INDEX):
+            previous = [name for name in client.indices.get_alias(name=self.INDEX) if name != index]
+            actions = [{"remove": {"index": name, "alias": self.INDEX}} for name in previous] + actions
+        elif client.indices.exists(index=self.INDEX):
+            # A concrete index created by dynamic mapping holds the alias name; drop it in the same call.
+            actions.insert(0, {"remove_index": {"index": self.INDEX}})
+
+        client.indices.update_aliases(actions=actions)
+        self.logger.info(f"[BookSearchRepository] Alias {self.INDEX} now points to {index} (was {previous})")
+        return previous
+
+    def delete_indices(self, indices: list[str]) -> None:
+        self.logger.info(f"[BookSearchRepository] Deleting indices {indices}")
+        get_es_client().indices.delete(index=indices, ignore_unavailable=True)
+
     def search_books(self, query: str) -> list:
         self.logger.info(f"[BookSearchRepository] Searching books with query: '{query}'")
         try:
-            response = es_client.search(
+            response = get_es_client().search(
                 index=self.INDEX,
                 query={
                     "multi_match": {
                         "query": query,
-                        "fields": ["title^3", "synopsis", "authors"]
+                        "fields": self.SEARCH_FIELDS
                     }
                 }
             )
@@ -36,11 +169,116 @@ class BookSearchRepository:
             self.logger.exception(f"[BookSearchRepository] Failed to search books with query: '{query}'")
             raise
 
+    def search(self, query: str, filters: dict, size: int, offset: int = 0, search_after: list | None = None,
+               facets: list[str] = (), facet_size: int = 10) -> tuple[int, list[dict], list | None, dict]:
+        self.logger.info(f"[BookSearchRepository] Searching books with query: '{query}' filters={filters}")
+        params = {
+            "index": self.INDEX,
+            "query": {
+                "bool": {
+                    "must": [
+                        {"multi_match": {"query": query, "fields": self.SEARCH_FIELDS}} if query else {"match_all": {}}
+                    ],
+                    "filter": [
+                        {"term": {self.FILTER_FIELDS[name]: value}}
+                        for name, value in filters.items() if value
+                    ],
+                }
+            },
+            "sort": ["_score", {"id": "asc"}],
+            "size": size,
+            "source": self.HIT_FIELDS,
+            "highlight": {
+                "fields": {
+                    "title": {"number_of_fragments": 0},
+                    "synopsis": {"fragment_size": 150, "number_of_fragments": 1},
+                }
+            },
+        }
+        if facets:
+            params["aggs"] = {
+                name: {"terms": {"field": self.FACET_FIELDS[name], "size": facet_size}} for name in facets
+            }
+        if search_after:
+            params["search_after"] = search_after
+        else:
+            params["from_"] = offset
+
+        try:
+            response = get_es_client().search(**params)
+        except Exception:
+            self.logger.exception(f"[BookSearchRepository] Failed to search books with query: '{query}'")
+            raise
+
+        hits = [{**hit["_source"], "highlight": hit.get("highlight", {})} for hit in response["hits"]["hits"]]
+        total = response["hits"]["total"]["value"]
+        last_sort = response["hits"]["hits"][-1]["sort"] if len(hits) == size else None
+        facet_counts = {
+            name: [{"value": b["key"], "count": b["doc_count"]} for b in response["aggregations"][name]["buckets"]]
+            for name in facets
+        }
+        self.logger.info(f"[BookSearchRepository] Found {total} results for query: '{query}'")
+        return total, hits, last_sort, facet_counts
+
+    def suggest(self, prefix: str, size: int) -> tuple[list[str], list[str]]:
+        """Title and author-name completions for ``prefix`` from the edge-ngram subfields, in one msearch."""
+        self.logger.info(f"[BookSearchRepository] Suggesting completions for '{prefix}'")
+        titles_body = {
+            "query": {"match": {"title.autocomplete": {"query": prefix, "operator": "and"}}},
+            "_source": ["title"],
+            "size": size,
+        }
+        # Matching books also carry their co-authors, so over-fetch names and keep the ones that match.
+        authors_body = {
+            "query": {"match": {"authors.autocomplete": {"query": prefix, "operator": "and"}}},
+            "size": 0,
+            "aggs": {"authors": {"terms": {"field": "authors.keyword", "size": size * 5}}},
+        }
+        try:
+            titles_response, authors_response = get_es_client().msearch(
+                index=self.INDEX, searches=[{}, titles_body, {}, authors_body]
+            )["responses"]
+        except Exception:
+            self.logger.exception(f"[BookSearchRepository] Failed to suggest completions for '{prefix}'")
+            raise
+
+        for response in (titles_response, authors_response):
+            if "error" in response:
+                raise RuntimeError(f"Suggest query failed: {response['error']}")
+
+        titles = list(dict.fromkeys(hit["_source"]["title"] for hit in titles_response["hits"]["hits"]))
+        terms = _fold(prefix)
+        authors = [
+            bucket["key"] for bucket in authors_response["aggregations"]["authors"]["buckets"]
+            if all(any(word.startswith(term) for word in _fold(bucket["key"])) for term in terms)
+        ]
+        return titles, authors[:size]
+
     def delete_book(self, isbn: str):
         self.logger.info(f"[BookSearchRepository] Deleting book with ISBN {isbn}")
         try:
-            es_client.delete(index=self.INDEX, id=isbn, ignore=[404])
+            get_es_client().delete(index=self.INDEX, id=isbn, ignore=[404])
             self.logger.info(f"[BookSearchRepository] Book {isbn} deleted from index")
         except Exception:
             self.logger.exception(f"[BookSearchRepository] Failed to delete book with ISBN {isbn}")
             raise
+
+    @staticmethod
+    def to_document(book: Book) -> dict:
+        return {
+            "id": book.id,
+            "isbn": book.isbn,
+            "title": book.title,
+            "synopsis": book.synopsis,
+            "authors": [a.name for a in book.authors],
+            "categories": [c.name for c in book.categories],
+            "language": book.language,
+            "book_type": book.book_type,
+            "publication_date": book.publication_date,
+        }
+
+
+def _fold(text: str) -> list[str]:
+    """Approximates the book_text analyzer: word tokens, lowercased and stripped of accents."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return re.findall(r"\w+", "".join(c for c in decomposed if not unicodedata.combining(c)).casefold())
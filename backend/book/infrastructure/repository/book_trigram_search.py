@@ -0,0 +1,98 @@
+import logging
+from typing import Callable
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity, TrigramWordSimilarity
+from django.db import connection, transaction
+from django.db.models import Count, F, FloatField, QuerySet, Value
+from django.db.models.functions import Greatest
+
+from .book_model import BookModel
+
+
+class BookTrigramSearch:
+    """Fuzzy book search answered from the pg_trgm GIN indexes.
+
+    Candidates are collected with the indexable ``%`` (title, author name) and
+    ``%>`` (synopsis words) operators, so Postgres only ranks the rows that
+    matched instead of computing similarity for the whole table. An empty query
+    browses the whole (filtered) catalog in id order.
+    """
+
+    def __init__(self, query: str, threshold: float | None = None):
+        self.query = query
+        self.threshold = settings.BOOK_TRIGRAM_THRESHOLD if threshold is None else threshold
+        self.logger = logging.getLogger(__name__)
+
+    def queryset(self, filters: dict) -> QuerySet:
+        if self.query:
+            candidates = BookModel.objects.filter(title__trigram_similar=self.query).values("id").union(
+                BookModel.objects.filter(synopsis__trigram_word_similar=self.query).values("id"),
+                BookModel.authors.through.objects.filter(
+                    authormodel__name__trigram_similar=self.query
+                ).values("bookmodel_id"),
+            )
+            queryset = BookModel.objects.filter(id__in=candidates)
+        else:
+            queryset = BookModel.objects.all()
+
+        if filters.get("language"):
+            queryset = queryset.filter(language=filters["language"])
+        if filters.get("book_type"):
+            queryset = queryset.filter(book_type=filters["book_type"])
+        if filters.get("category"):
+            queryset = queryset.filter(
+                id__in=BookModel.categories.through.objects.filter(
+                    bookcategorymodel__name=filters["category"]
+                ).values("bookmodel_id")
+            )
+        if filters.get("author"):
+            queryset = queryset.filter(
+                id__in=BookModel.authors.through.objects.filter(
+                    authormodel__name=filters["author"]
+                ).values("bookmodel_id")
+            )
+
+        if not self.query:
+            return queryset.annotate(similarity=Value(0.0, output_field=FloatField()))
+        return queryset.annotate(
+            similarity=Greatest(
+                TrigramSimilarity("title", self.query),
+                TrigramWordSimilarity(self.query, "synopsis"),
+            )
+        )
+
+    def facet_querysets(self, queryset: QuerySet, names: list[str], size: int) -> dict[str, QuerySet]:
+        """Top ``size`` values per facet over ``queryset``, counted with GROUP BY on the book and through tables."""
+        ids = queryset.values("id")
+        sources = {
+            "language": BookModel.objects.filter(id__in=ids).values(value=F("language")),
+            "book_type": BookModel.objects.filter(id__in=ids).values(value=F("book_type")),
+            "category": BookModel.categories.through.objects.filter(bookmodel_id__in=ids)
+                .values(value=F("bookcategorymodel__name")),
+            "author": BookModel.authors.through.objects.filter(bookmodel_id__in=ids)
+                .values(value=F("authormodel__name")),
+        }
+        return {name: sources[name].annotate(count=Count("*")).order_by("-count", "value")[:size] for name in names}
+
+    def run(self, filters: dict, limit: int, offset: int = 0, facets: list[str] = (), facet_size: int = 10,
+            shape: Callable[[QuerySet], QuerySet] | None = None) -> tuple[int, list[BookModel], dict[str, list[dict]]]:
+        """``shape`` narrows the page query (columns, prefetches); by default both relations are prefetched."""
+        self.logger.info(f"[BookTrigramSearch] Searching '{self.query}' with threshold {self.threshold}")
+        queryset = self.queryset(filters)
+        with transaction.atomic():
+            if self.query:
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT set_config('pg_trgm.similarity_threshold', %s, true), "
+                        "set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                        [str(self.threshold), str(self.threshold)],
+                    )
+            total = queryset.count()
+            page = shape(queryset) if shape else queryset.prefetch_related("authors", "categories")
+            objs = list(page.order_by("-similarity", "id")[offset:offset + limit])
+            facet_counts = {
+                name: list(facet_queryset)
+                for name, facet_queryset in self.facet_querysets(queryset, facets, facet_size).items()
+            }
+        return total, objs, facet_counts
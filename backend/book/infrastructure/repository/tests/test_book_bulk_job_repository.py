@@ -0,0 +1,70 @@
+import uuid
+
+import pytest
+
+from book.domain.book_entities import BookBulkResult
+from book.infrastructure.repository.book_bulk_job_model import BookBulkJobModel
+from book.infrastructure.repository.book_bulk_job_repository import BookBulkJobRepository
+
+JOB_ID = uuid.UUID("5f0c6d1e-8a3b-4c2d-9e1f-0a1b2c3d4e5f")
+
+
+@pytest.fixture
+def repository():
+    return BookBulkJobRepository()
+
+
+@pytest.fixture
+def mock_objects(mocker):
+    return mocker.patch.object(BookBulkJobModel, "objects")
+
+
+def test_create(repository, mock_objects):
+    mock_objects.create.return_value = BookBulkJobModel(id=JOB_ID, total=3, batches=2, errors=[], results={})
+
+    job = repository.create(3, 2, [])
+
+    assert (job.id, job.status, job.batches_done) == (str(JOB_ID), "pending", 0)
+    mock_objects.create.assert_called_once_with(total=3, batches=2, errors=[])
+
+
+def test_record_batch_keys_results_by_batch(repository, mock_objects, mocker):
+    obj = BookBulkJobModel(id=JOB_ID, total=3, batches=2, errors=[], results={})
+    mocker.patch.object(obj, "save")
+    mock_objects.select_for_update.return_value.get.return_value = obj
+    results = [
+        BookBulkResult(isbn="111", status="created", id=7),
+        BookBulkResult(isbn="222", status="skipped", error="ISBN already exists"),
+    ]
+
+    repository.record_batch(str(JOB_ID), 1, [4, 6], results)
+    # A redelivered batch replaces its own entry rather than adding a second one.
+    repository.record_batch(str(JOB_ID), 1, [4, 6], results)
+
+    assert obj.results == {"1": [
+        {"index": 4, "isbn": "111", "status": "created", "id": 7, "error": None},
+        {"index": 6, "isbn": "222", "status": "skipped", "id": None, "error": "ISBN already exists"},
+    ]}
+    obj.save.assert_called_with(update_fields=["results", "updated_at"])
+
+
+def test_get_merges_batches_in_request_order(repository, mock_objects):
+    mock_objects.get.return_value = BookBulkJobModel(
+        id=JOB_ID, total=3, batches=2, errors=[{"index": 1, "errors": {}}],
+        results={
+            "1": [{"index": 2, "isbn": "333", "status": "created", "id": 9, "error": None}],
+            "0": [{"index": 0, "isbn": "111", "status": "created", "id": 8, "error": None}],
+        },
+    )
+
+    job = repository.get(str(JOB_ID))
+
+    assert job.status == "done"
+    assert [item["index"] for item in job.results] == [0, 2]
+    assert job.errors == [{"index": 1, "errors": {}}]
+
+
+def test_get_missing_job(repository, mock_objects):
+    mock_objects.get.side_effect = BookBulkJobModel.DoesNotExist
+
+    assert repository.get(str(JOB_ID)) is None
@@ -0,0 +1,227 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from elasticsearch import ConnectionError
+
+from book.infrastructure.repository.book_index_outbox_repository import BookIndexOutboxRepository
+from book.infrastructure.repository.book_index_outbox_model import BookIndexOutboxModel
+from book.infrastructure.repository.book_search_repository import BookSearchRepository
+
+FLUSH_OPTIONS = {"max_attempts": 3, "claim_ttl_ms": 60000, "retry_delay_ms": 5000, "retry_max_delay_ms": 60000}
+
+
+@pytest.fixture(autouse=True)
+def mock_atomic(mocker):
+    return mocker.patch("book.infrastructure.repository.book_index_outbox_repository.transaction.atomic")
+
+
+@pytest.fixture
+def repository(mocker):
+    mocker.patch("book.infrastructure.repository.book_index_outbox_repository.BookRepository")
+    search_repository = mocker.patch("book.infrastructure.repository.book_index_outbox_repository.BookSearchRepository")
+    search_repository.return_value.is_unavailable.side_effect = BookSearchRepository.is_unavailable
+    repository = BookIndexOutboxRepository()
+    repository.book_repository.existing_isbns.return_value = set()
+    return repository
+
+
+@pytest.fixture
+def mock_objects(mocker):
+    return mocker.patch.object(BookIndexOutboxModel, "objects")
+
+
+def make_row(row_id, book_id, isbn, action="index", attempts=0, retries=0):
+    return BookIndexOutboxModel(
+        id=row_id, book_id=book_id, isbn=isbn, action=action, attempts=attempts, retries=retries,
+        created_at=timezone.now() - timedelta(seconds=2),
+    )
+
+
+def claim(mock_objects, rows):
+    chain = mock_objects.select_for_update.return_value.filter.return_value.order_by.return_value
+    chain.__getitem__.return_value = rows
+
+
+def deleted_ids(mock_objects):
+    """Ids passed to the delete() issued in the outcome transaction (the last filter call)."""
+    return mock_objects.filter.call_args_list[-1].kwargs["id__in"]
+
+
+def test_enqueue_bulk_creates_rows(repository, mock_objects):
+    repository.enqueue([(1, "111", "index"), (2, "222", "delete")])
+
+    created = mock_objects.bulk_create.call_args.args[0]
+    assert [(r.book_id, r.isbn, r.action) for r in created] == [(1, "111", "index"), (2, "222", "delete")]
+
+
+def test_flush_empty_queue(repository, mock_objects):
+    claim(mock_objects, [])
+
+    result = repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    assert result.claimed == 0
+    repository.search_repository.bulk_apply.assert_not_called()
+
+
+def test_flush_coalesces_mutations_per_document(repository, mock_objects, mocker):
+    rows = [make_row(1, 1, "111"), make_row(2, 1, "111"), make_row(3, 2, "222", action="delete")]
+    claim(mock_objects, rows)
+    book = mocker.Mock(id=1, isbn="111")
+    repository.book_repository.get_many.return_value = [book]
+    repository.search_repository.to_document.return_value = {"title": "Clean Code"}
+    repository.search_repository.bulk_apply.return_value = []
+
+    result = repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    repository.book_repository.get_many.assert_called_once_with([1])
+    repository.search_repository.bulk_apply.assert_called_once_with([
+        {"_op_type": "index", "_id": "111", "_source": {"title": "Clean Code"}},
+        {"_op_type": "delete", "_id": "222"},
+    ])
+    assert deleted_ids(mock_objects) == [1, 2, 3]
+    mock_objects.filter.return_value.delete.assert_called_once()
+    assert (result.claimed, result.applied, result.failed, result.has_more) == (3, 2, 0, False)
+    assert result.lag_seconds >= 2
+
+
+def test_flush_skips_books_rekeyed_since_queued(repository, mock_objects, mocker):
+    claim(mock_objects, [make_row(1, 1, "old")])
+    repository.book_repository.get_many.return_value = [mocker.Mock(id=1, isbn="new")]
+
+    result = repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    repository.search_repository.bulk_apply.assert_not_called()
+    assert result.applied == 0
+    assert deleted_ids(mock_objects) == [1]
+
+
+def test_flush_ignores_missing_documents_on_delete(repository, mock_objects):
+    claim(mock_objects, [make_row(1, 1, "111", action="delete")])
+    repository.search_repository.bulk_apply.return_value = [{"delete": {"_id": "111", "status": 404}}]
+
+    result = repository.flush(batch_size=1, **FLUSH_OPTIONS)
+
+    assert result.failed == 0
+    assert result.has_more is True
+    mock_objects.bulk_update.assert_called_once_with(
+        [], ["attempts", "retries", "next_attempt_at", "last_error", "dead", "claimed_until"]
+    )
+
+
+def test_flush_records_failures_and_dead_letters(repository, mock_objects, mocker):
+    first, second = make_row(1, 1, "111", action="delete", attempts=2), make_row(2, 2, "222", action="delete")
+    claim(mock_objects, [first, second])
+    repository.search_repository.bulk_apply.return_value = [
+        {"delete": {"_id": "111", "status": 500, "error": "boom"}},
+        {"delete": {"_id": "222", "status": 500}},
+    ]
+    log_spy = mocker.spy(repository.logger, "error")
+
+    result = repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    assert (first.attempts, first.dead, first.last_error) == (3, True, "boom")
+    assert (second.attempts, second.dead, second.last_error) == (1, False, "500")
+    assert (result.failed, result.dead_lettered) == (2, 1)
+    log_spy.assert_called_once_with("[BookIndexOutboxRepository] Dead-lettered 1 documents after 3 attempts")
+
+
+def test_flush_marks_whole_batch_failed_when_bulk_raises(repository, mock_objects):
+    rows = [make_row(1, 1, "111", action="delete"), make_row(2, 2, "222", action="delete")]
+    claim(mock_objects, rows)
+    repository.search_repository.bulk_apply.side_effect = ValueError("bad mapping")
+
+    result = repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    assert result.failed == 2
+    assert all(row.attempts == 1 and row.last_error == "bad mapping" for row in rows)
+    assert deleted_ids(mock_objects) == []
+
+
+def test_flush_does_not_count_cluster_outages_towards_dead_letter(repository, mock_objects):
+    rows = [make_row(1, 1, "111", action="delete", attempts=2), make_row(2, 2, "222", action="delete", attempts=2)]
+    claim(mock_objects, rows)
+    repository.search_repository.bulk_apply.side_effect = ConnectionError("ES down")
+
+    result = repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    assert all((row.attempts, row.retries, row.dead) == (2, 1, False) for row in rows)
+    assert (result.failed, result.unavailable, result.dead_lettered) == (2, 2, 0)
+
+
+def test_flush_treats_rejected_items_as_cluster_unavailable(repository, mock_objects):
+    row = make_row(1, 1, "111", action="delete")
+    claim(mock_objects, [row])
+    repository.search_repository.bulk_apply.return_value = [{"delete": {"_id": "111", "status": 429}}]
+
+    result = repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    assert (row.attempts, row.retries, row.last_error) == (0, 1, "429")
+    assert result.unavailable == 1
+
+
+def test_flush_backs_off_exponentially_up_to_the_cap(repository, mock_objects):
+    rows = [make_row(i, i, str(i), action="delete", retries=retries) for i, retries in enumerate((0, 2, 9), 1)]
+    claim(mock_objects, rows)
+    repository.search_repository.bulk_apply.return_value = [
+        {"delete": {"_id": row.isbn, "status": 503}} for row in rows
+    ]
+
+    before = timezone.now()
+    repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    delays = [(row.next_attempt_at - before).total_seconds() for row in rows]
+    assert [round(delay) for delay in delays] == [5, 20, 60]
+
+
+def test_flush_skips_delete_when_isbn_was_reused(repository, mock_objects):
+    claim(mock_objects, [make_row(1, 1, "111", action="delete")])
+    repository.book_repository.existing_isbns.return_value = {"111"}
+
+    result = repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    repository.book_repository.existing_isbns.assert_called_once_with(["111"])
+    repository.search_repository.bulk_apply.assert_not_called()
+    assert result.applied == 0
+    assert deleted_ids(mock_objects) == [1]
+
+
+def test_flush_claims_rows_and_calls_elasticsearch_outside_a_transaction(repository, mock_objects, mock_atomic):
+    rows = [make_row(1, 1, "111", action="delete"), make_row(2, 2, "222", action="delete")]
+    claim(mock_objects, rows)
+    in_transaction = []
+    mock_atomic.return_value.__enter__.side_effect = lambda: in_transaction.append(True)
+    mock_atomic.return_value.__exit__.side_effect = lambda *exc: in_transaction.pop() and False
+    during_bulk = []
+    repository.search_repository.bulk_apply.side_effect = lambda actions: during_bulk.append(bool(in_transaction)) or []
+
+    before = timezone.now()
+    repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    claim_call, delete_call = mock_objects.filter.call_args_list
+    lease = mock_objects.filter.return_value.update.call_args.kwargs["claimed_until"]
+    assert claim_call.kwargs == {"id__in": [1, 2]}
+    assert lease >= before + timedelta(seconds=60)
+    assert delete_call.kwargs == {"id__in": [1, 2], "claimed_until": lease}
+    assert mock_atomic.call_count == 2
+    assert during_bulk == [False]
+
+
+def test_flush_releases_claim_of_failed_rows(repository, mock_objects):
+    row = make_row(1, 1, "111", action="delete")
+    claim(mock_objects, [row])
+    repository.search_repository.bulk_apply.return_value = [{"delete": {"_id": "111", "status": 500}}]
+
+    repository.flush(batch_size=10, **FLUSH_OPTIONS)
+
+    assert row.claimed_until is None
+
+
+def test_requeue_dead(repository, mock_objects):
+    mock_objects.filter.return_value.update.return_value = 4
+
+    assert repository.requeue_dead() == 4
+    mock_objects.filter.assert_called_once_with(dead=True)
+    mock_objects.filter.return_value.update.assert_called_once_with(
+        dead=False, attempts=0, retries=0, next_attempt_at=None, last_error=""
+    )
@@ -1,8 +1,12 @@
+from datetime import datetime, timezone
+
 import pytest
 from book.domain.book_entities import Book
 from book.infrastructure.repository.book_repository import BookRepository
 from book.infrastructure.repository.book_model import BookModel
+from config.conditional import ResourceVersion
 from django.db import IntegrityError
+from django.db.models import Q
 
 
 @pytest.fixture
@@ -26,11 +30,15 @@ def make_book_model(mocker):
 
 def test_get_all_books(mocker, make_book_model):
     mock_queryset = [make_book_model(), make_book_model(id=2)]
-    mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.all", return_value=mock_queryset)
+    mock_prefetch = mocker.patch(
+        "book.infrastructure.repository.book_model.BookModel.objects.prefetch_related", return_value=mock_queryset
+    )
 
     repo = BookRepository()
     result = repo.get_all()
 
+    # Relations come from two prefetch queries, not one query per book.
+    mock_prefetch.assert_called_once_with("authors", "categories")
     assert len(result) == 2
     assert isinstance(result[0], Book)
 
@@ -172,3 +180,225 @@ def test_delete_book_unexpected_exception(mocker):
     repo = BookRepository()
     with pytest.raises(Exception):
         repo.delete(1)
+
+
+def test_get_page_uses_keyset_and_prefetch(mocker, make_book_model):
+    mock_prefetch = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.prefetch_related")
+    ordered = mock_prefetch.return_value.order_by.return_value
+    ordered.filter.return_value.__getitem__ = mocker.Mock(return_value=[make_book_model(id=11), make_book_model(id=12)])
+
+    repo = BookRepository()
+    result = repo.get_page(after_id=10, limit=2)
+
+    mock_prefetch.assert_called_once_with("authors", "categories")
+    mock_prefetch.return_value.order_by.assert_called_once_with("id")
+    ordered.filter.assert_called_once_with(id__gt=10)
+    ordered.filter.return_value.__getitem__.assert_called_once_with(slice(None, 2))
+    assert [book.id for book in result] == [11, 12]
+
+
+def test_get_page_with_fields_defers_columns_and_skips_prefetch(mocker, make_book_model):
+    mock_only = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.only")
+    selected = mock_only.return_value.prefetch_related.return_value
+    obj = make_book_model(id=1)
+    selected.order_by.return_value.__getitem__ = mocker.Mock(return_value=[obj])
+
+    repo = BookRepository()
+    result = repo.get_page(after_id=None, limit=5, fields=frozenset({"title", "isbn"}))
+
+    mock_only.assert_called_once_with("id", "isbn", "title")
+    mock_only.return_value.prefetch_related.assert_called_once_with()
+    assert result[0].title == "Book Title"
+    assert result[0].synopsis is None
+    assert result[0].authors == []
+    obj.authors.all.assert_not_called()
+
+
+def test_get_page_first_page_skips_filter(mocker, make_book_model):
+    mock_prefetch = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.prefetch_related")
+    ordered = mock_prefetch.return_value.order_by.return_value
+    ordered.__getitem__ = mocker.Mock(return_value=[make_book_model()])
+
+    repo = BookRepository()
+    result = repo.get_page(after_id=None, limit=5)
+
+    ordered.filter.assert_not_called()
+    assert len(result) == 1
+
+
+def test_iterate_all_streams_in_chunks(mocker, make_book_model):
+    mock_prefetch = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.prefetch_related")
+    ordered = mock_prefetch.return_value.order_by.return_value
+    ordered.iterator.return_value = iter([make_book_model(id=1), make_book_model(id=2)])
+
+    repo = BookRepository()
+    result = list(repo.iterate_all(chunk_size=100))
+
+    ordered.iterator.assert_called_once_with(chunk_size=100)
+    assert [book.id for book in result] == [1, 2]
+
+
+def test_iterate_all_updated_since_includes_renamed_authors_and_categories(mocker, make_book_model):
+    mock_prefetch = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.prefetch_related")
+    ordered = mock_prefetch.return_value.order_by.return_value
+    ordered.filter.return_value.distinct.return_value.iterator.return_value = iter([make_book_model(id=3)])
+    since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    repo = BookRepository()
+    result = list(repo.iterate_all(chunk_size=100, updated_since=since))
+
+    ordered.filter.assert_called_once_with(
+        Q(updated_at__gte=since) | Q(authors__updated_at__gte=since) | Q(categories__updated_at__gte=since)
+    )
+    assert [book.id for book in result] == [3]
+
+
+def test_update_book_touches_updated_at(mocker, make_book_model):
+    mock_filter = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.filter")
+    mock_filter.return_value.update.return_value = 1
+    mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.get", return_value=make_book_model())
+
+    repo = BookRepository()
+    repo.update(1, repo._to_entity(make_book_model()))
+
+    assert mock_filter.return_value.update.call_args.kwargs["updated_at"] is not None
+
+
+@pytest.fixture
+def bulk_create_mocks(mocker):
+    mocks = mocker.Mock()
+    mocks.filter = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.filter")
+    mocks.filter.return_value.values_list.return_value = ["existing"]
+    mocks.authors = mocker.patch("book.infrastructure.repository.book_repository.AuthorModel.objects.in_bulk")
+    mocks.authors.return_value = {1: mocker.Mock(id=1)}
+    mocks.categories = mocker.patch(
+        "book.infrastructure.repository.book_repository.BookCategoryModel.objects.in_bulk"
+    )
+    mocks.categories.return_value = {2: mocker.Mock(id=2)}
+    mocks.bulk_create = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.bulk_create")
+    mocks.bulk_create.side_effect = lambda objs: [mocker.Mock(id=100 + i) for i, _ in enumerate(objs)]
+    mocks.author_links = mocker.patch.object(BookModel.authors.through, "objects")
+    mocks.category_links = mocker.patch.object(BookModel.categories.through, "objects")
+    mocker.patch("book.infrastructure.repository.book_repository.transaction.atomic", return_value=mocker.MagicMock())
+    return mocks
+
+
+def test_bulk_create_reports_per_item(make_book_model, bulk_create_mocks):
+    repo = BookRepository()
+    template = repo._to_entity(make_book_model())
+    books = [
+        Book(**{**template.__dict__, "isbn": "new-1", "authors": [1, 1], "categories": [2]}),
+        Book(**{**template.__dict__, "isbn": "existing", "authors": [1], "categories": []}),
+        Book(**{**template.__dict__, "isbn": "new-1", "authors": [1], "categories": []}),
+        Book(**{**template.__dict__, "isbn": "new-2", "authors": [99], "categories": []}),
+    ]
+
+    results = repo.bulk_create(books)
+
+    assert [r.status for r in results] == ["created", "skipped", "skipped", "failed"]
+    assert results[0].id == 100
+    assert results[0].book.authors == [bulk_create_mocks.authors.return_value[1]]
+    assert results[1].error == "ISBN already exists"
+    assert results[2].error == "Duplicate ISBN in batch"
+    assert "99" in results[3].error
+    author_links = bulk_create_mocks.author_links.bulk_create.call_args.args[0]
+    assert [(link.bookmodel_id, link.authormodel_id) for link in author_links] == [(100, 1)]
+    category_links = bulk_create_mocks.category_links.bulk_create.call_args.args[0]
+    assert [(link.bookmodel_id, link.bookcategorymodel_id) for link in category_links] == [(100, 2)]
+
+
+def test_bulk_create_nothing_to_insert(make_book_model, bulk_create_mocks):
+    repo = BookRepository()
+    book = repo._to_entity(make_book_model(isbn="existing"))
+
+    results = repo.bulk_create([book])
+
+    assert results[0].status == "skipped"
+    bulk_create_mocks.bulk_create.assert_not_called()
+
+
+def test_search_trigram_delegates_to_query_object(mocker, make_book_model):
+    mock_search = mocker.patch("book.infrastructure.repository.book_repository.BookTrigramSearch")
+    mock_search.return_value.run.return_value = (1, [make_book_model()], {"language": []})
+
+    repo = BookRepository()
+    total, books, facets = repo.search_trigram("book", {"language": "English"}, limit=10, offset=20, facets=["language"])
+
+    mock_search.assert_called_once_with("book")
+    assert mock_search.return_value.run.call_args.args == ({"language": "English"}, 10, 20, ["language"], 10)
+    assert facets == {"language": []}
+    assert total == 1
+    assert books[0].title == "Book Title"
+
+
+def test_search_trigram_pushes_fieldset_into_page_query(mocker, make_book_model):
+    mock_search = mocker.patch("book.infrastructure.repository.book_repository.BookTrigramSearch")
+    obj = make_book_model()
+    mock_search.return_value.run.return_value = (1, [obj], {})
+    page = mocker.Mock()
+
+    repo = BookRepository()
+    _, books, _ = repo.search_trigram("book", {}, limit=10, fields=frozenset({"title"}))
+    mock_search.return_value.run.call_args.kwargs["shape"](page)
+
+    page.only.assert_called_once_with("id", "title")
+    page.only.return_value.prefetch_related.assert_called_once_with()
+    assert books[0].title == "Book Title"
+    assert books[0].isbn is None
+    obj.authors.all.assert_not_called()
+
+
+def test_update_invalidates_cache(mocker, make_book_model, shared_book_cache):
+    mock_filter = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.filter")
+    mock_filter.return_value.update.return_value = 1
+    mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.get", return_value=make_book_model())
+
+    repo = BookRepository()
+    repo.cache.set(1, {"id": 1}, ResourceVersion(last_modified=None, count=1))
+    repo.update(1, repo._to_entity(make_book_model()))
+
+    assert repo.cache.get(1) is None
+
+
+def test_delete_invalidates_cache(mocker, shared_book_cache):
+    mock_filter = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.filter")
+    mock_filter.return_value.delete.return_value = (1, {})
+
+    repo = BookRepository()
+    repo.cache.set(1, {"id": 1}, ResourceVersion(last_modified=None, count=1))
+    repo.delete(1)
+
+    assert repo.cache.get(1) is None
+
+
+def test_suggest_prefix_reads_titles_and_authors(mocker):
+    mock_books = mocker.patch("book.infrastructure.repository.book_model.BookModel.objects.filter")
+    mock_books.return_value.order_by.return_value.values_list.return_value = ["Clean Code", "Clean Code"]
+    mock_authors = mocker.patch("book.infrastructure.repository.book_repository.AuthorModel.objects.filter")
+    mock_authors.return_value.order_by.return_value.values_list.return_value = ["Clean Author"]
+
+    titles, authors = BookRepository().suggest_prefix("cle", 5)
+
+    mock_books.assert_called_once_with(title__istartswith="cle")
+    mock_authors.assert_called_once_with(name__istartswith="cle")
+    assert (titles, authors) == (["Clean Code"], ["Clean Author"])
+
+
+def test_get_version_of_list_covers_books_authors_and_categories(mocker):
+    older, newer = datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 2, 1, tzinfo=timezone.utc)
+    for model, stamp, count in (("BookModel", older, 10), ("AuthorModel", newer, 3), ("BookCategoryModel", None, 0)):
+        objects = mocker.patch(f"book.infrastructure.repository.book_repository.{model}.objects")
+        objects.aggregate.return_value = {"last_modified": stamp, "count": count}
+
+    assert BookRepository().get_version() == ResourceVersion(last_modified=newer, count=13)
+
+
+def test_get_version_of_book_includes_its_relations(mocker):
+    stamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    mock_filter = mocker.patch("book.infrastructure.repository.book_repository.BookModel.objects.filter")
+    mock_filter.return_value.aggregate.return_value = {
+        "book": stamp, "authors": None, "categories": stamp, "books": 1, "author_count": 0, "category_count": 2,
+    }
+
+    assert BookRepository().get_version(5) == ResourceVersion(last_modified=stamp, count=3)
+    mock_filter.assert_called_once_with(id=5)
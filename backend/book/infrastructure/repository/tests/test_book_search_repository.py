@@ -1,4 +1,12 @@
+import threading
+
 import pytest
+from elastic_transport import ApiResponseMeta
+from elasticsearch import ApiError, ConnectionError
+
+from author.domain.author_entities import Author
+from book.domain.book_entities import Book
+from book_category.domain.book_category_entities import BookCategory
 from book.infrastructure.repository.book_search_repository import BookSearchRepository
 
 
@@ -7,6 +15,11 @@ def repository():
     return BookSearchRepository()
 
 
+@pytest.fixture(autouse=True)
+def es_client(mocker):
+    return mocker.patch("book.infrastructure.repository.book_search_repository.get_es_client").return_value
+
+
 @pytest.fixture
 def make_book_index_data():
     def _make(**overrides):
@@ -23,9 +36,9 @@ def make_book_index_data():
     return _make
 
 
-def test_index_book_success(mocker, repository, make_book_index_data):
+def test_index_book_success(mocker, repository, make_book_index_data, es_client):
     book = make_book_index_data()
-    mock_index = mocker.patch("book.infrastructure.repository.book_search_repository.es_client.index")
+    mock_index = mocker.patch.object(es_client, "index")
     log_spy = mocker.spy(repository.logger, "info")
 
     repository.index_book(book)
@@ -34,9 +47,9 @@ def test_index_book_success(mocker, repository, make_book_index_data):
     log_spy.assert_any_call("[BookSearchRepository] Book 1234567890123 indexed successfully")
 
 
-def test_index_book_failure(mocker, repository, make_book_index_data):
+def test_index_book_failure(mocker, repository, make_book_index_data, es_client):
     book = make_book_index_data()
-    mocker.patch("book.infrastructure.repository.book_search_repository.es_client.index", side_effect=Exception("ES error"))
+    mocker.patch.object(es_client, "index", side_effect=Exception("ES error"))
     log_spy = mocker.spy(repository.logger, "exception")
 
     with pytest.raises(Exception):
@@ -45,7 +58,7 @@ def test_index_book_failure(mocker, repository, make_book_index_data):
     log_spy.assert_called_once_with("[BookSearchRepository] Failed to index book 1234567890123")
 
 
-def test_search_books_success(mocker, repository):
+def test_search_books_success(mocker, repository, es_client):
     mock_response = {
         "hits": {
             "hits": [
@@ -54,7 +67,7 @@ def test_search_books_success(mocker, repository):
             ]
         }
     }
-    mock_search = mocker.patch("book.infrastructure.repository.book_search_repository.es_client.search", return_value=mock_response)
+    mock_search = mocker.patch.object(es_client, "search", return_value=mock_response)
     log_spy = mocker.spy(repository.logger, "info")
 
     results = repository.search_books("Book")
@@ -65,8 +78,8 @@ def test_search_books_success(mocker, repository):
     log_spy.assert_any_call("[BookSearchRepository] Found 2 results for query: 'Book'")
 
 
-def test_search_books_failure(mocker, repository):
-    mocker.patch("book.infrastructure.repository.book_search_repository.es_client.search", side_effect=Exception("Search failed"))
+def test_search_books_failure(mocker, repository, es_client):
+    mocker.patch.object(es_client, "search", side_effect=Exception("Search failed"))
     log_spy = mocker.spy(repository.logger, "exception")
 
     with pytest.raises(Exception):
@@ -75,8 +88,8 @@ def test_search_books_failure(mocker, repository):
     log_spy.assert_called_once_with("[BookSearchRepository] Failed to search books with query: 'Book'")
 
 
-def test_delete_book_success(mocker, repository):
-    mock_delete = mocker.patch("book.infrastructure.repository.book_search_repository.es_client.delete")
+def test_delete_book_success(mocker, repository, es_client):
+    mock_delete = mocker.patch.object(es_client, "delete")
     log_spy = mocker.spy(repository.logger, "info")
 
     repository.delete_book("1234567890123")
@@ -85,11 +98,313 @@ def test_delete_book_success(mocker, repository):
     log_spy.assert_any_call("[BookSearchRepository] Book 1234567890123 deleted from index")
 
 
-def test_delete_book_failure(mocker, repository):
-    mocker.patch("book.infrastructure.repository.book_search_repository.es_client.delete", side_effect=Exception("Delete error"))
+def test_delete_book_failure(mocker, repository, es_client):
+    mocker.patch.object(es_client, "delete", side_effect=Exception("Delete error"))
     log_spy = mocker.spy(repository.logger, "exception")
 
     with pytest.raises(Exception):
         repository.delete_book("1234567890123")
 
     log_spy.assert_called_once_with("[BookSearchRepository] Failed to delete book with ISBN 1234567890123")
+
+
+def test_bulk_apply_success(mocker, repository):
+    actions = [{"_op_type": "index", "_id": "1", "_source": {}}, {"_op_type": "delete", "_id": "2"}]
+    mock_bulk = mocker.patch(
+        "book.infrastructure.repository.book_search_repository.bulk", return_value=(2, [])
+    )
+
+    errors = repository.bulk_apply(actions)
+
+    assert errors == []
+    assert mock_bulk.call_args.args[1] == actions
+    assert mock_bulk.call_args.kwargs == {"index": "books", "raise_on_error": False}
+
+
+def test_bulk_apply_failure(mocker, repository):
+    mocker.patch(
+        "book.infrastructure.repository.book_search_repository.bulk", side_effect=Exception("ES error")
+    )
+    log_spy = mocker.spy(repository.logger, "exception")
+
+    with pytest.raises(Exception):
+        repository.bulk_apply([{"_op_type": "delete", "_id": "1"}])
+
+    log_spy.assert_called_once_with("[BookSearchRepository] Failed to apply 1 bulk actions")
+
+
+def test_to_document():
+    book = Book(
+        id=1, title="Sample Book", isbn="1234567890123", publisher="P", edition="1st",
+        language="English", book_type="physical", synopsis="A sample book.",
+        publication_date="2023-01-01", authors=[Author(id=1, name="Author One")],
+        categories=[BookCategory(id=2, name="Category A")],
+    )
+
+    document = BookSearchRepository.to_document(book)
+
+    assert document["authors"] == ["Author One"]
+    assert document["categories"] == ["Category A"]
+    assert document["isbn"] == "1234567890123"
+
+
+def test_search_with_filters_and_highlight(mocker, repository, es_client):
+    mock_response = {
+        "hits": {
+            "total": {"value": 5},
+            "hits": [
+                {"_source": {"id": 1, "title": "Book 1"}, "highlight": {"title": ["<em>Book</em> 1"]}, "sort": [2.0, 1]},
+                {"_source": {"id": 2, "title": "Book 2"}, "sort": [1.5, 2]},
+            ]
+        }
+    }
+    mock_search = mocker.patch.object(es_client, "search", return_value=mock_response
+    )
+
+    total, hits, last_sort, facets = repository.search("Book", {"language": "English", "category": None}, size=2, offset=4)
+
+    params = mock_search.call_args.kwargs
+    assert params["from_"] == 4
+    assert params["size"] == 2
+    assert params["source"] == BookSearchRepository.HIT_FIELDS
+    assert params["query"]["bool"]["filter"] == [{"term": {"language.raw": "English"}}]
+    assert total == 5
+    assert hits[0]["highlight"] == {"title": ["<em>Book</em> 1"]}
+    assert hits[1]["highlight"] == {}
+    assert last_sort == [1.5, 2]
+
+
+def test_search_with_search_after(mocker, repository, es_client):
+    mock_response = {"hits": {"total": {"value": 3}, "hits": [{"_source": {"id": 3}, "sort": [1.0, 3]}]}}
+    mock_search = mocker.patch.object(es_client, "search", return_value=mock_response
+    )
+
+    total, hits, last_sort, _ = repository.search("Book", {}, size=2, search_after=[1.5, 2])
+
+    params = mock_search.call_args.kwargs
+    assert params["search_after"] == [1.5, 2]
+    assert "from_" not in params
+    assert last_sort is None
+
+
+def test_search_failure(mocker, repository, es_client):
+    mocker.patch.object(es_client, "search", side_effect=Exception("ES error")
+    )
+
+    with pytest.raises(Exception):
+        repository.search("Book", {}, size=10)
+
+
+def test_parallel_index_targets_given_index(mocker, repository, es_client):
+    mock_streaming = mocker.patch(
+        "book.infrastructure.repository.book_search_repository.streaming_bulk",
+        side_effect=lambda client, actions, **kwargs: ((True, {"index": a}) for a in actions),
+    )
+    documents = [{"isbn": str(i)} for i in range(5)]
+
+    results = list(repository.parallel_index("books_v2", documents, thread_count=2, chunk_size=2))
+
+    assert [item["index"] for _, item in results] == [
+        {"_index": "books_v2", "_id": str(i), "_source": {"isbn": str(i)}} for i in range(5)
+    ]
+    assert [len(call.args[1]) for call in mock_streaming.call_args_list] == [2, 2, 1]
+    assert mock_streaming.call_args.kwargs == {"chunk_size": 1, "raise_on_error": False}
+
+
+def test_parallel_index_reads_documents_on_the_calling_thread(mocker, repository, es_client):
+    mocker.patch(
+        "book.infrastructure.repository.book_search_repository.streaming_bulk",
+        side_effect=lambda client, actions, **kwargs: ((True, {}) for _ in actions),
+    )
+    readers = set()
+
+    def documents():
+        for i in range(10):
+            readers.add(threading.get_ident())
+            yield {"isbn": str(i)}
+
+    list(repository.parallel_index("books_v2", documents(), thread_count=4, chunk_size=3))
+
+    assert readers == {threading.get_ident()}
+
+
+def test_document_ids_scans_index(mocker, repository, es_client):
+    mock_scan = mocker.patch(
+        "book.infrastructure.repository.book_search_repository.scan", return_value=iter([{"_id": "1"}, {"_id": "2"}])
+    )
+
+    assert repository.document_ids("books_v2") == {"1", "2"}
+    assert mock_scan.call_args.kwargs["index"] == "books_v2"
+    assert mock_scan.call_args.kwargs["_source"] is False
+
+
+def test_delete_documents_ignores_missing_documents(mocker, repository, es_client):
+    mock_bulk = mocker.patch(
+        "book.infrastructure.repository.book_search_repository.bulk",
+        return_value=(1, [{"delete": {"_id": "2", "status": 404}}]),
+    )
+
+    repository.delete_documents("books", ["1", "2"])
+
+    assert list(mock_bulk.call_args.args[1]) == [
+        {"_op_type": "delete", "_index": "books", "_id": "1"},
+        {"_op_type": "delete", "_index": "books", "_id": "2"},
+    ]
+
+
+def test_delete_documents_raises_on_failures(mocker, repository, es_client):
+    mocker.patch(
+        "book.infrastructure.repository.book_search_repository.bulk",
+        return_value=(0, [{"delete": {"_id": "1", "status": 500}}]),
+    )
+
+    with pytest.raises(RuntimeError):
+        repository.delete_documents("books", ["1"])
+
+
+def test_create_versioned_index_disables_refresh(repository, es_client):
+    name = repository.create_versioned_index()
+
+    assert name.startswith("books_")
+    es_client.indices.create.assert_called_once_with(
+        index=name, settings={"number_of_replicas": 0, "refresh_interval": "-1"}
+    )
+
+
+def test_swap_alias_moves_existing_alias(repository, es_client):
+    es_client.indices.exists_alias.return_value = True
+    es_client.indices.get_alias.return_value = {"books_old": {"aliases": {"books": {}}}}
+
+    previous = repository.swap_alias("books_new")
+
+    assert previous == ["books_old"]
+    es_client.indices.update_aliases.assert_called_once_with(actions=[
+        {"remove": {"index": "books_old", "alias": "books"}},
+        {"add": {"index": "books_new", "alias": "books"}},
+    ])
+
+
+def test_swap_alias_replaces_concrete_index(repository, es_client):
+    es_client.indices.exists_alias.return_value = False
+    es_client.indices.exists.return_value = True
+
+    previous = repository.swap_alias("books_new")
+
+    assert previous == []
+    es_client.indices.update_aliases.assert_called_once_with(actions=[
+        {"remove_index": {"index": "books"}},
+        {"add": {"index": "books_new", "alias": "books"}},
+    ])
+
+
+def test_put_index_template_maps_books_fields(repository, es_client):
+    repository.put_index_template()
+
+    template = es_client.indices.put_index_template.call_args.kwargs
+    properties = template["template"]["mappings"]["properties"]
+    assert template["index_patterns"] == ["books", "books_*"]
+    assert properties["isbn"] == {"type": "keyword", "doc_values": False}
+    assert properties["publication_date"]["type"] == "date"
+    assert properties["categories"]["fields"]["keyword"]["type"] == "keyword"
+    assert properties["title"]["fields"]["autocomplete"]["analyzer"] == "book_autocomplete"
+    assert "normalizer" not in properties["language"]["fields"]["raw"]
+
+
+def test_autocomplete_matches_query_words_longer_than_max_gram(repository, es_client):
+    repository.put_index_template()
+
+    template = es_client.indices.put_index_template.call_args.kwargs["template"]
+    analysis = template["settings"]["analysis"]
+    autocomplete = template["mappings"]["properties"]["title"]["fields"]["autocomplete"]
+    word = "internationalization"
+
+    # Replay the edge-ngram filter at index time and the search analyzer's filters at query time.
+    ngram = analysis["filter"]["book_edge_ngram"]
+    indexed = {word[:size] for size in range(ngram["min_gram"], min(len(word), ngram["max_gram"]) + 1)}
+    query = word
+    for name in analysis["analyzer"][autocomplete["search_analyzer"]]["filter"]:
+        step = analysis["filter"].get(name, {})
+        if step.get("type") == "truncate":
+            query = query[:step["length"]]
+
+    assert len(word) > ngram["max_gram"]
+    assert query in indexed
+
+
+def test_ensure_index_creates_aliased_index_when_missing(repository, es_client):
+    es_client.indices.exists.return_value = False
+
+    name = repository.ensure_index()
+
+    es_client.indices.put_index_template.assert_called_once()
+    es_client.indices.create.assert_called_once_with(index=name, aliases={"books": {}})
+
+
+def test_ensure_index_keeps_existing_index(repository, es_client):
+    es_client.indices.exists.return_value = True
+
+    assert repository.ensure_index() is None
+    es_client.indices.create.assert_not_called()
+
+
+def test_suggest_returns_titles_and_matching_authors(repository, es_client):
+    es_client.msearch.return_value = {"responses": [
+        {"hits": {"hits": [{"_source": {"title": "Clean Code"}}, {"_source": {"title": "Clean Code"}},
+                           {"_source": {"title": "Clean Architecture"}}]}},
+        {"aggregations": {"authors": {"buckets": [
+            {"key": "Robert C. Martin", "doc_count": 3},
+            {"key": "Dean Wampler", "doc_count": 1},
+            {"key": "Róbert Ász", "doc_count": 1},
+        ]}}},
+    ]}
+
+    titles, authors = repository.suggest("rob", 5)
+
+    assert titles == ["Clean Code", "Clean Architecture"]
+    assert authors == ["Robert C. Martin", "Róbert Ász"]
+    searches = es_client.msearch.call_args.kwargs["searches"]
+    assert searches[1]["query"] == {"match": {"title.autocomplete": {"query": "rob", "operator": "and"}}}
+    assert searches[3]["aggs"]["authors"]["terms"] == {"field": "authors.keyword", "size": 25}
+
+
+def test_suggest_raises_on_failed_response(repository, es_client):
+    es_client.msearch.return_value = {"responses": [{"error": {"type": "index_not_found_exception"}}, {}]}
+
+    with pytest.raises(RuntimeError):
+        repository.suggest("rob", 5)
+
+
+def test_search_with_facets_and_empty_query(repository, es_client):
+    es_client.search.return_value = {
+        "hits": {"total": {"value": 3}, "hits": []},
+        "aggregations": {
+            "language": {"buckets": [{"key": "English", "doc_count": 2}, {"key": "Portuguese", "doc_count": 1}]},
+            "author": {"buckets": [{"key": "Robert C. Martin", "doc_count": 2}]},
+        },
+    }
+
+    total, _, _, facets = repository.search("", {}, size=10, facets=["language", "author"], facet_size=5)
+
+    params = es_client.search.call_args.kwargs
+    assert params["query"]["bool"]["must"] == [{"match_all": {}}]
+    assert params["aggs"] == {
+        "language": {"terms": {"field": "language.raw", "size": 5}},
+        "author": {"terms": {"field": "authors.keyword", "size": 5}},
+    }
+    assert facets == {
+        "language": [{"value": "English", "count": 2}, {"value": "Portuguese", "count": 1}],
+        "author": [{"value": "Robert C. Martin", "count": 2}],
+    }
+
+
+@pytest.mark.parametrize("error, expected", [
+    (ConnectionError("unreachable"), True),
+    (ApiError("unavailable", meta=ApiResponseMeta(503, "1.1", {}, 0.1, None), body={}), True),
+    (ApiError("bad request", meta=ApiResponseMeta(400, "1.1", {}, 0.1, None), body={}), False),
+    (429, True),
+    (400, False),
+    (None, False),
+    (ValueError("bad"), False),
+])
+def test_is_unavailable(error, expected):
+    assert BookSearchRepository.is_unavailable(error) is expected
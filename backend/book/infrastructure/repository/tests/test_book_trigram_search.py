@@ -0,0 +1,73 @@
+import pytest
+
+from book.infrastructure.repository.book_trigram_search import BookTrigramSearch
+
+
+@pytest.fixture
+def mock_cursor(mocker):
+    mocker.patch(
+        "book.infrastructure.repository.book_trigram_search.transaction.atomic", return_value=mocker.MagicMock()
+    )
+    mock_connection = mocker.patch("book.infrastructure.repository.book_trigram_search.connection")
+    return mock_connection.cursor.return_value.__enter__.return_value
+
+
+def test_queryset_uses_indexable_operators():
+    sql = str(BookTrigramSearch("clean").queryset({}).query)
+
+    assert '"title" % clean' in sql
+    assert '"synopsis" %> clean' in sql
+    assert '"name" % clean' in sql
+    assert "UNION" in sql
+
+
+def test_queryset_applies_filters():
+    sql = str(BookTrigramSearch("clean").queryset(
+        {"language": "English", "book_type": "ebook", "category": "Software"}
+    ).query)
+
+    assert '"language" = English' in sql
+    assert '"book_type" = ebook' in sql
+    assert '"name" = Software' in sql
+
+
+def test_run_sets_threshold_and_limits(mocker, mock_cursor, settings):
+    settings.BOOK_TRIGRAM_THRESHOLD = 0.4
+    search = BookTrigramSearch("clean")
+    mock_queryset = mocker.patch.object(search, "queryset").return_value
+    mock_queryset.count.return_value = 42
+    ordered = mock_queryset.prefetch_related.return_value.order_by.return_value
+    ordered.__getitem__ = mocker.Mock(return_value=["book"])
+
+    total, objs, facets = search.run({}, limit=10, offset=30)
+
+    assert mock_cursor.execute.call_args.args[1] == ["0.4", "0.4"]
+    mock_queryset.prefetch_related.return_value.order_by.assert_called_once_with("-similarity", "id")
+    ordered.__getitem__.assert_called_once_with(slice(30, 40))
+    assert total == 42
+    assert objs == ["book"]
+    assert facets == {}
+
+
+def test_explicit_threshold_overrides_settings():
+    assert BookTrigramSearch("clean", threshold=0.6).threshold == 0.6
+
+
+def test_empty_query_browses_without_trigram_operators():
+    sql = str(BookTrigramSearch("").queryset({"author": "Robert C. Martin"}).query)
+
+    assert "%" not in sql
+    assert '"name" = Robert C. Martin' in sql
+
+
+
+def test_facet_querysets_group_by_book_and_through_tables():
+    search = BookTrigramSearch("clean")
+
+    querysets = search.facet_querysets(search.queryset({}), ["language", "category", "author"], size=5)
+
+    language_sql = str(querysets["language"].query)
+    assert '"book_bookmodel"."language" AS "value", COUNT(*) AS "count"' in language_sql
+    assert "GROUP BY 1 ORDER BY 2 DESC, 1 ASC LIMIT 5" in language_sql
+    assert 'FROM "book_bookmodel_categories"' in str(querysets["category"].query)
+    assert 'FROM "book_bookmodel_authors"' in str(querysets["author"].query)
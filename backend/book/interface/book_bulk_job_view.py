@@ -0,0 +1,30 @@
+import logging
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from book.application.queries.book_queries import BookQueries
+from book.interface.serializer.book_bulk_job_output_serializer import BookBulkJobOutputSerializer
+
+
+class BookBulkJobView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.book_queries = BookQueries()
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, request, job_id):
+        self.logger.info(f"[BookBulkJobView] GET /book/bulk/{job_id} requested")
+        try:
+            job = self.book_queries.get_bulk_job(str(job_id))
+        except Exception:
+            self.logger.exception(f"[BookBulkJobView] Error retrieving bulk job {job_id}")
+            return Response({"detail": "Error retrieving bulk job"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        if job is None:
+            return Response({"detail": "Bulk job not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(BookBulkJobOutputSerializer(job).data)
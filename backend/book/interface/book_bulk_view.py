@@ -0,0 +1,65 @@
+import logging
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from book.application.commands.book_commands import BookCommands
+from book.domain.book_entities import Book
+from book.interface.serializer.book_input_serializer import BookInputSerializer
+
+
+class BookBulkView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.book_commands = BookCommands()
+        self.logger = logging.getLogger(__name__)
+
+    def post(self, request):
+        items = request.data
+        if not isinstance(items, list):
+            self.logger.warning("[BookBulkView] POST /book/bulk body is not a list")
+            return Response({"detail": "Expected a list of books"}, status=status.HTTP_400_BAD_REQUEST)
+
+        self.logger.info(f"[BookBulkView] POST /book/bulk with {len(items)} items")
+        if len(items) > settings.BOOK_BULK_MAX_ITEMS:
+            return Response(
+                {"detail": f"At most {settings.BOOK_BULK_MAX_ITEMS} books per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        books = []
+        errors = []
+        for index, item in enumerate(items):
+            serializer = BookInputSerializer(data=item, context={'request': request})
+            if serializer.is_valid():
+                books.append((index, Book(**serializer.validated_data)))
+            else:
+                errors.append({"index": index, "errors": serializer.errors})
+
+        if errors:
+            self.logger.warning(f"[BookBulkView] {len(errors)} of {len(items)} items failed validation")
+
+        try:
+            job = self.book_commands.create_many(books, errors) if books else None
+        except Exception:
+            self.logger.exception("[BookBulkView] Error queuing book batch")
+            return Response({"detail": "Error queuing books"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # Per-item outcomes (created, skipped, failed) are filled in by the workers under the job.
+        response = Response(
+            {
+                "job": job.id if job else None,
+                "queued": len(books),
+                "batches": job.batches if job else 0,
+                "errors": errors,
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+        if job:
+            response["Location"] = f"{request.path.rstrip('/')}/{job.id}/"
+        return response
@@ -0,0 +1,91 @@
+import logging
+from typing import AsyncIterator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import APIView
+
+from book.application.queries.book_queries import BookQueries
+from book.domain.book_entities import Book
+from book.interface.renderer.ndjson_renderer import NDJSONRenderer
+from book.interface.serializer.book_output_serializer import book_output_encoder
+
+
+class BookExportView(APIView):
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, NDJSONRenderer]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.book_queries = BookQueries()
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, request):
+        export_format = request.accepted_renderer.format
+        self.logger.info(f"[BookExportView] GET /book/export requested (format={export_format})")
+
+        chunk_size = settings.BOOK_EXPORT_CHUNK_SIZE
+        books = self.book_queries.iterate_all(chunk_size)
+        if export_format == NDJSONRenderer.format:
+            stream = self._stream_ndjson(books, chunk_size)
+        else:
+            stream = self._stream_json_array(books, chunk_size)
+        if isinstance(request._request, ASGIRequest):
+            # Django drains a sync iterator into a list under ASGI; fetch one chunk at a time instead.
+            stream = self._stream_async(stream)
+
+        response = StreamingHttpResponse(stream, content_type=request.accepted_renderer.media_type)
+        response["Content-Disposition"] = f'attachment; filename="books.{export_format}"'
+        return response
+
+    def _stream_ndjson(self, books: Iterable[Book], chunk_size: int) -> Iterator[str]:
+        buffer = []
+        for book in self._rows(books):
+            buffer.append(NDJSONRenderer.render_row(book))
+            if len(buffer) >= chunk_size:
+                yield "".join(buffer)
+                buffer = []
+        if buffer:
+            yield "".join(buffer)
+
+    def _stream_json_array(self, books: Iterable[Book], chunk_size: int) -> Iterator[str]:
+        yield "["
+        buffer = []
+        separator = ""
+        for book in self._rows(books):
+            buffer.append(separator + NDJSONRenderer.render_row(book).rstrip("\n"))
+            separator = ","
+            if len(buffer) >= chunk_size:
+                yield "".join(buffer)
+                buffer = []
+        if buffer:
+            yield "".join(buffer)
+        yield "]"
+
+    @staticmethod
+    async def _stream_async(stream: Iterator[str]) -> AsyncIterator[str]:
+        # thread_sensitive keeps every chunk on the request's thread, so the server-side cursor
+        # stays on one connection.
+        next_chunk = sync_to_async(next, thread_sensitive=True)
+        done = object()
+        try:
+            while (chunk := await next_chunk(stream, done)) is not done:
+                yield chunk
+        finally:
+            await sync_to_async(stream.close, thread_sensitive=True)()
+
+    def _rows(self, books: Iterable[Book]) -> Iterator[dict]:
+        encode = book_output_encoder()
+        count = 0
+        try:
+            for book in books:
+                yield encode(book)
+                count += 1
+        except Exception:
+            self.logger.exception(f"[BookExportView] Export aborted after {count} books")
+            raise
+        self.logger.info(f"[BookExportView] Exported {count} books")
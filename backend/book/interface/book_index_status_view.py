@@ -0,0 +1,36 @@
+import logging
+
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from book.application.commands.book_commands import BookCommands
+from book.application.queries.book_queries import BookQueries
+
+
+class BookIndexStatusView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.book_commands = BookCommands()
+        self.book_queries = BookQueries()
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, request):
+        self.logger.info("[BookIndexStatusView] GET /book/index-status requested")
+        try:
+            return Response(self.book_queries.get_index_status())
+        except Exception:
+            self.logger.exception("[BookIndexStatusView] Error reading index queue stats")
+            return Response({"detail": "Error reading index status"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def post(self, request):
+        self.logger.info("[BookIndexStatusView] POST /book/index-status requeue requested")
+        try:
+            requeued = self.book_commands.requeue_index_dead_letters()
+        except Exception:
+            self.logger.exception("[BookIndexStatusView] Error requeuing dead-lettered mutations")
+            return Response({"detail": "Error requeuing index mutations"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response({"requeued": requeued})
@@ -0,0 +1,67 @@
+import logging
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from book.application.queries.book_queries import BookQueries
+from book.infrastructure.repository.book_search_repository import BookSearchRepository
+from book.interface.serializer.book_search_output_serializer import BookSearchOutputSerializer
+from config.pagination import resolve_page_size
+
+
+class BookSearchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.book_queries = BookQueries()
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        self.logger.info(f"[BookSearchView] GET /book/search requested: '{query}'")
+        facets = [name for name in request.query_params.get("facets", "").split(",") if name]
+        # Browse pages may ask for facets over the whole catalog without a query.
+        if not query and not facets:
+            return Response({"detail": "Query parameter 'q' is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        filters = {name: request.query_params.get(name) for name in BookSearchRepository.FILTER_FIELDS}
+        try:
+            invalid = [name for name in facets if name not in BookSearchRepository.FACET_FIELDS]
+            if invalid:
+                raise ValueError(f"Invalid facets: {', '.join(invalid)}")
+            size = self._parse_size(request.query_params.get("size"))
+            page = self._parse_page(request.query_params.get("page", "1"), size)
+            result = self.book_queries.search(
+                query, filters, size, page, request.query_params.get("cursor"), list(dict.fromkeys(facets))
+            )
+            data = BookSearchOutputSerializer(result).data
+        except ValueError as e:
+            self.logger.warning(f"[BookSearchView] Invalid search parameters: {e}")
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception:
+            self.logger.exception(f"[BookSearchView] Error searching books: '{query}'")
+            return Response({"detail": "Error searching books"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        self.logger.info(f"[BookSearchView] Returned {len(result.hits)} of {result.total} hits from {result.source}")
+        return Response(data)
+
+    # Fixed messages: the parsers' own errors would echo the raw input back to the client.
+    @staticmethod
+    def _parse_size(raw: str | None) -> int:
+        try:
+            return resolve_page_size(raw)
+        except ValueError:
+            raise ValueError("Invalid size") from None
+
+    @staticmethod
+    def _parse_page(raw: str, size: int) -> int:
+        try:
+            page = int(raw)
+        except ValueError:
+            raise ValueError("Invalid page") from None
+        if page < 1 or page * size > BookSearchRepository.MAX_RESULT_WINDOW:
+            raise ValueError("Invalid page")
+        return page
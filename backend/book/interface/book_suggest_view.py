@@ -0,0 +1,40 @@
+import logging
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from book.application.queries.book_queries import BookQueries
+from book.interface.serializer.book_suggest_output_serializer import BookSuggestOutputSerializer
+
+
+class BookSuggestView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.book_queries = BookQueries()
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, request):
+        prefix = request.query_params.get("q", "").strip()
+        self.logger.info(f"[BookSuggestView] GET /book/suggest requested: '{prefix}'")
+        if not prefix:
+            return Response({"detail": "Query parameter 'q' is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            size = int(request.query_params.get("size", settings.BOOK_SUGGEST_SIZE))
+            if size < 1:
+                raise ValueError
+        except ValueError:
+            return Response({"detail": "Invalid size"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            suggestions = self.book_queries.suggest(prefix, min(size, settings.BOOK_SUGGEST_MAX_SIZE))
+        except Exception:
+            self.logger.exception(f"[BookSuggestView] Error suggesting completions for '{prefix}'")
+            return Response({"detail": "Error suggesting books"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return Response(BookSuggestOutputSerializer(suggestions).data)
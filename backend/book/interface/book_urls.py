@@ -1,8 +1,20 @@
 from django.urls import path
 
+from .book_bulk_job_view import BookBulkJobView
+from .book_bulk_view import BookBulkView
+from .book_export_view import BookExportView
+from .book_index_status_view import BookIndexStatusView
+from .book_search_view import BookSearchView
+from .book_suggest_view import BookSuggestView
 from .book_view import BookView
 
 urlpatterns = [
     path('', BookView.as_view()),
+    path('bulk/', BookBulkView.as_view()),
+    path('bulk/<uuid:job_id>/', BookBulkJobView.as_view()),
+    path('export/', BookExportView.as_view()),
+    path('index-status/', BookIndexStatusView.as_view()),
+    path('search/', BookSearchView.as_view()),
+    path('suggest/', BookSuggestView.as_view()),
     path('<int:book_id>/', BookView.as_view()),
 ]
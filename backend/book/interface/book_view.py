@@ -4,14 +4,17 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from django.contrib.postgres.search import TrigramSimilarity
-from django.db.models import QuerySet
+from django.conf import settings
 
 from book.application.commands.book_commands import BookCommands
 from book.application.queries.book_queries import BookQueries
-from book.domain.book_entities import Book
+from book.domain.book_entities import BOOK_FIELDS, Book
+from book.infrastructure.cache.book_cache import BookCache
 from book.interface.serializer.book_input_serializer import BookInputSerializer
-from book.interface.serializer.book_output_serializer import BookOutputSerializer
+from book.interface.serializer.book_output_serializer import BookOutputSerializer, book_output_encoder
+from config.conditional import ConditionalGet, ResourceVersion
+from config.fieldsets import parse_fieldset
+from config.pagination import resolve_page_size
 
 
 class BookView(APIView):
@@ -21,34 +24,69 @@ class BookView(APIView):
         super().__init__(**kwargs)
         self.book_commands = BookCommands()
         self.book_queries = BookQueries()
+        self.book_cache = BookCache()
         self.logger = logging.getLogger(__name__)
 
     def get(self, request, book_id: int = None):
         self.logger.info(f"[BookView] GET /book/{book_id or ''} requested")
+        try:
+            fields = parse_fieldset(
+                request.query_params.get("fields"), request.query_params.get("exclude"), BOOK_FIELDS
+            )
+        except ValueError as e:
+            self.logger.warning(f"[BookView] Invalid fieldset: {e}")
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
+            # A cached book carries the version it was built from, and the catalogue version is
+            # cached on its own, so a hit needs no query at all.
+            if book_id:
+                cached = self.book_cache.get(book_id)
+                cached_version = cached[1] if cached else None
+            else:
+                cached, cached_version = None, self.book_cache.get_list_version()
+            version = cached_version or self.book_queries.get_version(book_id)
+            conditional = ConditionalGet(request, version, settings.BOOK_HTTP_CACHE_CONTROL)
+            not_modified = conditional.not_modified()
+            if not_modified is not None:
+                self.logger.info(f"[BookView] GET /book/{book_id or ''} not modified")
+                return not_modified
+
             if book_id:
-                book = self.book_queries.get_by_id(book_id)
-                if not book:
-                    self.logger.warning(f"[BookView] Book {book_id} not found")
-                    return Response({"detail": "Book not found"}, status=status.HTTP_404_NOT_FOUND)
-
-                serializer = BookOutputSerializer(book)
-                return Response(serializer.data)
-
-            search = request.query_params.get("search")
-            if search:
-                self.logger.info(f"[BookView] Applying fuzzy search: {search}")
-                queryset: QuerySet = self.book_queries.get_queryset()
-                books = queryset.annotate(
-                    similarity=TrigramSimilarity("title", search)
-                ).filter(similarity__gt=0.3).order_by("-similarity")
+                if cached:
+                    payload = cached[0]
+                else:
+                    book = self.book_queries.get_by_id(book_id)
+                    if not book:
+                        self.logger.warning(f"[BookView] Book {book_id} not found")
+                        return Response({"detail": "Book not found"}, status=status.HTTP_404_NOT_FOUND)
+
+                    payload = BookOutputSerializer(book).data
+                    self._cache_version(book_id, version, payload)
+                # The cache holds the full payload; sparse requests are cut from it.
+                if fields is not None:
+                    payload = {name: value for name, value in payload.items() if name in fields}
+                return conditional.apply(Response(payload))
+
+            if "cursor" in request.query_params or "limit" in request.query_params:
+                response = self._get_page(request, fields)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
             else:
-                books = self.book_queries.get_all()
+                search = request.query_params.get("search")
+                if search:
+                    self.logger.info(f"[BookView] Applying fuzzy search: {search}")
+                    books = self.book_queries.search_trigram(search, settings.API_MAX_PAGE_SIZE, fields)
+                else:
+                    books = self.book_queries.get_all(fields)
 
-            self.logger.info(f"[BookView] Returned {len(books)} books")
-            serializer = BookOutputSerializer(books, many=True)
-            return Response(serializer.data)
+                self.logger.info(f"[BookView] Returned {len(books)} books")
+                encode = book_output_encoder(fields)
+                response = Response([encode(book) for book in books])
+
+            if cached_version is None:
+                self._cache_version(None, version)
+            return conditional.apply(response)
 
         except Exception:
             if book_id:
@@ -57,6 +95,29 @@ class BookView(APIView):
             self.logger.exception("[BookView] Error retrieving book list")
             return Response({"detail": "Error retrieving book list"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _cache_version(self, book_id: int | None, version: ResourceVersion, payload: dict | None = None) -> None:
+        # The version was read before the data; if a write committed in between, caching would
+        # pin the newer data (or the catalogue) to the older ETag, so leave the cache empty.
+        if self.book_queries.get_version(book_id) != version:
+            self.logger.info(f"[BookView] Book {book_id or 'list'} changed while loading, not caching it")
+            return
+        if book_id:
+            self.book_cache.set(book_id, payload, version)
+        else:
+            self.book_cache.set_list_version(version)
+
+    def _get_page(self, request, fields: frozenset[str] | None):
+        try:
+            limit = resolve_page_size(request.query_params.get("limit"))
+            page = self.book_queries.get_page(request.query_params.get("cursor"), limit, fields)
+        except ValueError as e:
+            self.logger.warning(f"[BookView] Invalid pagination parameters: {e}")
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        self.logger.info(f"[BookView] Returned page with {len(page.items)} books")
+        encode = book_output_encoder(fields)
+        return Response({"results": [encode(book) for book in page.items], "next": page.next_cursor})
+
     def post(self, request):
         self.logger.info(f"[BookView] POST /book | Request data: {request.data}")
         serializer = BookInputSerializer(data=request.data, context={'request': request})
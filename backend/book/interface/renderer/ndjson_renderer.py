@@ -0,0 +1,20 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        return "".join(self.render_row(row) for row in rows).encode(self.charset)
+
+    @staticmethod
+    def render_row(row: dict) -> str:
+        return json.dumps(row, cls=JSONEncoder, ensure_ascii=False) + "\n"
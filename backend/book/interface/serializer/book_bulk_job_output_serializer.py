@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+
+class BookBulkItemResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    isbn = serializers.CharField()
+    status = serializers.CharField()
+    id = serializers.IntegerField(allow_null=True)
+    error = serializers.CharField(allow_null=True)
+
+
+class BookBulkJobOutputSerializer(serializers.Serializer):
+    job = serializers.CharField(source="id")
+    status = serializers.CharField()
+    total = serializers.IntegerField()
+    batches = serializers.IntegerField()
+    batches_done = serializers.IntegerField()
+    results = BookBulkItemResultSerializer(many=True)
+    errors = serializers.ListField(child=serializers.DictField())
@@ -1,10 +1,15 @@
+from functools import lru_cache
+from typing import Any, Callable
+
 from rest_framework import serializers
 
 from author.interface.serializer.author_output_serializer import AuthorOutputSerializer
 from book_category.interface.serializer.book_category_output_serializer import BookCategoryOutputSerializer
+from config.fast_serializer import compile_serializer
+from config.fieldsets import SparseFieldsetMixin
 
 
-class BookOutputSerializer(serializers.Serializer):
+class BookOutputSerializer(SparseFieldsetMixin, serializers.Serializer):
     id = serializers.IntegerField()
     title = serializers.CharField()
     isbn = serializers.CharField()
@@ -16,3 +21,9 @@ class BookOutputSerializer(serializers.Serializer):
     publication_date = serializers.DateField()
     authors = AuthorOutputSerializer(many=True)
     categories = BookCategoryOutputSerializer(many=True)
+
+
+@lru_cache(maxsize=64)
+def book_output_encoder(fields: frozenset[str] | None = None) -> Callable[[Any], dict]:
+    """Compiled BookOutputSerializer for list endpoints; same output as ``.data``, built once per fieldset."""
+    return compile_serializer(BookOutputSerializer(fields=fields))
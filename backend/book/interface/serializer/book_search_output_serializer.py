@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+
+class BookSearchHitSerializer(serializers.Serializer):
+    # Documents indexed before these fields were added lack them until the next reindex_books.
+    id = serializers.IntegerField(default=None, allow_null=True)
+    isbn = serializers.CharField()
+    title = serializers.CharField()
+    authors = serializers.ListField(child=serializers.CharField())
+    categories = serializers.ListField(child=serializers.CharField())
+    language = serializers.CharField(default=None, allow_null=True)
+    book_type = serializers.CharField(default=None, allow_null=True)
+    publication_date = serializers.DateField()
+    highlight = serializers.DictField(child=serializers.ListField(child=serializers.CharField()))
+
+
+class BookFacetBucketSerializer(serializers.Serializer):
+    value = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class BookSearchOutputSerializer(serializers.Serializer):
+    count = serializers.IntegerField(source="total")
+    results = BookSearchHitSerializer(source="hits", many=True)
+    next = serializers.CharField(source="next_cursor", allow_null=True)
+    source = serializers.CharField()
+    facets = serializers.DictField(child=BookFacetBucketSerializer(many=True))
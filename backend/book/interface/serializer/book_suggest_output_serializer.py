@@ -0,0 +1,7 @@
+from rest_framework import serializers
+
+
+class BookSuggestOutputSerializer(serializers.Serializer):
+    titles = serializers.ListField(child=serializers.CharField())
+    authors = serializers.ListField(child=serializers.CharField())
+    source = serializers.CharField()
@@ -0,0 +1,120 @@
+import pytest
+from rest_framework.test import APIClient
+
+from book.application.commands.book_commands import BookCommands
+from book.application.queries.book_queries import BookQueries
+from book.domain.book_entities import BookBulkJob
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock())
+    return client
+
+
+@pytest.fixture
+def make_book_data():
+    def _make(**overrides):
+        data = {
+            "title": "Clean Code",
+            "isbn": "1234567890123",
+            "publisher": "Prentice Hall",
+            "edition": "1st",
+            "language": "English",
+            "book_type": "Technical",
+            "synopsis": "A book about writing clean code.",
+            "publication_date": "2008-08-01",
+            "authors": [1],
+            "categories": [2],
+        }
+        data.update(overrides)
+        return data
+
+    return _make
+
+
+def test_bulk_create_queues_valid_books(client, mocker, make_book_data):
+    mock_create_many = mocker.patch.object(
+        BookCommands, "create_many", return_value=BookBulkJob(id="job-1", status="pending", total=3, batches=1)
+    )
+
+    response = client.post(
+        "/api/book/bulk/",
+        [make_book_data(), make_book_data(isbn="999"), {"title": "missing fields"}],
+        format="json",
+    )
+
+    assert response.status_code == 202
+    assert response.data["job"] == "job-1"
+    assert response["Location"] == "/api/book/bulk/job-1/"
+    assert response.data["queued"] == 2
+    assert response.data["batches"] == 1
+    assert response.data["errors"][0]["index"] == 2
+    assert "isbn" in response.data["errors"][0]["errors"]
+    books, errors = mock_create_many.call_args.args
+    assert [(index, book.isbn) for index, book in books] == [(0, "1234567890123"), (1, "999")]
+    assert errors == response.data["errors"]
+
+
+def test_bulk_create_all_invalid(client, mocker):
+    mock_create_many = mocker.patch.object(BookCommands, "create_many")
+
+    response = client.post("/api/book/bulk/", [{}], format="json")
+
+    assert response.status_code == 202
+    assert response.data["queued"] == 0
+    assert response.data["job"] is None
+    mock_create_many.assert_not_called()
+
+
+def test_bulk_create_requires_list(client):
+    response = client.post("/api/book/bulk/", {"title": "x"}, format="json")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Expected a list of books"
+
+
+def test_bulk_create_too_many_items(client, settings, make_book_data):
+    settings.BOOK_BULK_MAX_ITEMS = 1
+
+    response = client.post("/api/book/bulk/", [make_book_data(), make_book_data()], format="json")
+
+    assert response.status_code == 400
+
+
+def test_bulk_create_error(client, mocker, make_book_data):
+    mocker.patch.object(BookCommands, "create_many", side_effect=Exception("broker down"))
+
+    response = client.post("/api/book/bulk/", [make_book_data()], format="json")
+
+    assert response.status_code == 500
+    assert response.data["detail"] == "Error queuing books"
+
+
+def test_get_bulk_job_results(client, mocker):
+    job = BookBulkJob(
+        id="5f0c6d1e-8a3b-4c2d-9e1f-0a1b2c3d4e5f", status="done", total=2, batches=1, batches_done=1,
+        results=[
+            {"index": 0, "isbn": "111", "status": "created", "id": 7, "error": None},
+            {"index": 1, "isbn": "222", "status": "skipped", "id": None, "error": "ISBN already exists"},
+        ],
+    )
+    mock_get = mocker.patch.object(BookQueries, "get_bulk_job", return_value=job)
+
+    response = client.get(f"/api/book/bulk/{job.id}/")
+
+    assert response.status_code == 200
+    assert response.data["status"] == "done"
+    assert [(item["index"], item["status"]) for item in response.data["results"]] == [(0, "created"), (1, "skipped")]
+    assert response.data["results"][1]["error"] == "ISBN already exists"
+    mock_get.assert_called_once_with(job.id)
+
+
+def test_get_bulk_job_not_found(client, mocker):
+    mocker.patch.object(BookQueries, "get_bulk_job", return_value=None)
+
+    response = client.get("/api/book/bulk/5f0c6d1e-8a3b-4c2d-9e1f-0a1b2c3d4e5f/")
+
+    assert response.status_code == 404
+    assert response.data["detail"] == "Bulk job not found"
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from rest_framework.test import APIClient
+
+from book.application.queries.book_queries import BookQueries
+from book.domain.book_entities import Book
+from book.interface.book_export_view import BookExportView
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock())
+    return client
+
+
+@pytest.fixture
+def make_book():
+    def _make_book(**overrides):
+        data = {
+            "id": 1,
+            "title": "Clean Code",
+            "isbn": "1234567890123",
+            "publisher": "Prentice Hall",
+            "edition": "1st",
+            "language": "English",
+            "book_type": "Technical",
+            "synopsis": "A book about writing clean code.",
+            "publication_date": "2008-08-01",
+            "authors": [],
+            "categories": [],
+        }
+        data.update(overrides)
+        return Book(**data)
+
+    return _make_book
+
+
+def _body(response):
+    return b"".join(response.streaming_content).decode()
+
+
+def test_export_ndjson(client, mocker, make_book, settings):
+    settings.BOOK_EXPORT_CHUNK_SIZE = 2
+    books = [make_book(), make_book(id=2, title="Refactoring"), make_book(id=3)]
+    mock_iterate = mocker.patch.object(BookQueries, "iterate_all", return_value=iter(books))
+
+    response = client.get("/api/book/export/?format=ndjson")
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = _body(response).splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+    assert json.loads(lines[1])["title"] == "Refactoring"
+    mock_iterate.assert_called_once_with(2)
+
+
+def test_export_json_array(client, mocker, make_book):
+    books = [make_book(), make_book(id=2)]
+    mocker.patch.object(BookQueries, "iterate_all", return_value=iter(books))
+
+    response = client.get("/api/book/export/")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    data = json.loads(_body(response))
+    assert [book["id"] for book in data] == [1, 2]
+
+
+def test_export_empty_catalog(client, mocker):
+    mocker.patch.object(BookQueries, "iterate_all", return_value=iter([]))
+
+    response = client.get("/api/book/export/?format=json")
+
+    assert json.loads(_body(response)) == []
+
+
+def test_export_unknown_format(client):
+    response = client.get("/api/book/export/?format=xml")
+
+    assert response.status_code == 404
+
+
+def test_export_streams_chunk_by_chunk_under_asgi(mocker, make_book, settings):
+    settings.BOOK_EXPORT_CHUNK_SIZE = 2
+    pulled = []
+
+    def books():
+        for book_id in range(1, 6):
+            pulled.append(book_id)
+            yield make_book(id=book_id)
+
+    mocker.patch.object(BookQueries, "iterate_all", return_value=books())
+    mocker.patch.object(BookExportView, "permission_classes", [])
+
+    async def export():
+        response = await AsyncClient().get("/api/book/export/?format=ndjson")
+        assert response.is_async
+        chunks = []
+        async for chunk in response:
+            chunks.append(chunk)
+            if len(chunks) == 1:
+                # Only the rows of the first chunk have been read from the database.
+                assert pulled == [1, 2]
+        return chunks
+
+    chunks = async_to_sync(export)()
+
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3, 4, 5]
@@ -0,0 +1,50 @@
+import pytest
+from rest_framework.test import APIClient
+
+from book.application.commands.book_commands import BookCommands
+from book.application.queries.book_queries import BookQueries
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock(is_staff=True))
+    return client
+
+
+def test_get_index_status(client, mocker):
+    mocker.patch.object(
+        BookQueries, "get_index_status", return_value={"pending": 3, "dead": 1, "lag_seconds": 0.4}
+    )
+
+    response = client.get("/api/book/index-status/")
+
+    assert response.status_code == 200
+    assert response.data == {"pending": 3, "dead": 1, "lag_seconds": 0.4}
+
+
+def test_post_requeues_dead_letters(client, mocker):
+    mock_requeue = mocker.patch.object(BookCommands, "requeue_index_dead_letters", return_value=2)
+
+    response = client.post("/api/book/index-status/")
+
+    assert response.status_code == 200
+    assert response.data == {"requeued": 2}
+    mock_requeue.assert_called_once()
+
+
+def test_index_status_error(client, mocker):
+    mocker.patch.object(BookQueries, "get_index_status", side_effect=Exception("DB down"))
+
+    response = client.get("/api/book/index-status/")
+
+    assert response.status_code == 500
+
+
+def test_index_status_requires_staff(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock(is_staff=False))
+
+    response = client.get("/api/book/index-status/")
+
+    assert response.status_code == 403
@@ -0,0 +1,64 @@
+from datetime import date
+
+import pytest
+
+from author.domain.author_entities import Author
+from book.domain.book_entities import Book
+from book.interface.serializer.book_output_serializer import BookOutputSerializer, book_output_encoder
+from book_category.domain.book_category_entities import BookCategory
+
+
+def make_book(**overrides):
+    data = {
+        "id": 1,
+        "title": "Clean Code",
+        "isbn": "1234567890123",
+        "publisher": "Prentice Hall",
+        "edition": "1st",
+        "language": "English",
+        "book_type": "Technical",
+        "synopsis": "A book about writing clean code.",
+        "publication_date": date(2008, 8, 1),
+        "authors": [Author(id=1, name="Robert C. Martin"), 2],
+        "categories": [BookCategory(id=3, name="Software")],
+    }
+    data.update(overrides)
+    return Book(**data)
+
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"publication_date": "2008-08-01"},
+    {"publication_date": None, "synopsis": None},
+    {"authors": [], "categories": []},
+])
+def test_encoder_matches_drf_serializer(overrides):
+    book = make_book(**overrides)
+
+    assert book_output_encoder()(book) == BookOutputSerializer(book).data
+
+
+@pytest.mark.parametrize("fields", [
+    frozenset({"id", "title"}),
+    frozenset({"authors", "publication_date"}),
+    frozenset(),
+])
+def test_encoder_matches_drf_serializer_for_sparse_fieldsets(fields):
+    book = make_book()
+
+    encoded = book_output_encoder(fields)(book)
+    expected = BookOutputSerializer(book, fields=fields).data
+
+    assert encoded == expected
+    assert list(encoded) == list(expected)
+
+
+def test_encoder_accepts_values_rows():
+    row = {"id": 1, "title": "Clean Code", "publication_date": date(2008, 8, 1)}
+    fields = frozenset(row)
+
+    assert book_output_encoder(fields)(row) == BookOutputSerializer(row, fields=fields).data
+
+
+def test_encoder_is_built_once_per_fieldset():
+    assert book_output_encoder(frozenset({"id"})) is book_output_encoder(frozenset({"id"}))
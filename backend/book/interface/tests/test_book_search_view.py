@@ -0,0 +1,159 @@
+import pytest
+from rest_framework.test import APIClient
+
+from book.application.queries.book_queries import BookQueries
+from book.domain.book_entities import BookSearchResult
+from config.pagination import encode_search_after
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock())
+    return client
+
+
+@pytest.fixture
+def make_hit():
+    def _make_hit(**overrides):
+        data = {
+            "id": 1,
+            "isbn": "1234567890123",
+            "title": "Clean Code",
+            "authors": ["Robert C. Martin"],
+            "categories": ["Software"],
+            "language": "English",
+            "book_type": "physical",
+            "publication_date": "2008-08-01",
+            "highlight": {"title": ["<em>Clean</em> Code"]},
+        }
+        data.update(overrides)
+        return data
+
+    return _make_hit
+
+
+def test_search_books(client, mocker, make_hit):
+    mock_search = mocker.patch.object(
+        BookQueries, "search",
+        return_value=BookSearchResult(total=1, hits=[make_hit()], source="elasticsearch", next_cursor="abc"),
+    )
+
+    response = client.get("/api/book/search/?q=clean&language=English&size=5&page=2")
+
+    assert response.status_code == 200
+    assert response.data["count"] == 1
+    assert response.data["next"] == "abc"
+    assert response.data["source"] == "elasticsearch"
+    assert response.data["results"][0]["highlight"]["title"] == ["<em>Clean</em> Code"]
+    mock_search.assert_called_once_with(
+        "clean", {"language": "English", "book_type": None, "category": None, "author": None}, 5, 2, None, []
+    )
+
+
+def test_search_books_requires_query(client):
+    response = client.get("/api/book/search/")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Query parameter 'q' is required"
+
+
+def test_search_books_page_out_of_range(client):
+    response = client.get("/api/book/search/?q=clean&size=100&page=1000")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid page"
+
+
+@pytest.mark.parametrize("params, detail", [
+    ("page=abc", "Invalid page"),
+    ("page=0", "Invalid page"),
+    ("size=abc", "Invalid size"),
+    ("size=-1", "Invalid size"),
+])
+def test_search_books_invalid_paging_uses_fixed_messages(client, params, detail):
+    response = client.get(f"/api/book/search/?q=clean&{params}")
+
+    assert response.status_code == 400
+    assert response.data == {"detail": detail}
+
+
+def test_search_books_invalid_cursor(client):
+    response = client.get("/api/book/search/?q=clean&cursor=@@@")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("sort_values", [["x", {}], [1.5], [1.5, 2, 3], [1.5, "2"], [1.5, 2.5], [True, 2], "1.5,2"])
+def test_search_books_rejects_malformed_search_after(client, mocker, sort_values):
+    mock_search = mocker.patch("book.application.queries.book_queries.BookSearchRepository.search")
+
+    response = client.get(f"/api/book/search/?q=clean&cursor={encode_search_after(sort_values)}")
+
+    assert response.status_code == 400
+    assert response.data == {"detail": "Invalid cursor"}
+    mock_search.assert_not_called()
+
+
+def test_search_books_tolerates_hits_indexed_without_new_fields(client, mocker, make_hit):
+    legacy_hit = make_hit()
+    for field in ("id", "language", "book_type"):
+        del legacy_hit[field]
+    mocker.patch.object(
+        BookQueries, "search", return_value=BookSearchResult(total=1, hits=[legacy_hit], source="elasticsearch"),
+    )
+
+    response = client.get("/api/book/search/?q=clean")
+
+    assert response.status_code == 200
+    hit = response.data["results"][0]
+    assert (hit["id"], hit["language"], hit["book_type"]) == (None, None, None)
+    assert hit["title"] == "Clean Code"
+
+
+def test_search_books_serialization_error(client, mocker, make_hit):
+    broken_hit = make_hit()
+    del broken_hit["title"]
+    mocker.patch.object(
+        BookQueries, "search", return_value=BookSearchResult(total=1, hits=[broken_hit], source="elasticsearch"),
+    )
+
+    response = client.get("/api/book/search/?q=clean")
+
+    assert response.status_code == 500
+    assert response.data["detail"] == "Error searching books"
+
+
+def test_search_books_error(client, mocker):
+    mocker.patch.object(BookQueries, "search", side_effect=Exception("boom"))
+
+    response = client.get("/api/book/search/?q=clean")
+
+    assert response.status_code == 500
+    assert response.data["detail"] == "Error searching books"
+
+
+def test_browse_with_facets_without_query(client, mocker):
+    mock_search = mocker.patch.object(
+        BookQueries, "search",
+        return_value=BookSearchResult(
+            total=3, hits=[], source="postgres",
+            facets={"language": [{"value": "English", "count": 3}]},
+        ),
+    )
+
+    response = client.get("/api/book/search/?facets=language,language&category=Software")
+
+    assert response.status_code == 200
+    assert response.data["facets"] == {"language": [{"value": "English", "count": 3}]}
+    assert mock_search.call_args.args[0] == ""
+    assert mock_search.call_args.args[1]["category"] == "Software"
+    assert mock_search.call_args.args[5] == ["language"]
+
+
+def test_search_books_invalid_facet(client):
+    response = client.get("/api/book/search/?q=clean&facets=language,publisher")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid facets: publisher"
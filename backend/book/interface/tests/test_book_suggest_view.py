@@ -0,0 +1,47 @@
+import pytest
+from rest_framework.test import APIClient
+
+from book.application.queries.book_queries import BookQueries
+from book.domain.book_entities import BookSuggestions
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock())
+    return client
+
+
+def test_suggest(client, mocker, settings):
+    settings.BOOK_SUGGEST_MAX_SIZE = 10
+    mock_suggest = mocker.patch.object(
+        BookQueries, "suggest",
+        return_value=BookSuggestions(titles=["Clean Code"], authors=["Robert C. Martin"], source="elasticsearch"),
+    )
+
+    response = client.get("/api/book/suggest/", {"q": "cle", "size": "50"})
+
+    assert response.status_code == 200
+    assert response.data == {"titles": ["Clean Code"], "authors": ["Robert C. Martin"], "source": "elasticsearch"}
+    mock_suggest.assert_called_once_with("cle", 10)
+
+
+def test_suggest_requires_query(client):
+    response = client.get("/api/book/suggest/", {"q": " "})
+
+    assert response.status_code == 400
+
+
+def test_suggest_invalid_size(client):
+    response = client.get("/api/book/suggest/", {"q": "cle", "size": "0"})
+
+    assert response.status_code == 400
+    assert response.data == {"detail": "Invalid size"}
+
+
+def test_suggest_error(client, mocker):
+    mocker.patch.object(BookQueries, "suggest", side_effect=Exception("DB down"))
+
+    response = client.get("/api/book/suggest/", {"q": "cle"})
+
+    assert response.status_code == 500
@@ -1,9 +1,16 @@
+from datetime import datetime, timezone
+
 import pytest
 from rest_framework.test import APIClient
 
 from book.application.commands.book_commands import BookCommands
 from book.application.queries.book_queries import BookQueries
-from book.domain.book_entities import Book
+from book.domain.book_entities import Book, BookPage
+from book.infrastructure.cache.book_cache import BookCache
+from config.conditional import ResourceVersion
+from config.pagination import encode_cursor
+
+VERSION = ResourceVersion(last_modified=datetime(2024, 1, 1, tzinfo=timezone.utc), count=3)
 
 
 @pytest.fixture
@@ -13,6 +20,11 @@ def client(mocker):
     return client
 
 
+@pytest.fixture(autouse=True)
+def mock_version(mocker):
+    return mocker.patch.object(BookQueries, "get_version", return_value=VERSION)
+
+
 @pytest.fixture
 def make_book():
     def _make_book(**overrides):
@@ -62,20 +74,24 @@ def test_get_book_error(client, mocker):
     assert response.data["detail"] == "Error retrieving book"
 
 
-def test_get_books_with_fuzzy_search(client, mocker, make_book):
-    mock_queryset = mocker.Mock()
-    mock_annotated = mocker.Mock()
-    mock_filtered = [make_book(title="Clean Code")]
-
-    mock_queryset.annotate.return_value = mock_annotated
-    mock_annotated.filter.return_value.order_by.return_value = mock_filtered
-
-    mocker.patch.object(BookQueries, "get_queryset", return_value=mock_queryset)
+def test_get_books_with_fuzzy_search(client, mocker, make_book, settings):
+    settings.API_MAX_PAGE_SIZE = 25
+    mock_search = mocker.patch.object(BookQueries, "search_trigram", return_value=[make_book(title="Clean Code")])
 
     response = client.get("/api/book/?search=clean")
 
     assert response.status_code == 200
     assert response.data[0]["title"] == "Clean Code"
+    mock_search.assert_called_once_with("clean", 25, None)
+
+
+def test_get_books_fuzzy_search_with_fields(client, mocker, make_book):
+    mock_search = mocker.patch.object(BookQueries, "search_trigram", return_value=[make_book(title="Clean Code")])
+
+    response = client.get("/api/book/?search=clean&fields=title")
+
+    assert response.data == [{"title": "Clean Code"}]
+    assert mock_search.call_args.args[2] == frozenset({"title"})
 
 
 def test_get_all_books(client, mocker, make_book):
@@ -96,6 +112,97 @@ def test_get_all_books_error(client, mocker):
     assert response.data["detail"] == "Error retrieving book list"
 
 
+def test_get_books_page(client, mocker, make_book):
+    mock_page = mocker.patch.object(
+        BookQueries, "get_page", return_value=BookPage(items=[make_book()], next_cursor="abc")
+    )
+
+    response = client.get("/api/book/?limit=1")
+
+    assert response.status_code == 200
+    assert response.data["next"] == "abc"
+    assert response.data["results"][0]["title"] == "Clean Code"
+    mock_page.assert_called_once_with(None, 1, None)
+
+
+def test_get_books_page_caps_limit(client, mocker, settings):
+    settings.API_MAX_PAGE_SIZE = 10
+    mock_page = mocker.patch.object(BookQueries, "get_page", return_value=BookPage(items=[]))
+
+    response = client.get("/api/book/?cursor=abc&limit=500")
+
+    assert response.status_code == 200
+    assert response.data["next"] is None
+    mock_page.assert_called_once_with("abc", 10, None)
+
+
+def test_get_books_page_sparse_fields(client, mocker, make_book):
+    mock_page = mocker.patch.object(
+        BookQueries, "get_page", return_value=BookPage(items=[make_book(synopsis=None)], next_cursor=None)
+    )
+
+    response = client.get("/api/book/?limit=1&fields=id,title,isbn")
+
+    assert response.status_code == 200
+    assert response.data["results"] == [{"id": 1, "title": "Clean Code", "isbn": "1234567890123"}]
+    mock_page.assert_called_once_with(None, 1, frozenset({"id", "title", "isbn"}))
+
+
+def test_get_books_exclude_fields(client, mocker, make_book):
+    mock_get_all = mocker.patch.object(BookQueries, "get_all", return_value=[make_book()])
+
+    response = client.get("/api/book/?exclude=synopsis,authors,categories")
+
+    assert response.status_code == 200
+    assert "synopsis" not in response.data[0]
+    assert "authors" not in response.data[0]
+    assert response.data[0]["publisher"] == "Prentice Hall"
+    assert "synopsis" not in mock_get_all.call_args.args[0]
+
+
+def test_get_books_invalid_fields(client):
+    response = client.get("/api/book/?fields=title,price")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid fields: price"
+
+
+def test_get_book_sparse_fields_from_cache(client, mocker):
+    mocker.patch(
+        "book.interface.book_view.BookCache.get", return_value=({"id": 1, "title": "Clean Code", "isbn": "1"}, VERSION)
+    )
+
+    response = client.get("/api/book/1/?fields=title")
+
+    assert response.status_code == 200
+    assert response.data == {"title": "Clean Code"}
+
+
+def test_get_books_page_invalid_limit(client):
+    response = client.get("/api/book/?limit=zero")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid limit"
+
+
+def test_get_books_page_invalid_cursor(client):
+    response = client.get("/api/book/?cursor=@@@")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize("last_id", ["5", 5.7, True, None, [5], {"id": 5}])
+def test_get_books_page_rejects_non_integer_cursor_ids(client, mocker, last_id):
+    mock_page = mocker.patch("book.application.queries.book_queries.BookRepository.get_page")
+
+    response = client.get(f"/api/book/?cursor={encode_cursor(last_id)}")
+
+    assert response.status_code == 400
+    assert response.data == {"detail": "Invalid cursor"}
+    mock_page.assert_not_called()
+
+
 def test_post_book_success(client, mocker, make_book):
     mocker.patch.object(BookCommands, "create", return_value=make_book())
 
@@ -193,3 +300,124 @@ def test_delete_book_error(client, mocker):
 
     assert response.status_code == 500
     assert response.data["detail"] == "Error deleting book"
+
+
+def test_get_book_served_from_cache(client, mocker, make_book, shared_book_cache):
+    mock_get = mocker.patch.object(BookQueries, "get_by_id", return_value=make_book())
+
+    first = client.get("/api/book/1/")
+    second = client.get("/api/book/1/")
+
+    assert first.data == second.data
+    mock_get.assert_called_once_with(1)
+
+
+def test_get_book_not_found_is_not_cached(client, mocker, make_book):
+    mock_get = mocker.patch.object(BookQueries, "get_by_id", side_effect=[None, make_book()])
+
+    assert client.get("/api/book/1/").status_code == 404
+    assert client.get("/api/book/1/").status_code == 200
+    assert mock_get.call_count == 2
+
+
+def test_get_books_sends_validators(client, mocker, make_book, settings):
+    settings.BOOK_HTTP_CACHE_CONTROL = "private, max-age=30"
+    mocker.patch.object(BookQueries, "get_all", return_value=[make_book()])
+
+    response = client.get("/api/book/")
+
+    assert response.status_code == 200
+    assert response["ETag"].startswith('W/"')
+    assert response["Last-Modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert response["Cache-Control"] == "private, max-age=30"
+
+
+def test_get_books_not_modified_skips_the_listing(client, mocker, make_book):
+    mock_get_all = mocker.patch.object(BookQueries, "get_all", return_value=[make_book()])
+    etag = client.get("/api/book/")["ETag"]
+
+    response = client.get("/api/book/", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert mock_get_all.call_count == 1
+
+
+def test_get_books_etag_depends_on_query_and_version(client, mocker, make_book, mock_version):
+    mocker.patch.object(BookQueries, "get_all", return_value=[make_book()])
+    etag = client.get("/api/book/")["ETag"]
+
+    assert client.get("/api/book/?fields=id")["ETag"] != etag
+    mock_version.return_value = ResourceVersion(last_modified=VERSION.last_modified, count=2)
+    assert client.get("/api/book/", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+def test_get_book_not_modified_skips_database(client, mocker, make_book, mock_version):
+    mock_version.return_value = ResourceVersion(last_modified=VERSION.last_modified, count=1)
+    mock_get = mocker.patch.object(BookQueries, "get_by_id", return_value=make_book())
+
+    response = client.get("/api/book/1/", HTTP_IF_MODIFIED_SINCE="Mon, 01 Jan 2024 00:00:00 GMT")
+
+    assert response.status_code == 304
+    mock_version.assert_called_with(1)
+    mock_get.assert_not_called()
+
+
+def test_get_book_cached_validates_without_queries(client, mocker, make_book, mock_version, shared_book_cache):
+    mock_get = mocker.patch.object(BookQueries, "get_by_id", return_value=make_book())
+    etag = client.get("/api/book/1/")["ETag"]
+    mock_version.reset_mock()
+
+    response = client.get("/api/book/1/", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    mock_version.assert_not_called()
+    assert mock_get.call_count == 1
+
+
+def test_get_book_changed_while_loading_is_not_cached(client, mocker, make_book, mock_version, shared_book_cache):
+    newer = ResourceVersion(last_modified=datetime(2024, 2, 1, tzinfo=timezone.utc), count=3)
+    mock_version.side_effect = [VERSION, newer]
+    mocker.patch.object(BookQueries, "get_by_id", return_value=make_book())
+
+    response = client.get("/api/book/1/")
+
+    assert response.status_code == 200
+    assert BookCache().get(1) is None
+
+
+def test_get_books_caches_list_version_only_when_unchanged(client, mocker, make_book, mock_version,
+                                                           shared_book_cache):
+    newer = ResourceVersion(last_modified=datetime(2024, 2, 1, tzinfo=timezone.utc), count=3)
+    mocker.patch.object(BookQueries, "get_all", return_value=[make_book()])
+
+    mock_version.side_effect = [VERSION, newer]
+    client.get("/api/book/")
+    assert BookCache().get_list_version() is None
+
+    mock_version.side_effect = [newer, newer]
+    client.get("/api/book/")
+    assert BookCache().get_list_version() == newer
+
+    mock_version.reset_mock()
+    mock_version.side_effect = None
+    assert client.get("/api/book/").status_code == 200
+    mock_version.assert_not_called()
+
+
+def test_get_books_ignores_if_modified_since_for_lists(client, mocker, make_book):
+    mocker.patch.object(BookQueries, "get_all", return_value=[make_book()])
+
+    response = client.get("/api/book/", HTTP_IF_MODIFIED_SINCE="Mon, 01 Jan 2024 00:00:00 GMT")
+
+    assert response.status_code == 200
+
+
+def test_get_missing_book_with_if_none_match_star_is_not_found(client, mocker, mock_version):
+    mock_version.return_value = ResourceVersion(last_modified=None, count=0)
+    mocker.patch.object(BookQueries, "get_by_id", return_value=None)
+
+    response = client.get("/api/book/99/", HTTP_IF_NONE_MATCH="*")
+
+    assert response.status_code == 404
+    assert "ETag" not in response
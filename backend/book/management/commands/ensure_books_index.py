@@ -0,0 +1,20 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from book.infrastructure.repository.book_search_repository import BookSearchRepository
+
+
+class Command(BaseCommand):
+    help = "Install the books index template and create the books alias if it does not exist yet."
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.logger = logging.getLogger(__name__)
+
+    def handle(self, *args, **options):
+        created = BookSearchRepository().ensure_index()
+        if created:
+            self.logger.info(f"[EnsureBooksIndex] Created {created}")
+        else:
+            self.logger.info("[EnsureBooksIndex] Template updated; books index already exists")
@@ -0,0 +1,24 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from book.application.task.flush_book_index_task import flush_book_index_task
+from book.infrastructure.repository.book_index_outbox_repository import BookIndexOutboxRepository
+
+
+class Command(BaseCommand):
+    help = "Send a search index flush if the outbox has pending mutations (run when the worker starts)."
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.logger = logging.getLogger(__name__)
+
+    def handle(self, *args, **options):
+        stats = BookIndexOutboxRepository().stats()
+        if not stats["pending"]:
+            self.logger.info("[FlushBookIndex] Outbox is empty")
+            return
+        flush_book_index_task.send()
+        self.logger.info(
+            f"[FlushBookIndex] Sent a flush for {stats['pending']} pending mutations (lag {stats['lag_seconds']:.1f}s)"
+        )
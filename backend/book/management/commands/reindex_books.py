@@ -0,0 +1,119 @@
+import logging
+import time
+from datetime import datetime, time as dt_time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from book.infrastructure.repository.book_repository import BookRepository
+from book.infrastructure.repository.book_search_repository import BookSearchRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the books search index from Postgres into a new versioned index and swap the alias to it, "
+        "or with --since re-send books updated since a date to the live index. Both drop documents of deleted books."
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.book_repository = BookRepository()
+        self.search_repository = BookSearchRepository()
+        self.logger = logging.getLogger(__name__)
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", help="ISO date or datetime; incremental mode on updated_at")
+        parser.add_argument("--chunk-size", type=int, default=500)
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--progress-every", type=int, default=5000)
+        parser.add_argument("--keep-old", action="store_true", help="Keep the indices the alias pointed to before")
+
+    def handle(self, *args, **options):
+        since = self.parse_since(options["since"])
+        if since is not None:
+            indexed = self.index_books(self.search_repository.INDEX, since, options)
+            removed = self.remove_deleted(self.search_repository.INDEX)
+            self.stdout.write(self.style.SUCCESS(
+                f"Re-indexed {indexed} books updated since {since.isoformat()}; removed {removed} deleted books"
+            ))
+            return
+
+        started_at = timezone.now()
+        index = self.search_repository.create_versioned_index()
+        try:
+            indexed = self.index_books(index, None, options)
+            self.search_repository.finalize_index(index)
+            removed = self.remove_deleted(index)
+        except BaseException:
+            self.logger.error(f"[ReindexBooks] Reindex failed, dropping {index}")
+            self.search_repository.delete_indices([index])
+            raise
+
+        previous = self.search_repository.swap_alias(index)
+        # Changes written to the old index while we were streaming.
+        caught_up = self.index_books(self.search_repository.INDEX, started_at, options)
+        # Deletes that went to the old index between the first pass and the swap.
+        removed += self.remove_deleted(self.search_repository.INDEX)
+        if previous and not options["keep_old"]:
+            self.search_repository.delete_indices(previous)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {indexed} books into {index} (+{caught_up} caught up, {removed} deleted removed); "
+            f"alias swapped from {previous or 'none'}"
+        ))
+
+    def index_books(self, index: str, since: datetime | None, options: dict) -> int:
+        total = self.book_repository.count(updated_since=since)
+        self.logger.info(f"[ReindexBooks] Indexing {total} books into {index}")
+        books = self.book_repository.iterate_all(options["chunk_size"], updated_since=since)
+        documents = (self.search_repository.to_document(book) for book in books)
+
+        started = time.monotonic()
+        indexed = failed = 0
+        results = self.search_repository.parallel_index(index, documents, options["workers"], options["chunk_size"])
+        for ok, item in results:
+            if ok:
+                indexed += 1
+            else:
+                failed += 1
+                self.logger.error(f"[ReindexBooks] Failed to index {item}")
+            done = indexed + failed
+            if done % options["progress_every"] == 0:
+                self.report(done, total, started)
+
+        self.report(indexed + failed, total, started)
+        if failed:
+            raise CommandError(f"{failed} books failed to index into {index}")
+        return indexed
+
+    def remove_deleted(self, index: str) -> int:
+        # Read the index before Postgres: a book created in between is then in Postgres, never missing from it.
+        indexed = self.search_repository.document_ids(index)
+        stale = sorted(indexed - self.book_repository.all_isbns())
+        if stale:
+            self.logger.info(f"[ReindexBooks] Removing {len(stale)} deleted books from {index}")
+            self.search_repository.delete_documents(index, stale)
+        return len(stale)
+
+    def report(self, done: int, total: int, started: float) -> None:
+        elapsed = max(time.monotonic() - started, 1e-6)
+        percent = done * 100 / total if total else 100.0
+        self.stdout.write(f"{done}/{total} ({percent:.1f}%) in {elapsed:.1f}s, {done / elapsed:.0f} docs/s")
+
+    @staticmethod
+    def parse_since(value: str | None) -> datetime | None:
+        if not value:
+            return None
+        try:
+            since = parse_datetime(value)
+            day = parse_date(value) if since is None else None
+        except ValueError:
+            since = day = None
+        if since is None and day is None:
+            raise CommandError(f"Invalid --since value: {value}")
+        if since is None:
+            since = datetime.combine(day, dt_time.min)
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
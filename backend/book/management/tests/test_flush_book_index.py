@@ -0,0 +1,28 @@
+import pytest
+from django.core.management import call_command
+
+
+@pytest.fixture
+def mock_outbox(mocker):
+    return mocker.patch("book.management.commands.flush_book_index.BookIndexOutboxRepository").return_value
+
+
+@pytest.fixture
+def mock_send(mocker):
+    return mocker.patch("book.management.commands.flush_book_index.flush_book_index_task.send")
+
+
+def test_sends_flush_when_mutations_are_pending(mock_outbox, mock_send):
+    mock_outbox.stats.return_value = {"pending": 3, "dead": 0, "lag_seconds": 42.0}
+
+    call_command("flush_book_index")
+
+    mock_send.assert_called_once_with()
+
+
+def test_does_nothing_when_outbox_is_empty(mock_outbox, mock_send):
+    mock_outbox.stats.return_value = {"pending": 0, "dead": 1, "lag_seconds": 0.0}
+
+    call_command("flush_book_index")
+
+    mock_send.assert_not_called()
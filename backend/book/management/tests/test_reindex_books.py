@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+
+@pytest.fixture
+def mock_book_repository(mocker):
+    repository = mocker.patch("book.management.commands.reindex_books.BookRepository").return_value
+    repository.count.return_value = 2
+    repository.all_isbns.return_value = {"1", "2"}
+    repository.iterate_all.side_effect = lambda chunk_size, updated_since=None: iter([mocker.Mock(), mocker.Mock()])
+    return repository
+
+
+@pytest.fixture
+def mock_search_repository(mocker):
+    repository = mocker.patch("book.management.commands.reindex_books.BookSearchRepository").return_value
+    repository.INDEX = "books"
+    repository.create_versioned_index.return_value = "books_20260101000000"
+    repository.swap_alias.return_value = ["books_old"]
+    repository.document_ids.return_value = {"1", "2"}
+    repository.parallel_index.side_effect = lambda index, docs, workers, chunk: ((True, {}) for _ in docs)
+    return repository
+
+
+def test_full_reindex_swaps_alias_and_drops_old_index(mock_book_repository, mock_search_repository):
+    out = StringIO()
+    call_command("reindex_books", workers=3, chunk_size=100, stdout=out)
+
+    first_pass = mock_search_repository.parallel_index.call_args_list[0]
+    assert first_pass.args[0] == "books_20260101000000"
+    assert first_pass.args[2:] == (3, 100)
+    mock_search_repository.finalize_index.assert_called_once_with("books_20260101000000")
+    mock_search_repository.swap_alias.assert_called_once_with("books_20260101000000")
+    # Catch-up pass for books changed while streaming goes to the live alias.
+    assert mock_search_repository.parallel_index.call_args_list[1].args[0] == "books"
+    assert mock_book_repository.iterate_all.call_args_list[1].kwargs["updated_since"] is not None
+    mock_search_repository.delete_indices.assert_called_once_with(["books_old"])
+    assert "2/2 (100.0%)" in out.getvalue()
+
+
+def test_full_reindex_keep_old(mock_book_repository, mock_search_repository):
+    call_command("reindex_books", keep_old=True, stdout=StringIO())
+
+    mock_search_repository.delete_indices.assert_not_called()
+
+
+def test_full_reindex_failure_keeps_alias(mock_book_repository, mock_search_repository):
+    mock_search_repository.parallel_index.side_effect = lambda index, docs, workers, chunk: (
+        (False, {"index": {"_id": "1"}}) for _ in docs
+    )
+
+    with pytest.raises(CommandError, match="2 books failed"):
+        call_command("reindex_books", stdout=StringIO())
+
+    mock_search_repository.swap_alias.assert_not_called()
+    mock_search_repository.delete_indices.assert_called_once_with(["books_20260101000000"])
+
+
+def test_incremental_reindex_writes_to_live_index(mock_book_repository, mock_search_repository):
+    call_command("reindex_books", since="2026-01-01", stdout=StringIO())
+
+    mock_book_repository.iterate_all.assert_called_once_with(
+        500, updated_since=datetime(2026, 1, 1, tzinfo=timezone.utc)
+    )
+    assert mock_search_repository.parallel_index.call_args.args[0] == "books"
+    mock_search_repository.create_versioned_index.assert_not_called()
+    mock_search_repository.swap_alias.assert_not_called()
+
+
+def test_invalid_since(mock_book_repository, mock_search_repository):
+    with pytest.raises(CommandError, match="Invalid --since"):
+        call_command("reindex_books", since="yesterday")
+
+
+def test_full_reindex_removes_books_deleted_during_the_rebuild(mock_book_repository, mock_search_repository):
+    mock_search_repository.document_ids.side_effect = [{"1", "2", "3"}, {"1", "2", "4"}]
+
+    out = StringIO()
+    call_command("reindex_books", stdout=out)
+
+    assert mock_search_repository.delete_documents.call_args_list == [
+        (("books_20260101000000", ["3"]),),
+        (("books", ["4"]),),
+    ]
+    # The new index is cleaned before it goes live.
+    assert mock_search_repository.method_calls.index(
+        ("delete_documents", ("books_20260101000000", ["3"]), {})
+    ) < mock_search_repository.method_calls.index(("swap_alias", ("books_20260101000000",), {}))
+    assert "2 deleted removed" in out.getvalue()
+
+
+def test_incremental_reindex_removes_deleted_books(mock_book_repository, mock_search_repository):
+    mock_search_repository.document_ids.return_value = {"1", "2", "9"}
+
+    call_command("reindex_books", since="2026-01-01")
+
+    mock_search_repository.document_ids.assert_called_once_with("books")
+    mock_search_repository.delete_documents.assert_called_once_with("books", ["9"])
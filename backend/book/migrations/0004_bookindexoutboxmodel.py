@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('book', '0003_bookmodel_book_synopsis_trgm_gin'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookIndexOutboxModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('book_id', models.BigIntegerField()),
+                ('isbn', models.CharField(max_length=20)),
+                ('action', models.CharField(choices=[('index', 'Index'), ('delete', 'Delete')], max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('dead', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('dead', False)), fields=['id'], name='book_index_outbox_pending_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:16
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('book', '0004_bookindexoutboxmodel'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='bookmodel',
+            index=models.Index(fields=['updated_at'], name='book_updated_at_idx'),
+        ),
+    ]
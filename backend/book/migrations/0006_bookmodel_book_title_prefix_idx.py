@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:20
+
+from django.contrib.postgres.indexes import OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models.functions import Cast, Upper
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('book', '0005_bookmodel_book_updated_at_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='bookmodel',
+            index=models.Index(
+                OpClass(Upper(Cast('title', models.TextField())), name='text_pattern_ops'),
+                name='book_title_prefix_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('book', '0006_bookmodel_book_title_prefix_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bookindexoutboxmodel',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
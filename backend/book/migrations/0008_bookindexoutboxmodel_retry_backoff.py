@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('book', '0007_bookindexoutboxmodel_claimed_until'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bookindexoutboxmodel',
+            name='retries',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='bookindexoutboxmodel',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('book', '0008_bookindexoutboxmodel_retry_backoff'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookBulkJobModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('total', models.PositiveIntegerField()),
+                ('batches', models.PositiveIntegerField()),
+                ('errors', models.JSONField(default=list)),
+                ('results', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
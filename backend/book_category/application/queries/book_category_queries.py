@@ -4,6 +4,7 @@ from book_category.domain.book_category_entities import BookCategory
 from book_category.domain.book_category_query_interface import BookCategoryQueryInterface
 from book_category.infrastructure.book_category_model import BookCategoryModel
 from book_category.infrastructure.book_category_repository import BookCategoryRepository
+from config.conditional import ResourceVersion
 
 
 class BookCategoryQueries(BookCategoryQueryInterface):
@@ -24,3 +25,6 @@ class BookCategoryQueries(BookCategoryQueryInterface):
         except BookCategoryModel.DoesNotExist:
             self.logger.warning(f"[BookCategoryQueries] BookCategory with ID {book_category_id} not found")
             return None
+
+    def get_version(self, book_category_id: int | None = None) -> ResourceVersion:
+        return self.repository.get_version(book_category_id)
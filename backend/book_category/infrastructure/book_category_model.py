@@ -9,3 +9,8 @@ class BookCategoryModel(models.Model):
 
     def __str__(self):
         return self.name
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'], name='book_category_updated_at_idx'),
+        ]
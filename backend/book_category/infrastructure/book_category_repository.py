@@ -1,13 +1,20 @@
 import logging
 
+from django.db.models import Count, Max
+from django.utils import timezone
+
 from book_category.domain.book_category_command_interface import BookCategoryCommandInterface
 from book_category.domain.book_category_entities import BookCategory
 from book_category.domain.book_category_query_interface import BookCategoryQueryInterface
+from book.infrastructure.cache.book_cache import BookCache
+from book.infrastructure.repository.book_model import BookModel
+from config.conditional import ResourceVersion
 from .book_category_model import BookCategoryModel
 
 
 class BookCategoryRepository(BookCategoryCommandInterface, BookCategoryQueryInterface):
     def __init__(self):
+        self.book_cache = BookCache()
         self.logger = logging.getLogger(__name__)
 
     def get_all(self) -> list[BookCategory]:
@@ -28,6 +35,10 @@ class BookCategoryRepository(BookCategoryCommandInterface, BookCategoryQueryInte
             self.logger.exception(f"[BookCategoryRepository] Unexpected error fetching book category {book_category_id}")
             raise
 
+    def get_version(self, book_category_id: int | None = None) -> ResourceVersion:
+        queryset = BookCategoryModel.objects.all() if book_category_id is None else BookCategoryModel.objects.filter(id=book_category_id)
+        return ResourceVersion(**queryset.aggregate(last_modified=Max("updated_at"), count=Count("id")))
+
     def create(self, book_category: BookCategory) -> BookCategory:
         self.logger.info(f"[BookCategoryRepository] Creating book category: {book_category}")
         try:
@@ -45,12 +56,13 @@ class BookCategoryRepository(BookCategoryCommandInterface, BookCategoryQueryInte
         try:
             data = book_category.__dict__.copy()
             data.pop("id", None)
-            updated = BookCategoryModel.objects.filter(id=book_category_id).update(**data)
+            updated = BookCategoryModel.objects.filter(id=book_category_id).update(**data, updated_at=timezone.now())
             if updated == 0:
                 self.logger.warning(f"[BookCategoryRepository] Book category {book_category_id} not found for update")
                 raise BookCategoryModel.DoesNotExist(f"BookCategory {book_category_id} not found")
 
             obj = BookCategoryModel.objects.get(id=book_category_id)
+            self.book_cache.invalidate(*self.book_cache.book_ids_for_category(book_category_id))
             self.logger.info(f"[BookCategoryRepository] Book category {book_category_id} updated successfully")
             return self._to_entity(obj)
         except Exception:
@@ -60,10 +72,14 @@ class BookCategoryRepository(BookCategoryCommandInterface, BookCategoryQueryInte
     def delete(self, book_category_id: int) -> None:
         self.logger.info(f"[BookCategoryRepository] Deleting book category {book_category_id}")
         try:
+            affected_books = self.book_cache.book_ids_for_category(book_category_id)
             deleted, _ = BookCategoryModel.objects.filter(id=book_category_id).delete()
             if deleted == 0:
                 self.logger.warning(f"[BookCategoryRepository] Book category {book_category_id} not found for deletion")
                 raise BookCategoryModel.DoesNotExist(f"BookCategory {book_category_id} not found")
+            # The link rows are gone; bump the books so reindex_books --since picks them up.
+            BookModel.objects.filter(id__in=affected_books).update(updated_at=timezone.now())
+            self.book_cache.invalidate(*affected_books)
             self.logger.info(f"[BookCategoryRepository] Book category {book_category_id} deleted successfully")
         except Exception:
             self.logger.exception(f"[BookCategoryRepository] Unexpected error deleting book category {book_category_id}")
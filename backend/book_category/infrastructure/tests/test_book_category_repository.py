@@ -5,6 +5,12 @@ from book_category.infrastructure.book_category_model import BookCategoryModel
 from book_category.infrastructure.book_category_repository import BookCategoryRepository
 
 
+@pytest.fixture(autouse=True)
+def mock_book_cache(mocker):
+    cache = mocker.patch("book_category.infrastructure.book_category_repository.BookCache")
+    return cache.return_value
+
+
 @pytest.fixture
 def make_book_category_model(mocker):
     def _make(**overrides):
@@ -137,3 +143,31 @@ def test_delete_book_category_not_found(mocker):
     repo = BookCategoryRepository()
     with pytest.raises(BookCategoryModel.DoesNotExist):
         repo.delete(999)
+
+
+def test_update_book_category_invalidates_cached_books(mocker, make_book_category_model, mock_book_cache):
+    mock_filter = mocker.patch("book_category.infrastructure.book_category_repository.BookCategoryModel.objects.filter")
+    mock_filter.return_value.update.return_value = 1
+    mocker.patch(
+        "book_category.infrastructure.book_category_repository.BookCategoryModel.objects.get",
+        return_value=make_book_category_model(),
+    )
+    mock_book_cache.book_ids_for_category.return_value = [5]
+
+    BookCategoryRepository().update(1, BookCategory(id=1, name="Biography"))
+
+    mock_book_cache.book_ids_for_category.assert_called_once_with(1)
+    mock_book_cache.invalidate.assert_called_once_with(5)
+
+
+def test_delete_book_category_invalidates_cached_books(mocker, mock_book_cache):
+    mock_filter = mocker.patch("book_category.infrastructure.book_category_repository.BookCategoryModel.objects.filter")
+    mock_filter.return_value.delete.return_value = (1, {})
+    mock_book_filter = mocker.patch("book_category.infrastructure.book_category_repository.BookModel.objects.filter")
+    mock_book_cache.book_ids_for_category.return_value = [5, 6]
+
+    BookCategoryRepository().delete(1)
+
+    mock_book_filter.assert_called_once_with(id__in=[5, 6])
+    assert "updated_at" in mock_book_filter.return_value.update.call_args.kwargs
+    mock_book_cache.invalidate.assert_called_once_with(5, 6)
@@ -4,11 +4,14 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from django.conf import settings
+
 from book_category.application.commands.book_category_commands import BookCategoryCommands
 from book_category.application.queries.book_category_queries import BookCategoryQueries
 from book_category.domain.book_category_entities import BookCategory
 from book_category.interface.serializer.book_category_input_serializer import BookCategoryInputSerializer
 from book_category.interface.serializer.book_category_output_serializer import BookCategoryOutputSerializer
+from config.conditional import ConditionalGet
 
 
 class BookCategoryView(APIView):
@@ -24,11 +27,19 @@ class BookCategoryView(APIView):
         if book_category_id:
             self.logger.info(f"[BookCategoryView] GET /bookcategory/{book_category_id} requested")
             try:
+                conditional = ConditionalGet(
+                    request, self.book_category_queries.get_version(book_category_id), settings.BOOK_CATEGORY_HTTP_CACHE_CONTROL
+                )
+                not_modified = conditional.not_modified()
+                if not_modified is not None:
+                    self.logger.info(f"[BookCategoryView] BookCategory {book_category_id} not modified")
+                    return not_modified
+
                 book_category = self.book_category_queries.get_by_id(book_category_id)
                 if book_category:
                     self.logger.info(f"[BookCategoryView] BookCategory {book_category_id} found")
                     serializer = BookCategoryOutputSerializer(book_category)
-                    return Response(serializer.data)
+                    return conditional.apply(Response(serializer.data))
                 self.logger.warning(f"[BookCategoryView] BookCategory {book_category_id} not found")
                 return Response({"detail": "BookCategory not found"}, status=status.HTTP_404_NOT_FOUND)
             except Exception:
@@ -37,10 +48,16 @@ class BookCategoryView(APIView):
 
         self.logger.info("[BookCategoryView] GET /bookcategory list requested")
         try:
+            conditional = ConditionalGet(request, self.book_category_queries.get_version(), settings.BOOK_CATEGORY_HTTP_CACHE_CONTROL)
+            not_modified = conditional.not_modified()
+            if not_modified is not None:
+                self.logger.info("[BookCategoryView] Book categories list not modified")
+                return not_modified
+
             book_categories = self.book_category_queries.get_all()
             self.logger.info(f"[BookCategoryView] Returned {len(book_categories)} book categories")
             serializer = BookCategoryOutputSerializer(book_categories, many=True)
-            return Response(serializer.data)
+            return conditional.apply(Response(serializer.data))
         except Exception:
             self.logger.exception(f"[BookCategoryView] Error retrieving book category list")
             return Response({"detail": "Error retrieving book category list"},
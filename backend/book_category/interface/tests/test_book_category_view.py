@@ -1,8 +1,13 @@
+from datetime import datetime, timezone
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from book_category.domain.book_category_entities import BookCategory
+from config.conditional import ResourceVersion
+
+VERSION = ResourceVersion(last_modified=datetime(2024, 1, 1, tzinfo=timezone.utc), count=1)
 
 
 @pytest.fixture
@@ -27,6 +32,7 @@ def make_book_category():
 
 def test_get_category_found(client, mocker, make_book_category):
     mock_query = mocker.patch("book_category.interface.book_category_view.BookCategoryQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.return_value = make_book_category()
 
     response = client.get("/api/bookcategory/1/")
@@ -38,6 +44,7 @@ def test_get_category_found(client, mocker, make_book_category):
 
 def test_get_category_not_found(client, mocker):
     mock_query = mocker.patch("book_category.interface.book_category_view.BookCategoryQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.return_value = None
 
     response = client.get("/api/bookcategory/999/")
@@ -48,6 +55,7 @@ def test_get_category_not_found(client, mocker):
 
 def test_get_category_exception(client, mocker):
     mock_query = mocker.patch("book_category.interface.book_category_view.BookCategoryQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.side_effect = Exception("Unexpected error")
 
     response = client.get("/api/bookcategory/1/")
@@ -58,6 +66,7 @@ def test_get_category_exception(client, mocker):
 
 def test_get_all_categories(client, mocker, make_book_category):
     mock_query = mocker.patch("book_category.interface.book_category_view.BookCategoryQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_all.return_value = [
         make_book_category(),
         make_book_category(id=2, name="History")
@@ -74,6 +83,7 @@ def test_get_all_categories(client, mocker, make_book_category):
 
 def test_get_all_categories_exception(client, mocker):
     mock_query = mocker.patch("book_category.interface.book_category_view.BookCategoryQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_all.side_effect = Exception("DB down")
 
     response = client.get("/api/bookcategory/")
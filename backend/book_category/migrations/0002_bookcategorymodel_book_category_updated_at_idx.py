@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('book_category', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='bookcategorymodel',
+            index=models.Index(fields=['updated_at'], name='book_category_updated_at_idx'),
+        ),
+    ]
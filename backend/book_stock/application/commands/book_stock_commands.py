@@ -2,7 +2,8 @@ import logging
 from abc import ABC
 
 from book_stock.domain.book_stock_command_interface import BookStockCommandInterface
-from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_entities import BookStock, BookStockBulkResult
+from book_stock.infrastructure.book_stock_model import BookStockModel
 from book_stock.infrastructure.book_stock_repository import BookStockRepository
 
 
@@ -38,3 +39,40 @@ class BookStockCommands(BookStockCommandInterface, ABC):
 
         self.repository.delete(book_stock_id)
         self.logger.info(f"[BookStockCommands] BookStock ID {book_stock_id} deleted successfully")
+
+    def create_many(self, book_stocks: list[BookStock]) -> list[BookStockBulkResult]:
+        self.logger.info(f"[BookStockCommands] Creating {len(book_stocks)} book_stock entries")
+        results = self.repository.bulk_create(book_stocks)
+        self.logger.info(f"[BookStockCommands] Bulk create finished for {len(results)} entries")
+        return results
+
+    def update_status_many(self, book_stock_ids: list[int], new_status: str) -> list[BookStockBulkResult]:
+        self.logger.info(f"[BookStockCommands] Moving {len(book_stock_ids)} book_stock entries to '{new_status}'")
+        return self.repository.bulk_update_status(book_stock_ids, new_status)
+
+    def delete_many(self, book_stock_ids: list[int]) -> list[BookStockBulkResult]:
+        self.logger.info(f"[BookStockCommands] Deleting {len(book_stock_ids)} book_stock entries")
+        return self.repository.bulk_delete(book_stock_ids)
+
+    def checkout(self, book_id: int, branch_id: int) -> BookStock:
+        self.logger.info(f"[BookStockCommands] Checking out a copy of book {book_id} at branch {branch_id}")
+        return self.repository.claim_copy(book_id, branch_id, "borrowed")
+
+    def reserve(self, book_id: int, branch_id: int) -> BookStock:
+        self.logger.info(f"[BookStockCommands] Reserving a copy of book {book_id} at branch {branch_id}")
+        return self.repository.claim_copy(book_id, branch_id, "reserved")
+
+    def pick_up(self, book_stock_id: int) -> BookStock:
+        self.logger.info(f"[BookStockCommands] Lending reserved copy {book_stock_id}")
+        return self._transition(book_stock_id, ("reserved",), "borrowed")
+
+    def return_copy(self, book_stock_id: int) -> BookStock:
+        self.logger.info(f"[BookStockCommands] Returning copy {book_stock_id}")
+        return self._transition(book_stock_id, ("borrowed", "reserved"), "available")
+
+    def _transition(self, book_stock_id: int, from_statuses: tuple[str, ...], new_status: str) -> BookStock:
+        try:
+            return self.repository.transition_copy(book_stock_id, from_statuses, new_status)
+        except BookStockModel.DoesNotExist:
+            self.logger.warning(f"[BookStockCommands] Attempt to move non-existent book_stock ID: {book_stock_id}")
+            raise ValueError("BookStock not found")
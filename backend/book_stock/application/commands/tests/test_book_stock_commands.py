@@ -1,6 +1,7 @@
 import pytest
 from book_stock.application.commands.book_stock_commands import BookStockCommands
-from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_entities import BookStock, BookStockBulkResult
+from book_stock.infrastructure.book_stock_model import BookStockModel
 
 
 @pytest.fixture
@@ -100,3 +101,53 @@ def test_delete_book_stock_not_found(commands, mock_repository, mocker):
 
     mock_repository.get_by_id.assert_called_once_with(999)
     log_spy.assert_called_once_with("[BookStockCommands] Attempt to delete non-existent book_stock ID: 999")
+
+
+def test_create_many_delegates_to_bulk_create(commands, mock_repository, make_book_stock):
+    stocks = [make_book_stock(), make_book_stock(branch=11)]
+    mock_repository.bulk_create.return_value = [
+        BookStockBulkResult(index=0, status="created", id=1),
+        BookStockBulkResult(index=1, status="created", id=2),
+    ]
+
+    results = commands.create_many(stocks)
+
+    assert [r.id for r in results] == [1, 2]
+    mock_repository.bulk_create.assert_called_once_with(stocks)
+
+
+def test_update_status_many(commands, mock_repository):
+    commands.update_status_many([1, 2], "lost")
+
+    mock_repository.bulk_update_status.assert_called_once_with([1, 2], "lost")
+
+
+def test_delete_many(commands, mock_repository):
+    commands.delete_many([1, 2])
+
+    mock_repository.bulk_delete.assert_called_once_with([1, 2])
+
+
+def test_checkout_claims_copy_as_borrowed(commands, mock_repository):
+    commands.checkout(1, 10)
+
+    mock_repository.claim_copy.assert_called_once_with(1, 10, "borrowed")
+
+
+def test_reserve_claims_copy_as_reserved(commands, mock_repository):
+    commands.reserve(1, 10)
+
+    mock_repository.claim_copy.assert_called_once_with(1, 10, "reserved")
+
+
+def test_return_copy(commands, mock_repository):
+    commands.return_copy(5)
+
+    mock_repository.transition_copy.assert_called_once_with(5, ("borrowed", "reserved"), "available")
+
+
+def test_pick_up_not_found(commands, mock_repository):
+    mock_repository.transition_copy.side_effect = BookStockModel.DoesNotExist
+
+    with pytest.raises(ValueError, match="BookStock not found"):
+        commands.pick_up(5)
@@ -1,9 +1,10 @@
 import logging
 
-from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_entities import BOOK_STOCK_RELATIONS, BookAvailability, BookStock, BookStockPage
 from book_stock.domain.book_stock_query_interface import BookStockQueryInterface
 from book_stock.infrastructure.book_stock_model import BookStockModel
 from book_stock.infrastructure.book_stock_repository import BookStockRepository
+from config.pagination import decode_cursor, encode_cursor
 
 
 class BookStockQueries(BookStockQueryInterface):
@@ -11,11 +12,25 @@ class BookStockQueries(BookStockQueryInterface):
         self.repository = BookStockRepository()
         self.logger = logging.getLogger(__name__)
 
-    def get_all(self) -> list[BookStock]:
-        book_stocks = self.repository.get_all()
+    def get_all(self, expand: frozenset[str] = BOOK_STOCK_RELATIONS,
+                fields: frozenset[str] | None = None) -> list[BookStock]:
+        book_stocks = self.repository.get_all(expand, fields)
         self.logger.info(f"[BookStockQueries] Retrieved {len(book_stocks)} book_stock records")
         return book_stocks
 
+    def get_page(self, cursor: str | None, limit: int, expand: frozenset[str] = BOOK_STOCK_RELATIONS,
+                 fields: frozenset[str] | None = None) -> BookStockPage:
+        after_id = decode_cursor(cursor)
+        book_stocks = self.repository.get_page(after_id, limit + 1, expand, fields)
+
+        next_cursor = None
+        if len(book_stocks) > limit:
+            book_stocks = book_stocks[:limit]
+            next_cursor = encode_cursor(book_stocks[-1].id)
+
+        self.logger.info(f"[BookStockQueries] get_page() returned {len(book_stocks)} records")
+        return BookStockPage(items=book_stocks, next_cursor=next_cursor)
+
     def get_by_id(self, book_stock_id: int) -> BookStock | None:
         try:
             book_stock = self.repository.get_by_id(book_stock_id)
@@ -24,3 +39,8 @@ class BookStockQueries(BookStockQueryInterface):
         except BookStockModel.DoesNotExist:
             self.logger.warning(f"[BookStockQueries] BookStock with ID {book_stock_id} not found")
             return None
+
+    def get_availability(self, book_ids: list[int], branch_ids: list[int]) -> list[BookAvailability]:
+        availability = self.repository.get_availability(book_ids, branch_ids)
+        self.logger.info(f"[BookStockQueries] Retrieved availability for {len(availability)} book/branch pairs")
+        return availability
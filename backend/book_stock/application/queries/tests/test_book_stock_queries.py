@@ -1,7 +1,8 @@
 import pytest
 from book_stock.application.queries.book_stock_queries import BookStockQueries
-from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_entities import BOOK_STOCK_RELATIONS, BookStock
 from book_stock.infrastructure.book_stock_model import BookStockModel
+from config.pagination import decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -65,3 +66,22 @@ def test_get_by_id_not_found(queries, mock_repository, mocker):
     assert result is None
     mock_repository.get_by_id.assert_called_once_with(999)
     log_spy.assert_called_once_with("[BookStockQueries] BookStock with ID 999 not found")
+
+
+def test_get_page_returns_next_cursor_when_more_rows(queries, mock_repository, make_book_stock):
+    mock_repository.get_page.return_value = [make_book_stock(id=1), make_book_stock(id=2), make_book_stock(id=3)]
+
+    page = queries.get_page(None, 2, frozenset({"branch"}))
+
+    assert [stock.id for stock in page.items] == [1, 2]
+    assert decode_cursor(page.next_cursor) == 2
+    mock_repository.get_page.assert_called_once_with(None, 3, frozenset({"branch"}), None)
+
+
+def test_get_page_last_page(queries, mock_repository, make_book_stock):
+    mock_repository.get_page.return_value = [make_book_stock(id=5)]
+
+    page = queries.get_page(encode_cursor(4), 2)
+
+    assert page.next_cursor is None
+    mock_repository.get_page.assert_called_once_with(4, 3, BOOK_STOCK_RELATIONS, None)
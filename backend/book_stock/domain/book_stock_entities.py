@@ -4,6 +4,9 @@ from typing import Optional
 from book.domain.book_entities import Book
 from branch.domain.branch_entities import Branch
 
+BOOK_STOCK_RELATIONS = frozenset({"book", "branch"})
+BOOK_STOCK_FIELDS = frozenset({"id", "book", "branch", "shelf", "floor", "room", "status"})
+
 
 @dataclass
 class BookStock:
@@ -14,3 +17,27 @@ class BookStock:
     room: str
     status: str
     id: Optional[int] = None
+
+
+@dataclass
+class BookStockPage:
+    items: list[BookStock]
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class BookStockBulkResult:
+    index: int
+    status: str
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BookAvailability:
+    book: int
+    branch: int
+    available: int = 0
+    borrowed: int = 0
+    reserved: int = 0
+    lost: int = 0
@@ -0,0 +1,2 @@
+class CopyUnavailable(ValueError):
+    pass
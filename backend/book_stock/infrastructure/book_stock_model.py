@@ -27,6 +27,7 @@ class BookStockModel(models.Model):
     class Meta:
         indexes = [
             Index(fields=["status"], name="bookstock_status_idx"),
+            Index(fields=["book", "branch", "status"], name="bookstock_bk_br_status_idx"),
         ]
 
     def __str__(self):
@@ -1,27 +1,52 @@
 import logging
 from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
 
 from book.infrastructure.repository.book_model import BookModel
 from branch.infrastructure.branch_model import BranchModel
 from book_stock.domain.book_stock_command_interface import BookStockCommandInterface
 from book_stock.domain.book_stock_query_interface import BookStockQueryInterface
-from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_entities import (
+    BOOK_STOCK_RELATIONS,
+    BookAvailability,
+    BookStock,
+    BookStockBulkResult,
+)
+from book_stock.domain.book_stock_exceptions import CopyUnavailable
 from .book_stock_model import BookStockModel
 
 
 class BookStockRepository(BookStockCommandInterface, BookStockQueryInterface):
+    # Stock status -> BookAvailability field; any other status is never written onto the entity.
+    AVAILABILITY_FIELDS = {
+        "available": "available",
+        "borrowed": "borrowed",
+        "reserved": "reserved",
+        "lost": "lost",
+    }
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    def get_all(self) -> list[BookStock]:
+    def get_all(self, expand: frozenset[str] = BOOK_STOCK_RELATIONS,
+                fields: frozenset[str] | None = None) -> list[BookStock]:
         self.logger.info("[BookStockRepository] Fetching all book stock records from the database")
-        stocks = BookStockModel.objects.all()
-        return [self._to_entity(obj) for obj in stocks]
+        stocks = self._listing_queryset(expand, fields)
+        return [self._to_entity(obj, expand, fields) for obj in stocks]
+
+    def get_page(self, after_id: int | None, limit: int, expand: frozenset[str] = BOOK_STOCK_RELATIONS,
+                 fields: frozenset[str] | None = None) -> list[BookStock]:
+        self.logger.info(f"[BookStockRepository] get_page(after_id={after_id}, limit={limit}, expand={sorted(expand)})")
+        queryset = self._listing_queryset(expand, fields)
+        if after_id is not None:
+            queryset = queryset.filter(id__gt=after_id)
+        return [self._to_entity(obj, expand, fields) for obj in queryset[:limit]]
 
     def get_by_id(self, book_stock_id: int) -> BookStock:
         self.logger.info(f"[BookStockRepository] Fetching book stock with ID {book_stock_id}")
         try:
-            obj = BookStockModel.objects.get(id=book_stock_id)
+            obj = self._listing_queryset(BOOK_STOCK_RELATIONS).get(id=book_stock_id)
             self.logger.info(f"[BookStockRepository] Book stock {book_stock_id} retrieved successfully")
             return self._to_entity(obj)
         except BookStockModel.DoesNotExist:
@@ -39,7 +64,8 @@ class BookStockRepository(BookStockCommandInterface, BookStockQueryInterface):
             data["book"] = BookModel.objects.get(id=book_stock.book)
             data["branch"] = BranchModel.objects.get(id=book_stock.branch)
 
-            obj = BookStockModel.objects.create(**data)
+            with transaction.atomic():
+                obj = BookStockModel.objects.create(**data)
             self.logger.info(f"[BookStockRepository] Book stock created with ID {obj.id}")
             return self._to_entity(obj)
         except Exception:
@@ -54,10 +80,13 @@ class BookStockRepository(BookStockCommandInterface, BookStockQueryInterface):
             data["book"] = BookModel.objects.get(id=book_stock.book)
             data["branch"] = BranchModel.objects.get(id=book_stock.branch)
 
-            updated = BookStockModel.objects.filter(id=book_stock_id).update(**data)
-            if updated == 0:
-                self.logger.warning(f"[BookStockRepository] Book stock {book_stock_id} not found for update")
-                raise BookStockModel.DoesNotExist(f"BookStock {book_stock_id} not found")
+            with transaction.atomic():
+                old = self._lock_rows([book_stock_id])
+                if not old:
+                    self.logger.warning(f"[BookStockRepository] Book stock {book_stock_id} not found for update")
+                    raise BookStockModel.DoesNotExist(f"BookStock {book_stock_id} not found")
+
+                BookStockModel.objects.filter(id=book_stock_id).update(**data, updated_at=timezone.now())
 
             obj = BookStockModel.objects.get(id=book_stock_id)
             self.logger.info(f"[BookStockRepository] Book stock {book_stock_id} updated successfully")
@@ -69,15 +98,85 @@ class BookStockRepository(BookStockCommandInterface, BookStockQueryInterface):
     def delete(self, book_stock_id: int) -> None:
         self.logger.info(f"[BookStockRepository] Deleting book stock ID {book_stock_id}")
         try:
-            deleted, _ = BookStockModel.objects.filter(id=book_stock_id).delete()
-            if deleted == 0:
-                self.logger.warning(f"[BookStockRepository] Book stock {book_stock_id} not found for deletion")
-                raise BookStockModel.DoesNotExist(f"BookStock {book_stock_id} not found")
+            with transaction.atomic():
+                old = self._lock_rows([book_stock_id])
+                if not old:
+                    self.logger.warning(f"[BookStockRepository] Book stock {book_stock_id} not found for deletion")
+                    raise BookStockModel.DoesNotExist(f"BookStock {book_stock_id} not found")
+
+                BookStockModel.objects.filter(id=book_stock_id).delete()
             self.logger.info(f"[BookStockRepository] Book stock {book_stock_id} deleted successfully")
         except Exception:
             self.logger.exception(f"[BookStockRepository] Unexpected error deleting book stock {book_stock_id}")
             raise
 
+    def bulk_create(self, book_stocks: list[BookStock]) -> list[BookStockBulkResult]:
+        self.logger.info(f"[BookStockRepository] Bulk creating {len(book_stocks)} book stock entries")
+        books = set(BookModel.objects.filter(
+            id__in={s.book for s in book_stocks}).values_list("id", flat=True))
+        branches = set(BranchModel.objects.filter(
+            id__in={s.branch for s in book_stocks}).values_list("id", flat=True))
+
+        results = []
+        pending = []
+        for index, book_stock in enumerate(book_stocks):
+            result = BookStockBulkResult(index=index, status="failed")
+            results.append(result)
+            if book_stock.book not in books:
+                result.error = f"Book {book_stock.book} not found"
+            elif book_stock.branch not in branches:
+                result.error = f"Branch {book_stock.branch} not found"
+            else:
+                data = book_stock.__dict__.copy()
+                data.pop("id", None)
+                data["book_id"] = data.pop("book")
+                data["branch_id"] = data.pop("branch")
+                pending.append((result, BookStockModel(**data)))
+
+        created = []
+        if pending:
+            try:
+                with transaction.atomic():
+                    created = BookStockModel.objects.bulk_create([obj for _, obj in pending])
+            except Exception:
+                self.logger.exception("[BookStockRepository] Unexpected error bulk creating book stock")
+                raise
+
+        for (result, _), obj in zip(pending, created):
+            result.status = "created"
+            result.id = obj.id
+
+        self.logger.info(f"[BookStockRepository] Bulk created {len(created)} of {len(book_stocks)} entries")
+        return results
+
+    def bulk_update_status(self, book_stock_ids: list[int], new_status: str) -> list[BookStockBulkResult]:
+        self.logger.info(f"[BookStockRepository] Moving {len(book_stock_ids)} copies to status '{new_status}'")
+        try:
+            with transaction.atomic():
+                rows = self._lock_rows(book_stock_ids)
+                found = {row["id"] for row in rows}
+                BookStockModel.objects.filter(id__in=found).update(status=new_status, updated_at=timezone.now())
+        except Exception:
+            self.logger.exception("[BookStockRepository] Unexpected error bulk updating book stock status")
+            raise
+
+        self.logger.info(f"[BookStockRepository] Updated {len(found)} of {len(book_stock_ids)} copies")
+        return self._bulk_results(book_stock_ids, found, "updated")
+
+    def bulk_delete(self, book_stock_ids: list[int]) -> list[BookStockBulkResult]:
+        self.logger.info(f"[BookStockRepository] Bulk deleting {len(book_stock_ids)} book stock entries")
+        try:
+            with transaction.atomic():
+                rows = self._lock_rows(book_stock_ids)
+                found = {row["id"] for row in rows}
+                BookStockModel.objects.filter(id__in=found).delete()
+        except Exception:
+            self.logger.exception("[BookStockRepository] Unexpected error bulk deleting book stock")
+            raise
+
+        self.logger.info(f"[BookStockRepository] Deleted {len(found)} of {len(book_stock_ids)} copies")
+        return self._bulk_results(book_stock_ids, found, "deleted")
+
     def move_copy(self, book_stock_id: int, new_status: str) -> BookStock:
         self.logger.info(f"[BookStockRepository] Moving copy {book_stock_id} to status '{new_status}'")
         try:
@@ -102,13 +201,140 @@ class BookStockRepository(BookStockCommandInterface, BookStockQueryInterface):
             self.logger.exception(f"[BookStockRepository] Failed to move copy {book_stock_id}")
             raise
 
-    def _to_entity(self, obj: BookStockModel) -> BookStock:
+    def claim_copy(self, book_id: int, branch_id: int, new_status: str) -> BookStock:
+        self.logger.info(
+            f"[BookStockRepository] Claiming an available copy of book {book_id} at branch {branch_id} as '{new_status}'"
+        )
+        try:
+            with transaction.atomic():
+                # SKIP LOCKED lets concurrent desks each grab a different free copy instead of
+                # queueing on the same row; of=("self",) keeps the joined book/branch rows unlocked.
+                copy = (
+                    BookStockModel.objects.select_for_update(skip_locked=True, of=("self",))
+                    .select_related("book", "branch")
+                    .filter(book_id=book_id, branch_id=branch_id, status="available")
+                    .order_by("id")
+                    .first()
+                )
+                if copy is None:
+                    self.logger.warning(
+                        f"[BookStockRepository] No free copy of book {book_id} at branch {branch_id}"
+                    )
+                    raise CopyUnavailable("No available copy")
+
+                copy.status = new_status
+                copy.save(update_fields=["status", "updated_at"])
+        except CopyUnavailable:
+            raise
+        except Exception:
+            self.logger.exception(f"[BookStockRepository] Failed to claim a copy of book {book_id}")
+            raise
+
+        self.logger.info(f"[BookStockRepository] Copy {copy.id} claimed as '{new_status}'")
+        return self._to_entity(copy)
+
+    def transition_copy(self, book_stock_id: int, from_statuses: tuple[str, ...], new_status: str) -> BookStock:
+        self.logger.info(
+            f"[BookStockRepository] Moving copy {book_stock_id} from {from_statuses} to '{new_status}'"
+        )
+        try:
+            with transaction.atomic():
+                copy = (
+                    BookStockModel.objects.select_for_update(of=("self",))
+                    .select_related("book", "branch")
+                    .get(id=book_stock_id)
+                )
+                if copy.status not in from_statuses:
+                    self.logger.warning(f"[BookStockRepository] Copy {book_stock_id} is not in {from_statuses}")
+                    raise CopyUnavailable(f"Copy is not {' or '.join(from_statuses)}")
+
+                copy.status = new_status
+                copy.save(update_fields=["status", "updated_at"])
+        except BookStockModel.DoesNotExist:
+            self.logger.warning(f"[BookStockRepository] Copy {book_stock_id} not found")
+            raise
+        except CopyUnavailable:
+            raise
+        except Exception:
+            self.logger.exception(f"[BookStockRepository] Failed to move copy {book_stock_id}")
+            raise
+
+        self.logger.info(f"[BookStockRepository] Copy {book_stock_id} successfully updated to '{new_status}'")
+        return self._to_entity(copy)
+
+    def get_availability(self, book_ids: list[int], branch_ids: list[int]) -> list[BookAvailability]:
+        self.logger.info(f"[BookStockRepository] Fetching availability for books {book_ids} at branches {branch_ids}")
+        # Counted from the stock rows on the (book, branch, status) index rather than kept in counter
+        # rows: a shared counter would be locked by every claim and serialise the SKIP LOCKED checkout.
+        queryset = BookStockModel.objects.all()
+        if book_ids:
+            queryset = queryset.filter(book_id__in=book_ids)
+        if branch_ids:
+            queryset = queryset.filter(branch_id__in=branch_ids)
+
+        summary: dict[tuple[int, int], BookAvailability] = {}
+        counts = (
+            queryset.values("book_id", "branch_id", "status")
+            .annotate(count=Count("id"))
+            .order_by("book_id", "branch_id")
+            .values_list("book_id", "branch_id", "status", "count")
+        )
+        for book_id, branch_id, status, count in counts:
+            field = self.AVAILABILITY_FIELDS.get(status)
+            if field is None:
+                self.logger.warning(f"[BookStockRepository] Ignoring stock rows with unknown status '{status}'")
+                continue
+            entry = summary.setdefault((book_id, branch_id), BookAvailability(book=book_id, branch=branch_id))
+            setattr(entry, field, count)
+        return list(summary.values())
+
+    @staticmethod
+    def _lock_rows(book_stock_ids: list[int]) -> list[dict]:
+        return list(
+            BookStockModel.objects.select_for_update()
+            .filter(id__in=book_stock_ids)
+            .order_by("id")
+            .values("id", "book_id", "branch_id", "status")
+        )
+
+    @staticmethod
+    def _bulk_results(book_stock_ids: list[int], found: set[int], status: str) -> list[BookStockBulkResult]:
+        return [
+            BookStockBulkResult(index=index, status=status, id=book_stock_id)
+            if book_stock_id in found else
+            BookStockBulkResult(index=index, status="failed", id=book_stock_id, error="BookStock not found")
+            for index, book_stock_id in enumerate(book_stock_ids)
+        ]
+
+    @staticmethod
+    def _listing_queryset(expand: frozenset[str], fields: frozenset[str] | None = None):
+        queryset = BookStockModel.objects.order_by("id")
+        if fields is not None:
+            # Relations not asked for are neither joined nor prefetched; only their FK column is read.
+            expand = expand & fields
+            queryset = queryset.only("id", *sorted(fields - {"id"}))
+        if expand:
+            queryset = queryset.select_related(*sorted(expand))
+        if "book" in expand:
+            queryset = queryset.prefetch_related("book__authors", "book__categories")
+        return queryset
+
+    def _to_entity(self, obj: BookStockModel, expand: frozenset[str] = BOOK_STOCK_RELATIONS,
+                   fields: frozenset[str] | None = None) -> BookStock:
+        def wanted(name: str) -> bool:
+            return fields is None or name in fields
+
+        def relation(name: str):
+            if not wanted(name):
+                return None
+            return getattr(obj, name) if name in expand else getattr(obj, f"{name}_id")
+
         return BookStock(
             id=obj.id,
-            book=obj.book,
-            branch=obj.branch,
-            shelf=obj.shelf,
-            floor=obj.floor,
-            room=obj.room,
-            status=obj.status,
+            book=relation("book"),
+            branch=relation("branch"),
+            shelf=obj.shelf if wanted("shelf") else None,
+            floor=obj.floor if wanted("floor") else None,
+            room=obj.room if wanted("room") else None,
+            status=obj.status if wanted("status") else None,
         )
@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import Mock
 
+from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_exceptions import CopyUnavailable
 from book_stock.infrastructure.book_stock_model import BookStockModel
 from book_stock.infrastructure.book_stock_repository import BookStockRepository
 
@@ -29,25 +31,87 @@ def repository():
     return BookStockRepository()
 
 
+@pytest.fixture(autouse=True)
+def mock_atomic(mocker):
+    return mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.transaction.atomic", return_value=mocker.MagicMock()
+    )
+
+
+def lock_rows(mocker, rows):
+    return mocker.patch.object(BookStockRepository, "_lock_rows", return_value=rows)
+
+
 def test_get_all(repository, mocker, make_book_stock_model):
     mock_objs = [
         make_book_stock_model(book=mocker.Mock(id=101)),
         make_book_stock_model(id=2, book=mocker.Mock(id=102)),
     ]
     mock_qs = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
-    mock_qs.all.return_value = mock_objs
+    mock_qs.order_by.return_value.select_related.return_value.prefetch_related.return_value = mock_objs
 
     result = repository.get_all()
 
     assert len(result) == 2
     assert result[0].book.id == 101
     assert result[1].book.id == 102
+    mock_qs.order_by.return_value.select_related.assert_called_once_with("book", "branch")
+    mock_qs.order_by.return_value.select_related.return_value.prefetch_related.assert_called_once_with(
+        "book__authors", "book__categories"
+    )
+
+
+def test_get_all_without_expand_returns_ids(repository, mocker, make_book_stock_model):
+    mock_obj = make_book_stock_model()
+    mock_obj.book_id, mock_obj.branch_id = 101, 202
+    mock_qs = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
+    mock_qs.order_by.return_value = [mock_obj]
+
+    result = repository.get_all(frozenset())
+
+    assert result[0].book == 101
+    assert result[0].branch == 202
+
+
+def test_get_page_applies_cursor_and_limit(repository, mocker, make_book_stock_model):
+    mock_qs = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
+    queryset = mock_qs.order_by.return_value.select_related.return_value
+    queryset.filter.return_value = [make_book_stock_model(id=11), make_book_stock_model(id=12)]
+
+    result = repository.get_page(10, 1, frozenset({"branch"}))
+
+    assert [stock.id for stock in result] == [11]
+    mock_qs.order_by.return_value.select_related.assert_called_once_with("branch")
+    queryset.filter.assert_called_once_with(id__gt=10)
+
+
+def test_listing_queryset_sql_respects_fields():
+    sql = str(BookStockRepository._listing_queryset(
+        frozenset({"book", "branch"}), frozenset({"id", "shelf", "branch"})
+    ).query)
+
+    assert '"book_stock_bookstockmodel"."shelf"' in sql
+    assert '"book_stock_bookstockmodel"."room"' not in sql
+    assert '"branch_branchmodel"' in sql
+    assert '"book_bookmodel"' not in sql
+
+
+def test_get_page_with_fields_leaves_unrequested_values_empty(repository, mocker, make_book_stock_model):
+    obj = make_book_stock_model(id=11)
+    mock_listing = mocker.patch.object(BookStockRepository, "_listing_queryset")
+    mock_listing.return_value.__getitem__ = mocker.Mock(return_value=[obj])
+    fields = frozenset({"status", "book"})
+
+    result = repository.get_page(None, 5, frozenset(), fields)
+
+    mock_listing.assert_called_once_with(frozenset(), fields)
+    assert (result[0].status, result[0].book, result[0].shelf, result[0].branch) == (obj.status, obj.book_id, None, None)
 
 
 def test_get_by_id_found(repository, mocker, make_book_stock_model):
     mock_obj = make_book_stock_model(id=1)
-    mock_get = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects.get")
-    mock_get.return_value = mock_obj
+    mock_listing = mocker.patch.object(BookStockRepository, "_listing_queryset")
+    mock_listing.return_value.get.return_value = mock_obj
 
     result = repository.get_by_id(1)
 
@@ -55,16 +119,16 @@ def test_get_by_id_found(repository, mocker, make_book_stock_model):
 
 
 def test_get_by_id_not_found(repository, mocker):
-    mock_get = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects.get")
-    mock_get.side_effect = BookStockModel.DoesNotExist()
+    mock_listing = mocker.patch.object(BookStockRepository, "_listing_queryset")
+    mock_listing.return_value.get.side_effect = BookStockModel.DoesNotExist()
 
     with pytest.raises(BookStockModel.DoesNotExist):
         repository.get_by_id(999)
 
 
 def test_get_by_id_unexpected_exception(repository, mocker):
-    mock_get = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects.get")
-    mock_get.side_effect = Exception("unexpected")
+    mock_listing = mocker.patch.object(BookStockRepository, "_listing_queryset")
+    mock_listing.return_value.get.side_effect = Exception("unexpected")
 
     with pytest.raises(Exception):
         repository.get_by_id(1)
@@ -104,6 +168,7 @@ def test_update_book_stock_success(repository, mocker, make_book_stock_model):
     mock_book = mocker.Mock(id=105)
     mock_branch = mocker.Mock(id=205)
     mock_obj = make_book_stock_model(id=1, book=mock_book, branch=mock_branch)
+    lock_rows(mocker, [{"id": 1, "book_id": 101, "branch_id": 202, "status": "borrowed"}])
 
     mocker.patch("book_stock.infrastructure.book_stock_repository.BookModel.objects.get", return_value=mock_book)
     mocker.patch("book_stock.infrastructure.book_stock_repository.BranchModel.objects.get", return_value=mock_branch)
@@ -125,14 +190,14 @@ def test_update_book_stock_not_found(repository, mocker, make_book_stock_model):
 
     mocker.patch("book_stock.infrastructure.book_stock_repository.BookModel.objects.get", return_value=mock_entity.book)
     mocker.patch("book_stock.infrastructure.book_stock_repository.BranchModel.objects.get", return_value=mock_entity.branch)
-    mock_filter = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects.filter")
-    mock_filter.return_value.update.return_value = 0
+    lock_rows(mocker, [])
 
     with pytest.raises(BookStockModel.DoesNotExist):
         repository.update(999, mock_entity)
 
 
 def test_delete_book_stock_success(repository, mocker):
+    lock_rows(mocker, [{"id": 1, "book_id": 101, "branch_id": 202, "status": "available"}])
     mock_filter = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects.filter")
     mock_filter.return_value.delete.return_value = (1, {})
 
@@ -141,11 +206,12 @@ def test_delete_book_stock_success(repository, mocker):
 
 
 def test_delete_book_stock_not_found(repository, mocker):
+    lock_rows(mocker, [])
     mock_filter = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects.filter")
-    mock_filter.return_value.delete.return_value = (0, {})
 
     with pytest.raises(BookStockModel.DoesNotExist):
         repository.delete(999)
+    mock_filter.return_value.delete.assert_not_called()
 
 
 def test_move_copy_success(repository, mocker, make_book_stock_model):
@@ -156,7 +222,6 @@ def test_move_copy_success(repository, mocker, make_book_stock_model):
     )
     mock_get.return_value.get.return_value = copy_model
     mocker.patch.object(copy_model, "save")
-    mocker.patch("book_stock.infrastructure.book_stock_repository.transaction.atomic", return_value=mocker.MagicMock())
 
     result = repository.move_copy(1, "reserved")
 
@@ -171,7 +236,6 @@ def test_move_copy_not_found(repository, mocker):
     )
     mock_get.return_value.get.side_effect = BookStockModel.DoesNotExist
 
-    mocker.patch("book_stock.infrastructure.book_stock_repository.transaction.atomic", return_value=mocker.MagicMock())
 
     with pytest.raises(BookStockModel.DoesNotExist):
         repository.move_copy(999, "in_transit")
@@ -184,7 +248,178 @@ def test_move_copy_invalid_status(repository, mocker, make_book_stock_model):
         "book_stock.infrastructure.book_stock_repository.BookStockModel.objects.select_for_update"
     )
     mock_get.return_value.get.return_value = copy_model
-    mocker.patch("book_stock.infrastructure.book_stock_repository.transaction.atomic", return_value=mocker.MagicMock())
 
     with pytest.raises(ValueError, match="Copy is not available"):
         repository.move_copy(1, "in_transit")
+
+
+def make_book_stock_entity(**overrides):
+    data = {"book": 101, "branch": 202, "shelf": "A1", "floor": "1", "room": "B", "status": "available"}
+    data.update(overrides)
+    return BookStock(**data)
+
+
+def test_bulk_create_reports_missing_references(repository, mocker):
+    mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BookModel.objects"
+    ).filter.return_value.values_list.return_value = [101]
+    mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BranchModel.objects"
+    ).filter.return_value.values_list.return_value = [202]
+    mock_objects = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
+    mock_objects.bulk_create.side_effect = lambda objs: [mocker.Mock(id=10 + i) for i, _ in enumerate(objs)]
+
+    results = repository.bulk_create([
+        make_book_stock_entity(),
+        make_book_stock_entity(book=999),
+        make_book_stock_entity(branch=999),
+        make_book_stock_entity(),
+    ])
+
+    assert [r.status for r in results] == ["created", "failed", "failed", "created"]
+    assert [r.id for r in results] == [10, None, None, 11]
+    assert results[1].error == "Book 999 not found"
+    assert results[2].error == "Branch 999 not found"
+    inserted = mock_objects.bulk_create.call_args.args[0]
+    assert [obj.book_id for obj in inserted] == [101, 101]
+
+
+def test_bulk_create_skips_insert_when_nothing_valid(repository, mocker):
+    mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BookModel.objects"
+    ).filter.return_value.values_list.return_value = []
+    mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BranchModel.objects"
+    ).filter.return_value.values_list.return_value = [202]
+    mock_objects = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
+
+    results = repository.bulk_create([make_book_stock_entity()])
+
+    assert results[0].status == "failed"
+    mock_objects.bulk_create.assert_not_called()
+
+
+def test_bulk_update_status_marks_missing_ids(repository, mocker):
+    mock_objects = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
+    lock_rows(mocker, [
+        {"id": 1, "book_id": 101, "branch_id": 202, "status": "available"},
+        {"id": 3, "book_id": 101, "branch_id": 202, "status": "borrowed"},
+    ])
+
+    results = repository.bulk_update_status([1, 2, 3], "lost")
+
+    assert [(r.id, r.status) for r in results] == [(1, "updated"), (2, "failed"), (3, "updated")]
+    assert results[1].error == "BookStock not found"
+    mock_objects.filter.assert_called_once_with(id__in={1, 3})
+    assert mock_objects.filter.return_value.update.call_args.kwargs["status"] == "lost"
+
+
+def test_bulk_delete(repository, mocker):
+    mock_objects = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
+    lock_rows(mocker, [{"id": 2, "book_id": 101, "branch_id": 202, "status": "lost"}])
+
+    results = repository.bulk_delete([1, 2])
+
+    assert [r.status for r in results] == ["failed", "deleted"]
+    mock_objects.filter.return_value.delete.assert_called_once()
+
+
+def test_claim_copy_skips_locked_rows(repository, mocker, make_book_stock_model):
+    copy_model = make_book_stock_model(id=7, status="available")
+    mock_select = mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BookStockModel.objects.select_for_update"
+    )
+    chain = mock_select.return_value.select_related.return_value.filter.return_value
+    chain.order_by.return_value.first.return_value = copy_model
+
+    result = repository.claim_copy(101, 202, "borrowed")
+
+    assert result.id == 7
+    assert result.status == "borrowed"
+    mock_select.assert_called_once_with(skip_locked=True, of=("self",))
+    mock_select.return_value.select_related.return_value.filter.assert_called_once_with(
+        book_id=101, branch_id=202, status="available"
+    )
+    copy_model.save.assert_called_once_with(update_fields=["status", "updated_at"])
+
+
+def test_claim_copy_none_available(repository, mocker):
+    mock_select = mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BookStockModel.objects.select_for_update"
+    )
+    chain = mock_select.return_value.select_related.return_value.filter.return_value
+    chain.order_by.return_value.first.return_value = None
+
+    with pytest.raises(CopyUnavailable):
+        repository.claim_copy(101, 202, "reserved")
+
+
+def test_transition_copy_success(repository, mocker, make_book_stock_model):
+    copy_model = make_book_stock_model(id=3, status="borrowed")
+    mock_select = mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BookStockModel.objects.select_for_update"
+    )
+    mock_select.return_value.select_related.return_value.get.return_value = copy_model
+
+    result = repository.transition_copy(3, ("borrowed",), "available")
+
+    assert result.id == 3
+    assert result.status == "available"
+    mock_select.assert_called_once_with(of=("self",))
+
+
+def test_transition_copy_wrong_status(repository, mocker, make_book_stock_model):
+    copy_model = make_book_stock_model(id=3, status="lost")
+    mock_select = mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BookStockModel.objects.select_for_update"
+    )
+    mock_select.return_value.select_related.return_value.get.return_value = copy_model
+
+    with pytest.raises(CopyUnavailable, match="Copy is not borrowed or reserved"):
+        repository.transition_copy(3, ("borrowed", "reserved"), "available")
+    copy_model.save.assert_not_called()
+
+
+def test_transition_copy_not_found(repository, mocker):
+    mock_select = mocker.patch(
+        "book_stock.infrastructure.book_stock_repository.BookStockModel.objects.select_for_update"
+    )
+    mock_select.return_value.select_related.return_value.get.side_effect = BookStockModel.DoesNotExist
+
+    with pytest.raises(BookStockModel.DoesNotExist):
+        repository.transition_copy(3, ("reserved",), "borrowed")
+
+
+def test_get_availability_pivots_status_counts(repository, mocker):
+    mock_objects = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
+    queryset = mock_objects.all.return_value
+    queryset.filter.return_value = queryset
+    queryset.values.return_value.annotate.return_value.order_by.return_value.values_list.return_value = [
+        (1, 10, "available", 3),
+        (1, 10, "borrowed", 2),
+        (1, 11, "reserved", 1),
+    ]
+
+    result = repository.get_availability([1], [])
+
+    assert [(a.book, a.branch, a.available, a.borrowed, a.reserved) for a in result] == [
+        (1, 10, 3, 2, 0),
+        (1, 11, 0, 0, 1),
+    ]
+    queryset.filter.assert_called_once_with(book_id__in=[1])
+    queryset.values.assert_called_once_with("book_id", "branch_id", "status")
+
+
+def test_get_availability_ignores_unknown_statuses(repository, mocker):
+    mock_objects = mocker.patch("book_stock.infrastructure.book_stock_repository.BookStockModel.objects")
+    counts = mock_objects.all.return_value.values.return_value.annotate.return_value.order_by.return_value
+    counts.values_list.return_value = [
+        (1, 10, "available", 3),
+        (1, 10, "book", 7),
+        (2, 10, "__class__", 1),
+    ]
+
+    result = repository.get_availability([], [])
+
+    # A status named like an entity field ("book") must not overwrite it.
+    assert [(a.book, a.branch, a.available) for a in result] == [(1, 10, 3)]
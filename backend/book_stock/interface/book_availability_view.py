@@ -0,0 +1,45 @@
+import logging
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from book_stock.application.queries.book_stock_queries import BookStockQueries
+from book_stock.interface.serializer.book_availability_output_serializer import BookAvailabilityOutputSerializer
+
+
+class BookAvailabilityView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stock_queries = BookStockQueries()
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, request):
+        self.logger.info(f"[BookAvailabilityView] GET /bookstock/availability | params: {dict(request.query_params)}")
+        try:
+            book_ids = self._parse_ids(request.query_params.get("book"))
+            branch_ids = self._parse_ids(request.query_params.get("branch"))
+        except ValueError as e:
+            self.logger.warning(f"[BookAvailabilityView] Invalid parameters: {e}")
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not book_ids and not branch_ids:
+            return Response({"detail": "book or branch is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            availability = self.stock_queries.get_availability(book_ids, branch_ids)
+            return Response(BookAvailabilityOutputSerializer(availability, many=True).data)
+        except Exception:
+            self.logger.exception("[BookAvailabilityView] Error retrieving availability")
+            return Response({"detail": "Error retrieving availability"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @staticmethod
+    def _parse_ids(raw: str | None) -> list[int]:
+        if not raw:
+            return []
+        try:
+            return [int(value) for value in raw.split(",") if value.strip()]
+        except ValueError:
+            raise ValueError("Invalid id list")
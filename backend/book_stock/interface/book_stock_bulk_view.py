@@ -0,0 +1,103 @@
+import logging
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from book_stock.application.commands.book_stock_commands import BookStockCommands
+from book_stock.domain.book_stock_entities import BookStock, BookStockBulkResult
+from book_stock.interface.serializer.book_stock_bulk_serializer import (
+    BookStockBulkIdsInputSerializer,
+    BookStockBulkResultSerializer,
+    BookStockBulkStatusInputSerializer,
+)
+from book_stock.interface.serializer.book_stock_input_serializer import BookStockInputSerializer
+
+
+class BookStockBulkView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stock_commands = BookStockCommands()
+        self.logger = logging.getLogger(__name__)
+
+    def post(self, request):
+        items = request.data
+        if not isinstance(items, list):
+            self.logger.warning("[BookStockBulkView] POST /bookstock/bulk body is not a list")
+            return Response({"detail": "Expected a list of book_stock entries"}, status=status.HTTP_400_BAD_REQUEST)
+
+        self.logger.info(f"[BookStockBulkView] POST /bookstock/bulk with {len(items)} items")
+        if len(items) > settings.BOOK_STOCK_BULK_MAX_ITEMS:
+            return self._too_many()
+
+        valid = []
+        invalid = []
+        for index, item in enumerate(items):
+            serializer = BookStockInputSerializer(data=item, context={'request': request})
+            if serializer.is_valid():
+                valid.append((index, BookStock(**serializer.validated_data)))
+            else:
+                invalid.append(BookStockBulkResult(index=index, status="failed", error=str(serializer.errors)))
+
+        try:
+            created = self.stock_commands.create_many([book_stock for _, book_stock in valid]) if valid else []
+        except Exception:
+            self.logger.exception("[BookStockBulkView] Error bulk creating book_stock")
+            return Response({"detail": "Error creating book_stock"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        for result in created:
+            result.index = valid[result.index][0]
+        return self._results(sorted(created + invalid, key=lambda result: result.index))
+
+    def patch(self, request):
+        self.logger.info("[BookStockBulkView] PATCH /bookstock/bulk requested")
+        serializer = BookStockBulkStatusInputSerializer(data=request.data)
+        if not serializer.is_valid():
+            self.logger.warning(f"[BookStockBulkView] PATCH validation failed: {serializer.errors}")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if len(serializer.validated_data["ids"]) > settings.BOOK_STOCK_BULK_MAX_ITEMS:
+            return self._too_many()
+
+        try:
+            results = self.stock_commands.update_status_many(
+                serializer.validated_data["ids"], serializer.validated_data["status"]
+            )
+        except Exception:
+            self.logger.exception("[BookStockBulkView] Error bulk updating book_stock")
+            return Response({"detail": "Error updating book_stock"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return self._results(results)
+
+    def delete(self, request):
+        self.logger.info("[BookStockBulkView] DELETE /bookstock/bulk requested")
+        serializer = BookStockBulkIdsInputSerializer(data=request.data)
+        if not serializer.is_valid():
+            self.logger.warning(f"[BookStockBulkView] DELETE validation failed: {serializer.errors}")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if len(serializer.validated_data["ids"]) > settings.BOOK_STOCK_BULK_MAX_ITEMS:
+            return self._too_many()
+
+        try:
+            results = self.stock_commands.delete_many(serializer.validated_data["ids"])
+        except Exception:
+            self.logger.exception("[BookStockBulkView] Error bulk deleting book_stock")
+            return Response({"detail": "Error deleting book_stock"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return self._results(results)
+
+    def _results(self, results: list[BookStockBulkResult]):
+        failed = sum(1 for result in results if result.status == "failed")
+        self.logger.info(f"[BookStockBulkView] Processed {len(results)} entries, {failed} failed")
+        return Response({
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "results": BookStockBulkResultSerializer(results, many=True).data,
+        })
+
+    def _too_many(self):
+        return Response(
+            {"detail": f"At most {settings.BOOK_STOCK_BULK_MAX_ITEMS} entries per request"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
@@ -0,0 +1,52 @@
+import logging
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from book_stock.application.commands.book_stock_commands import BookStockCommands
+from book_stock.domain.book_stock_exceptions import CopyUnavailable
+from book_stock.interface.serializer.book_stock_input_serializer import BookStockClaimInputSerializer
+from book_stock.interface.serializer.book_stock_output_serializer import BookStockOutputSerializer
+
+
+class BookStockCirculationView(APIView):
+    """Desk operations: ``checkout``/``reserve`` claim any free copy of a book at a branch,
+    ``pick_up``/``return_copy`` move a specific copy. The operation is bound in the urlconf."""
+
+    permission_classes = [IsAuthenticated]
+    CLAIM_ACTIONS = ("checkout", "reserve")
+    COPY_ACTIONS = ("pick_up", "return_copy")
+    action = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.stock_commands = BookStockCommands()
+        self.logger = logging.getLogger(__name__)
+
+    def post(self, request, book_stock_id: int = None):
+        self.logger.info(f"[BookStockCirculationView] POST {self.action} | copy={book_stock_id} data={request.data}")
+        if self.action in self.CLAIM_ACTIONS:
+            serializer = BookStockClaimInputSerializer(data=request.data)
+            if not serializer.is_valid():
+                self.logger.warning(f"[BookStockCirculationView] {self.action} validation failed: {serializer.errors}")
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            args = (serializer.validated_data["book"], serializer.validated_data["branch"])
+        elif self.action in self.COPY_ACTIONS:
+            args = (book_stock_id,)
+        else:
+            raise ValueError(f"Unknown circulation action {self.action}")
+
+        try:
+            book_stock = getattr(self.stock_commands, self.action)(*args)
+            self.logger.info(f"[BookStockCirculationView] {self.action} succeeded for copy {book_stock.id}")
+            return Response(BookStockOutputSerializer(book_stock).data)
+        except CopyUnavailable as e:
+            self.logger.warning(f"[BookStockCirculationView] {self.action} conflict: {e}")
+            return Response({"detail": str(e)}, status=status.HTTP_409_CONFLICT)
+        except ValueError:
+            self.logger.warning(f"[BookStockCirculationView] BookStock {book_stock_id} not found for {self.action}")
+            return Response({"detail": "BookStock not found"}, status=status.HTTP_404_NOT_FOUND)
+        except Exception:
+            self.logger.exception(f"[BookStockCirculationView] Error during {self.action}")
+            return Response({"detail": "Error updating book_stock"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1,8 +1,17 @@
 from django.urls import path
 
+from .book_availability_view import BookAvailabilityView
+from .book_stock_bulk_view import BookStockBulkView
+from .book_stock_circulation_view import BookStockCirculationView
 from .book_stock_view import BookStockView
 
 urlpatterns = [
     path('', BookStockView.as_view()),
+    path('availability/', BookAvailabilityView.as_view()),
+    path('bulk/', BookStockBulkView.as_view()),
+    path('checkout/', BookStockCirculationView.as_view(action="checkout")),
+    path('reserve/', BookStockCirculationView.as_view(action="reserve")),
     path('<int:book_stock_id>/', BookStockView.as_view()),
+    path('<int:book_stock_id>/pickup/', BookStockCirculationView.as_view(action="pick_up")),
+    path('<int:book_stock_id>/return/', BookStockCirculationView.as_view(action="return_copy")),
 ]
@@ -6,9 +6,13 @@ from rest_framework.views import APIView
 
 from book_stock.application.commands.book_stock_commands import BookStockCommands
 from book_stock.application.queries.book_stock_queries import BookStockQueries
-from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_entities import BOOK_STOCK_FIELDS, BOOK_STOCK_RELATIONS, BookStock
 from book_stock.interface.serializer.book_stock_input_serializer import BookStockInputSerializer
-from book_stock.interface.serializer.book_stock_output_serializer import BookStockOutputSerializer
+from book_stock.interface.serializer.book_stock_output_serializer import (
+    BookStockOutputSerializer, book_stock_output_encoder,
+)
+from config.fieldsets import parse_fieldset
+from config.pagination import resolve_page_size
 
 
 class BookStockView(APIView):
@@ -37,15 +41,49 @@ class BookStockView(APIView):
 
         self.logger.info("[BookStockView] GET /bookstock list requested")
         try:
-            book_stocks = self.stock_queries.get_all()
+            expand = self._parse_expand(request.query_params.get("expand"))
+            fields = parse_fieldset(
+                request.query_params.get("fields"), request.query_params.get("exclude"), BOOK_STOCK_FIELDS
+            )
+        except ValueError as e:
+            self.logger.warning(f"[BookStockView] Invalid expand or fields parameter: {e}")
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            if "cursor" in request.query_params or "limit" in request.query_params:
+                return self._get_page(request, expand, fields)
+
+            book_stocks = self.stock_queries.get_all(expand, fields)
             self.logger.info(f"[BookStockView] Returned {len(book_stocks)} stocks")
-            serializer = BookStockOutputSerializer(book_stocks, many=True)
-            return Response(serializer.data)
+            encode = book_stock_output_encoder(expand, fields)
+            return Response([encode(book_stock) for book_stock in book_stocks])
         except Exception:
             self.logger.exception(f"[BookStockView] Error retrieving book_stock list")
             return Response({"detail": "Error retrieving book_stock list"},
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _get_page(self, request, expand: frozenset[str], fields: frozenset[str] | None):
+        try:
+            limit = resolve_page_size(request.query_params.get("limit"))
+            page = self.stock_queries.get_page(request.query_params.get("cursor"), limit, expand, fields)
+        except ValueError as e:
+            self.logger.warning(f"[BookStockView] Invalid pagination parameters: {e}")
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        self.logger.info(f"[BookStockView] Returned page with {len(page.items)} stocks")
+        encode = book_stock_output_encoder(expand, fields)
+        return Response({"results": [encode(book_stock) for book_stock in page.items], "next": page.next_cursor})
+
+    @staticmethod
+    def _parse_expand(raw: str | None) -> frozenset[str]:
+        if raw is None:
+            return BOOK_STOCK_RELATIONS
+        expand = frozenset(value.strip() for value in raw.split(",") if value.strip())
+        unknown = expand - BOOK_STOCK_RELATIONS
+        if unknown:
+            raise ValueError(f"Invalid expand: {', '.join(sorted(unknown))}")
+        return expand
+
     def post(self, request):
         self.logger.info(f"[BookStockView] POST /bookstock | Request data: {request.data}")
         serializer = BookStockInputSerializer(data=request.data, context={'request': request})
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+
+class BookAvailabilityOutputSerializer(serializers.Serializer):
+    book = serializers.IntegerField()
+    branch = serializers.IntegerField()
+    available = serializers.IntegerField()
+    borrowed = serializers.IntegerField()
+    reserved = serializers.IntegerField()
+    lost = serializers.IntegerField()
@@ -0,0 +1,18 @@
+from rest_framework import serializers
+
+from book_stock.infrastructure.book_stock_model import BookStockModel
+
+
+class BookStockBulkIdsInputSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+
+class BookStockBulkStatusInputSerializer(BookStockBulkIdsInputSerializer):
+    status = serializers.ChoiceField(choices=BookStockModel.STATUS)
+
+
+class BookStockBulkResultSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    status = serializers.CharField()
+    id = serializers.IntegerField(allow_null=True)
+    error = serializers.CharField(allow_null=True)
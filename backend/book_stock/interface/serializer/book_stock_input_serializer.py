@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from book_stock.infrastructure.book_stock_model import BookStockModel
+
 
 class BookStockInputSerializer(serializers.Serializer):
     book = serializers.IntegerField()
@@ -7,4 +9,9 @@ class BookStockInputSerializer(serializers.Serializer):
     shelf = serializers.CharField(max_length=255)
     floor = serializers.CharField(max_length=255)
     room = serializers.CharField(max_length=255)
-    status = serializers.CharField(max_length=50)
+    status = serializers.ChoiceField(choices=BookStockModel.STATUS)
+
+
+class BookStockClaimInputSerializer(serializers.Serializer):
+    book = serializers.IntegerField()
+    branch = serializers.IntegerField()
@@ -1,10 +1,15 @@
+from functools import lru_cache
+from typing import Any, Callable
+
 from rest_framework import serializers
 
 from book.interface.serializer.book_output_serializer import BookOutputSerializer
 from branch.interface.serializer.branch_output_serializer import BranchOutputSerializer
+from config.fast_serializer import compile_serializer
+from config.fieldsets import SparseFieldsetMixin
 
 
-class BookStockOutputSerializer(serializers.Serializer):
+class BookStockOutputSerializer(SparseFieldsetMixin, serializers.Serializer):
     id = serializers.IntegerField()
     book = BookOutputSerializer()
     branch = BranchOutputSerializer()
@@ -12,3 +17,17 @@ class BookStockOutputSerializer(serializers.Serializer):
     floor = serializers.CharField(max_length=255)
     room = serializers.CharField(max_length=255)
     status = serializers.CharField(max_length=50)
+
+    def __init__(self, *args, expand: frozenset[str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if expand is not None:
+            for relation in ("book", "branch"):
+                if relation not in expand and relation in self.fields:
+                    self.fields[relation] = serializers.IntegerField()
+
+
+@lru_cache(maxsize=64)
+def book_stock_output_encoder(expand: frozenset[str] | None = None,
+                              fields: frozenset[str] | None = None) -> Callable[[Any], dict]:
+    """Compiled BookStockOutputSerializer for list endpoints, built once per expand/fieldset pair."""
+    return compile_serializer(BookStockOutputSerializer(expand=expand, fields=fields))
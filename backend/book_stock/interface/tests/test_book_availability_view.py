@@ -0,0 +1,50 @@
+import pytest
+from rest_framework.test import APIClient
+
+from book_stock.domain.book_stock_entities import BookAvailability
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock())
+    return client
+
+
+@pytest.fixture
+def mock_queries(mocker):
+    return mocker.patch("book_stock.interface.book_availability_view.BookStockQueries").return_value
+
+
+def test_get_availability(client, mock_queries):
+    mock_queries.get_availability.return_value = [BookAvailability(book=1, branch=10, available=3, borrowed=1)]
+
+    response = client.get("/api/bookstock/availability/?book=1,2&branch=10")
+
+    assert response.status_code == 200
+    assert response.data == [
+        {"book": 1, "branch": 10, "available": 3, "borrowed": 1, "reserved": 0, "lost": 0}
+    ]
+    mock_queries.get_availability.assert_called_once_with([1, 2], [10])
+
+
+def test_get_availability_requires_filter(client, mock_queries):
+    response = client.get("/api/bookstock/availability/")
+
+    assert response.status_code == 400
+    mock_queries.get_availability.assert_not_called()
+
+
+def test_get_availability_invalid_ids(client, mock_queries):
+    response = client.get("/api/bookstock/availability/?book=abc")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid id list"
+
+
+def test_get_availability_exception(client, mock_queries):
+    mock_queries.get_availability.side_effect = Exception("db down")
+
+    response = client.get("/api/bookstock/availability/?branch=10")
+
+    assert response.status_code == 500
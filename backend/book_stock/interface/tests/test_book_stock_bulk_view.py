@@ -0,0 +1,99 @@
+import pytest
+from rest_framework.test import APIClient
+
+from book_stock.domain.book_stock_entities import BookStockBulkResult
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock())
+    return client
+
+
+@pytest.fixture
+def mock_commands(mocker):
+    return mocker.patch("book_stock.interface.book_stock_bulk_view.BookStockCommands").return_value
+
+
+def make_payload(**overrides):
+    data = {"book": 1, "branch": 1, "shelf": "A1", "floor": "1", "room": "B", "status": "available"}
+    data.update(overrides)
+    return data
+
+
+def test_post_bulk_creates_valid_and_reports_invalid(client, mock_commands):
+    mock_commands.create_many.return_value = [
+        BookStockBulkResult(index=0, status="created", id=10),
+        BookStockBulkResult(index=1, status="failed", error="Book 9 not found"),
+    ]
+
+    response = client.post("/api/bookstock/bulk/", [make_payload(), {}, make_payload(book=9)], format="json")
+
+    assert response.status_code == 200
+    assert response.data["succeeded"] == 1
+    assert response.data["failed"] == 2
+    assert [r["index"] for r in response.data["results"]] == [0, 1, 2]
+    assert response.data["results"][0]["id"] == 10
+    assert "book" in response.data["results"][1]["error"]
+    assert response.data["results"][2]["error"] == "Book 9 not found"
+    assert len(mock_commands.create_many.call_args.args[0]) == 2
+
+
+def test_post_bulk_requires_list(client):
+    response = client.post("/api/bookstock/bulk/", make_payload(), format="json")
+
+    assert response.status_code == 400
+
+
+def test_post_bulk_rejects_too_many_items(client, settings):
+    settings.BOOK_STOCK_BULK_MAX_ITEMS = 1
+
+    response = client.post("/api/bookstock/bulk/", [make_payload(), make_payload()], format="json")
+
+    assert response.status_code == 400
+
+
+def test_post_bulk_exception(client, mock_commands):
+    mock_commands.create_many.side_effect = Exception("db down")
+
+    response = client.post("/api/bookstock/bulk/", [make_payload()], format="json")
+
+    assert response.status_code == 500
+    assert response.data["detail"] == "Error creating book_stock"
+
+
+def test_patch_bulk_status(client, mock_commands):
+    mock_commands.update_status_many.return_value = [BookStockBulkResult(index=0, status="updated", id=3)]
+
+    response = client.patch("/api/bookstock/bulk/", {"ids": [3], "status": "lost"}, format="json")
+
+    assert response.status_code == 200
+    assert response.data["results"][0]["status"] == "updated"
+    mock_commands.update_status_many.assert_called_once_with([3], "lost")
+
+
+def test_patch_bulk_rejects_unknown_status(client, mock_commands):
+    response = client.patch("/api/bookstock/bulk/", {"ids": [3], "status": "stolen"}, format="json")
+
+    assert response.status_code == 400
+    mock_commands.update_status_many.assert_not_called()
+
+
+def test_delete_bulk(client, mock_commands):
+    mock_commands.delete_many.return_value = [
+        BookStockBulkResult(index=0, status="deleted", id=3),
+        BookStockBulkResult(index=1, status="failed", id=4, error="BookStock not found"),
+    ]
+
+    response = client.delete("/api/bookstock/bulk/", {"ids": [3, 4]}, format="json")
+
+    assert response.status_code == 200
+    assert response.data["failed"] == 1
+    mock_commands.delete_many.assert_called_once_with([3, 4])
+
+
+def test_delete_bulk_requires_ids(client):
+    response = client.delete("/api/bookstock/bulk/", {}, format="json")
+
+    assert response.status_code == 400
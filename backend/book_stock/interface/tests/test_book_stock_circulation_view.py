@@ -0,0 +1,88 @@
+import pytest
+from rest_framework.test import APIClient
+
+from book.domain.book_entities import Book
+from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_exceptions import CopyUnavailable
+from branch.domain.branch_entities import Branch
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock())
+    return client
+
+
+@pytest.fixture
+def mock_commands(mocker):
+    return mocker.patch("book_stock.interface.book_stock_circulation_view.BookStockCommands").return_value
+
+
+def make_book_stock(**overrides):
+    data = {
+        "id": 7,
+        "book": Book(id=1, title="Clean Code", isbn="1234567890123", publisher="PH", edition="1st",
+                     language="English", book_type="Technical", synopsis="", publication_date="2008-08-01",
+                     authors=[], categories=[]),
+        "branch": Branch(id=2, name="Central", location="Main St"),
+        "shelf": "A1",
+        "floor": "1",
+        "room": "B",
+        "status": "borrowed",
+    }
+    data.update(overrides)
+    return BookStock(**data)
+
+
+def test_checkout_any_copy(client, mock_commands):
+    mock_commands.checkout.return_value = make_book_stock()
+
+    response = client.post("/api/bookstock/checkout/", {"book": 1, "branch": 2}, format="json")
+
+    assert response.status_code == 200
+    assert response.data["id"] == 7
+    assert response.data["status"] == "borrowed"
+    mock_commands.checkout.assert_called_once_with(1, 2)
+
+
+def test_reserve_no_copy_available(client, mock_commands):
+    mock_commands.reserve.side_effect = CopyUnavailable("No available copy")
+
+    response = client.post("/api/bookstock/reserve/", {"book": 1, "branch": 2}, format="json")
+
+    assert response.status_code == 409
+    assert response.data["detail"] == "No available copy"
+
+
+def test_checkout_invalid(client, mock_commands):
+    response = client.post("/api/bookstock/checkout/", {"book": 1}, format="json")
+
+    assert response.status_code == 400
+    mock_commands.checkout.assert_not_called()
+
+
+def test_return_copy(client, mock_commands):
+    mock_commands.return_copy.return_value = make_book_stock(status="available")
+
+    response = client.post("/api/bookstock/7/return/")
+
+    assert response.status_code == 200
+    assert response.data["status"] == "available"
+    mock_commands.return_copy.assert_called_once_with(7)
+
+
+def test_pick_up_not_found(client, mock_commands):
+    mock_commands.pick_up.side_effect = ValueError("BookStock not found")
+
+    response = client.post("/api/bookstock/7/pickup/")
+
+    assert response.status_code == 404
+
+
+def test_return_copy_exception(client, mock_commands):
+    mock_commands.return_copy.side_effect = Exception("db down")
+
+    response = client.post("/api/bookstock/7/return/")
+
+    assert response.status_code == 500
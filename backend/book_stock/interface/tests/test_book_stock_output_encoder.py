@@ -0,0 +1,52 @@
+from datetime import date
+
+import pytest
+
+from book.domain.book_entities import Book
+from book_stock.domain.book_stock_entities import BOOK_STOCK_RELATIONS, BookStock
+from book_stock.interface.serializer.book_stock_output_serializer import (
+    BookStockOutputSerializer, book_stock_output_encoder,
+)
+from branch.domain.branch_entities import Branch
+
+
+def make_book_stock(**overrides):
+    data = {
+        "id": 7,
+        "book": Book(
+            id=1, title="Clean Code", isbn="1234567890123", publisher="Prentice Hall", edition="1st",
+            language="English", book_type="Technical", synopsis=None, publication_date=date(2008, 8, 1),
+            authors=[1], categories=[],
+        ),
+        "branch": Branch(id=2, name="Central Library", location="123 Main St"),
+        "shelf": "A1",
+        "floor": "1",
+        "room": "101",
+        "status": "available",
+    }
+    data.update(overrides)
+    return BookStock(**data)
+
+
+@pytest.mark.parametrize("expand, overrides", [
+    (None, {}),
+    (BOOK_STOCK_RELATIONS, {}),
+    (frozenset({"branch"}), {"book": 1}),
+    (frozenset(), {"book": 1, "branch": 2}),
+])
+def test_encoder_matches_drf_serializer(expand, overrides):
+    book_stock = make_book_stock(**overrides)
+
+    encoded = book_stock_output_encoder(expand)(book_stock)
+
+    assert encoded == BookStockOutputSerializer(book_stock, expand=expand).data
+
+
+def test_encoder_matches_drf_serializer_for_sparse_fieldsets():
+    book_stock = make_book_stock(book=1)
+    expand, fields = frozenset({"branch"}), frozenset({"id", "book", "status"})
+
+    encoded = book_stock_output_encoder(expand, fields)(book_stock)
+
+    assert encoded == BookStockOutputSerializer(book_stock, expand=expand, fields=fields).data
+    assert list(encoded) == ["id", "book", "status"]
@@ -2,7 +2,7 @@ import pytest
 from rest_framework.test import APIClient
 
 from book.domain.book_entities import Book
-from book_stock.domain.book_stock_entities import BookStock
+from book_stock.domain.book_stock_entities import BOOK_STOCK_RELATIONS, BookStock, BookStockPage
 from branch.domain.branch_entities import Branch
 
 
@@ -136,6 +136,21 @@ def test_post_book_stock_invalid(client):
     assert "book" in response.data
 
 
+def test_post_book_stock_invalid_status(client, make_book_stock):
+    data = make_book_stock()
+    response = client.post("/api/bookstock/", {
+        "book": data.book.id,
+        "branch": data.branch.id,
+        "shelf": data.shelf,
+        "floor": data.floor,
+        "room": data.room,
+        "status": "book"
+    }, format="json")
+
+    assert response.status_code == 400
+    assert "status" in response.data
+
+
 def test_post_book_stock_exception(client, mocker, make_book_stock):
     mock_command = mocker.patch("book_stock.interface.book_stock_view.BookStockCommands")
     mock_command().create.side_effect = Exception("unexpected")
@@ -242,3 +257,73 @@ def test_delete_book_stock_exception(client, mocker):
 
     assert response.status_code == 500
     assert response.data["detail"] == "Error deleting book_stock"
+
+
+def test_get_all_book_stocks_without_expand_returns_ids(client, mocker, make_book_stock):
+    mock_query = mocker.patch("book_stock.interface.book_stock_view.BookStockQueries")
+    mock_query().get_all.return_value = [make_book_stock(book=7, branch=3)]
+
+    response = client.get("/api/bookstock/?expand=")
+
+    assert response.status_code == 200
+    assert response.data[0]["book"] == 7
+    assert response.data[0]["branch"] == 3
+    mock_query().get_all.assert_called_once_with(frozenset(), None)
+
+
+def test_get_all_book_stocks_expand_branch_only(client, mocker, make_book_stock):
+    mock_query = mocker.patch("book_stock.interface.book_stock_view.BookStockQueries")
+    mock_query().get_all.return_value = [make_book_stock(book=7)]
+
+    response = client.get("/api/bookstock/?expand=branch")
+
+    assert response.data[0]["book"] == 7
+    assert response.data[0]["branch"]["name"] == "Central Library"
+
+
+def test_get_all_book_stocks_invalid_expand(client, mocker):
+    mocker.patch("book_stock.interface.book_stock_view.BookStockQueries")
+
+    response = client.get("/api/bookstock/?expand=shelf")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid expand: shelf"
+
+
+def test_get_book_stock_page(client, mocker, make_book_stock):
+    mock_query = mocker.patch("book_stock.interface.book_stock_view.BookStockQueries")
+    mock_query().get_page.return_value = BookStockPage(items=[make_book_stock()], next_cursor="abc")
+
+    response = client.get("/api/bookstock/?limit=1")
+
+    assert response.status_code == 200
+    assert response.data["next"] == "abc"
+    assert response.data["results"][0]["book"]["id"] == 1
+    mock_query().get_page.assert_called_once_with(None, 1, BOOK_STOCK_RELATIONS, None)
+
+
+def test_get_book_stock_page_invalid_limit(client, mocker):
+    mocker.patch("book_stock.interface.book_stock_view.BookStockQueries")
+
+    response = client.get("/api/bookstock/?limit=0")
+
+    assert response.status_code == 400
+
+
+def test_get_book_stocks_sparse_fields(client, mocker, make_book_stock):
+    mock_query = mocker.patch("book_stock.interface.book_stock_view.BookStockQueries")
+    mock_query().get_all.return_value = [make_book_stock(book=7, branch=None, shelf=None)]
+
+    response = client.get("/api/bookstock/?fields=id,book,status&expand=")
+
+    assert response.status_code == 200
+    assert set(response.data[0]) == {"id", "book", "status"}
+    assert response.data[0]["book"] == 7
+    mock_query().get_all.assert_called_once_with(frozenset(), frozenset({"id", "book", "status"}))
+
+
+def test_get_book_stocks_invalid_exclude(client):
+    response = client.get("/api/bookstock/?exclude=price")
+
+    assert response.status_code == 400
+    assert response.data["detail"] == "Invalid fields: price"
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('book', '0003_bookmodel_book_synopsis_trgm_gin'),
+        ('book_stock', '0001_initial'),
+        ('branch', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookAvailabilityModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('available', 'Disponível'), ('borrowed', 'Emprestado'), ('reserved', 'Reservado'), ('lost', 'Perdido')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='bookavailabilitymodel',
+            name='book',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability', to='book.bookmodel'),
+        ),
+        migrations.AddField(
+            model_name='bookavailabilitymodel',
+            name='branch',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability', to='branch.branchmodel'),
+        ),
+        migrations.AddConstraint(
+            model_name='bookavailabilitymodel',
+            constraint=models.UniqueConstraint(fields=('book', 'branch', 'status'), name='bookavailability_unique'),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "INSERT INTO book_stock_bookavailabilitymodel (book_id, branch_id, status, count) "
+                "SELECT book_id, branch_id, status, COUNT(*) FROM book_stock_bookstockmodel "
+                "GROUP BY book_id, branch_id, status"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
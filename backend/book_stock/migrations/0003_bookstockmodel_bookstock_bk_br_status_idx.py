@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-18 05:06
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('book_stock', '0002_bookavailabilitymodel'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='bookstockmodel',
+            index=models.Index(fields=['book', 'branch', 'status'], name='bookstock_bk_br_status_idx'),
+        ),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('book_stock', '0003_bookstockmodel_bookstock_bk_br_status_idx'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='BookAvailabilityModel',
+        ),
+    ]
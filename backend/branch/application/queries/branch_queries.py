@@ -4,6 +4,7 @@ from branch.domain.branch_entities import Branch
 from branch.domain.branch_query_interface import BranchQueryInterface
 from branch.infrastructure.branch_model import BranchModel
 from branch.infrastructure.branch_repository import BranchRepository
+from config.conditional import ResourceVersion
 
 
 class BranchQueries(BranchQueryInterface):
@@ -24,3 +25,6 @@ class BranchQueries(BranchQueryInterface):
         except BranchModel.DoesNotExist:
             self.logger.warning(f"[BranchQueries] Branch with ID {branch_id} not found")
             return None
+
+    def get_version(self, branch_id: int | None = None) -> ResourceVersion:
+        return self.repository.get_version(branch_id)
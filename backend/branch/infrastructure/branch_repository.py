@@ -1,8 +1,12 @@
 import logging
 
+from django.db.models import Count, Max
+from django.utils import timezone
+
 from branch.domain.branch_command_interface import BranchCommandInterface
 from branch.domain.branch_entities import Branch
 from branch.domain.branch_query_interface import BranchQueryInterface
+from config.conditional import ResourceVersion
 from .branch_model import BranchModel
 
 
@@ -27,6 +31,10 @@ class BranchRepository(BranchCommandInterface, BranchQueryInterface):
             self.logger.exception(f"[BranchRepository] Unexpected error fetching branch {branch_id}")
             raise
 
+    def get_version(self, branch_id: int | None = None) -> ResourceVersion:
+        queryset = BranchModel.objects.all() if branch_id is None else BranchModel.objects.filter(id=branch_id)
+        return ResourceVersion(**queryset.aggregate(last_modified=Max("updated_at"), count=Count("id")))
+
     def create(self, branch: Branch) -> Branch:
         try:
             data = branch.__dict__.copy()
@@ -42,7 +50,7 @@ class BranchRepository(BranchCommandInterface, BranchQueryInterface):
         try:
             data = branch.__dict__.copy()
             data.pop("id", None)
-            updated = BranchModel.objects.filter(id=branch_id).update(**data)
+            updated = BranchModel.objects.filter(id=branch_id).update(**data, updated_at=timezone.now())
             if updated == 0:
                 self.logger.warning(f"[BranchRepository] Branch {branch_id} not found for update")
                 raise BranchModel.DoesNotExist(f"Branch {branch_id} not found")
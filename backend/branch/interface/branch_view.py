@@ -4,11 +4,14 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from django.conf import settings
+
 from branch.application.commands.branch_commands import BranchCommands
 from branch.application.queries.branch_queries import BranchQueries
 from branch.domain.branch_entities import Branch
 from branch.interface.serializer.branch_input_serializer import BranchInputSerializer
 from branch.interface.serializer.branch_output_serializer import BranchOutputSerializer
+from config.conditional import ConditionalGet
 
 
 class BranchView(APIView):
@@ -24,11 +27,19 @@ class BranchView(APIView):
         if branch_id:
             self.logger.info(f"[BranchView] GET /branch/{branch_id} requested")
             try:
+                conditional = ConditionalGet(
+                    request, self.branch_queries.get_version(branch_id), settings.BRANCH_HTTP_CACHE_CONTROL
+                )
+                not_modified = conditional.not_modified()
+                if not_modified is not None:
+                    self.logger.info(f"[BranchView] Branch {branch_id} not modified")
+                    return not_modified
+
                 branch = self.branch_queries.get_by_id(branch_id)
                 if branch:
                     self.logger.info(f"[BranchView] Branch {branch_id} found")
                     serializer = BranchOutputSerializer(branch)
-                    return Response(serializer.data)
+                    return conditional.apply(Response(serializer.data))
                 self.logger.warning(f"[BranchView] Branch {branch_id} not found")
                 return Response({"detail": "Branch not found"}, status=status.HTTP_404_NOT_FOUND)
             except Exception:
@@ -37,10 +48,16 @@ class BranchView(APIView):
 
         self.logger.info("[BranchView] GET /branch/ list requested")
         try:
+            conditional = ConditionalGet(request, self.branch_queries.get_version(), settings.BRANCH_HTTP_CACHE_CONTROL)
+            not_modified = conditional.not_modified()
+            if not_modified is not None:
+                self.logger.info("[BranchView] Branches list not modified")
+                return not_modified
+
             branches = self.branch_queries.get_all()
             self.logger.info(f"[BranchView] Returned {len(branches)} branches")
             serializer = BranchOutputSerializer(branches, many=True)
-            return Response(serializer.data)
+            return conditional.apply(Response(serializer.data))
         except Exception:
             self.logger.exception(f"[BranchView] Error retrieving branch list")
             return Response({"detail": "Error retrieving branch list"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
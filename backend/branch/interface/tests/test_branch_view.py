@@ -1,8 +1,13 @@
+from datetime import datetime, timezone
+
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from branch.domain.branch_entities import Branch
+from config.conditional import ResourceVersion
+
+VERSION = ResourceVersion(last_modified=datetime(2024, 1, 1, tzinfo=timezone.utc), count=1)
 
 
 @pytest.fixture
@@ -28,6 +33,7 @@ def make_branch():
 
 def test_get_branch_found(client, mocker, make_branch):
     mock_query = mocker.patch("branch.interface.branch_view.BranchQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.return_value = make_branch()
 
     response = client.get("/api/branch/1/")
@@ -39,6 +45,7 @@ def test_get_branch_found(client, mocker, make_branch):
 
 def test_get_branch_not_found(client, mocker):
     mock_query = mocker.patch("branch.interface.branch_view.BranchQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.return_value = None
 
     response = client.get("/api/branch/999/")
@@ -49,6 +56,7 @@ def test_get_branch_not_found(client, mocker):
 
 def test_get_branch_unexpected_error(client, mocker):
     mock_query = mocker.patch("branch.interface.branch_view.BranchQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_by_id.side_effect = Exception("DB error")
 
     response = client.get("/api/branch/1/")
@@ -59,6 +67,7 @@ def test_get_branch_unexpected_error(client, mocker):
 
 def test_get_all_branches(client, mocker, make_branch):
     mock_query = mocker.patch("branch.interface.branch_view.BranchQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_all.return_value = [make_branch(), make_branch(id=2, name="Branch B")]
 
     response = client.get("/api/branch/")
@@ -72,6 +81,7 @@ def test_get_all_branches(client, mocker, make_branch):
 
 def test_get_all_branches_unexpected_error(client, mocker):
     mock_query = mocker.patch("branch.interface.branch_view.BranchQueries")
+    mock_query().get_version.return_value = VERSION
     mock_query().get_all.side_effect = Exception("Unexpected failure")
 
     response = client.get("/api/branch/")
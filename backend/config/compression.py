@@ -0,0 +1,184 @@
+import logging
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+# Both ship with requirements.txt; without them "br"/"zstd" are simply not offered.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+logger = logging.getLogger(__name__)
+
+
+class GzipCodec:
+    def __init__(self, level: int):
+        self.level = level
+
+    def _compressobj(self):
+        # wbits=31: zlib stream wrapped in a gzip header and trailer.
+        return zlib.compressobj(self.level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = self._compressobj()
+        return compressor.compress(data) + compressor.flush()
+
+    def streamer(self):
+        compressor = self._compressobj()
+        return lambda chunk: compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+class BrotliCodec:
+    def __init__(self, level: int):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self.level)
+
+    def streamer(self):
+        compressor = brotli.Compressor(quality=self.level)
+        return lambda chunk: compressor.process(chunk) + compressor.flush(), compressor.finish
+
+
+class ZstdCodec:
+    def __init__(self, level: int):
+        self.compressor = zstandard.ZstdCompressor(level=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data)
+
+    def streamer(self):
+        compressor = self.compressor.compressobj()
+        return (
+            lambda chunk: compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            compressor.flush,
+        )
+
+
+def available_codecs() -> dict:
+    """Codecs for ``COMPRESSION_ENCODINGS``, in server preference order, whose library is installed."""
+    factories = {
+        "gzip": lambda: GzipCodec(settings.COMPRESSION_GZIP_LEVEL),
+        "br": (lambda: BrotliCodec(settings.COMPRESSION_BROTLI_LEVEL)) if brotli else None,
+        "zstd": (lambda: ZstdCodec(settings.COMPRESSION_ZSTD_LEVEL)) if zstandard else None,
+    }
+    codecs = {}
+    for encoding in settings.COMPRESSION_ENCODINGS:
+        if factories.get(encoding) is None:
+            logger.warning(f"[CompressionMiddleware] Encoding '{encoding}' unavailable, skipping it")
+            continue
+        codecs[encoding] = factories[encoding]()
+    return codecs
+
+
+def negotiate(accept_encoding: str, offered: list[str]) -> str | None:
+    """Best of ``offered`` for an Accept-Encoding header: highest q first, then server order."""
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name.strip():
+            weights[name.strip().lower()] = q
+
+    ranked = [
+        (weights.get(encoding, weights.get("*", 0.0)), -position, encoding)
+        for position, encoding in enumerate(offered)
+    ]
+    best = max(ranked, default=None)
+    return best[2] if best and best[0] > 0 else None
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Negotiated gzip/br/zstd compression for API responses.
+
+    Regular responses are compressed when they reach ``COMPRESSION_MIN_SIZE`` bytes; streaming
+    responses (the book export) are compressed chunk by chunk and flushed after each one, so the
+    client keeps receiving data while the export runs.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.codecs = available_codecs()
+
+    def process_response(self, request, response):
+        if not settings.COMPRESSION_ENABLED or not self.codecs:
+            return response
+        if response.status_code == 304:
+            # No body or Content-Type, but the headers must match the 200 it stands for.
+            patch_vary_headers(response, ("Accept-Encoding",))
+            self._weaken_etag(response)
+            return response
+        if response.has_header("Content-Encoding") or not self._compressible(response):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""), list(self.codecs))
+        if encoding is None:
+            return response
+        codec = self.codecs[encoding]
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self._compress_async(codec, response.streaming_content)
+            else:
+                response.streaming_content = self._compress_stream(codec, response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            compressed = codec.compress(response.content)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        self._weaken_etag(response)
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def _weaken_etag(response) -> None:
+        # The bytes differ per coding; a weak ETag still matches If-None-Match, as with GZipMiddleware.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+
+    @staticmethod
+    def _compressible(response) -> bool:
+        content_type = response.get("Content-Type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    @staticmethod
+    def _compress_stream(codec, chunks):
+        compress, finish = codec.streamer()
+        for chunk in chunks:
+            data = compress(chunk)
+            if data:
+                yield data
+        yield finish()
+
+    @staticmethod
+    async def _compress_async(codec, chunks):
+        compress, finish = codec.streamer()
+        async for chunk in chunks:
+            data = compress(chunk)
+            if data:
+                yield data
+        yield finish()
@@ -0,0 +1,59 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    """max(updated_at) and row count over every row a response is built from."""
+    last_modified: datetime | None
+    count: int
+
+    @classmethod
+    def combine(cls, *versions: "ResourceVersion") -> "ResourceVersion":
+        stamps = [version.last_modified for version in versions if version.last_modified is not None]
+        return cls(last_modified=max(stamps, default=None), count=sum(version.count for version in versions))
+
+
+class ConditionalGet:
+    """ETag/Last-Modified for one GET: answer 304 before any data is loaded, then stamp the full response."""
+
+    def __init__(self, request, version: ResourceVersion, cache_control: str):
+        self.request = request
+        self.cache_control = cache_control
+        self.last_modified = int(version.last_modified.timestamp()) if version.last_modified else None
+        # The query string and negotiated media type are part of the representation (fields, cursor, search...).
+        raw = "|".join([
+            version.last_modified.isoformat() if version.last_modified else "",
+            str(version.count),
+            request.get_full_path(),
+            getattr(request, "accepted_media_type", "") or "",
+        ])
+        # Weak: the compression middleware changes the bytes per Content-Encoding, and a 304
+        # must carry the same validator as the 200 it revalidates.
+        self.etag = f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+        # Deletes don't move max(updated_at), so only a single-row validator can answer If-Modified-Since.
+        self.single_row = version.count == 1
+        # No rows means nothing to validate: a missing record must reach the view's 404 rather
+        # than match "If-None-Match: *".
+        self.empty = version.count == 0
+
+    def not_modified(self):
+        if self.empty:
+            return None
+        response = get_conditional_response(
+            self.request, etag=self.etag, last_modified=self.last_modified if self.single_row else None
+        )
+        return self.apply(response) if response is not None else None
+
+    def apply(self, response):
+        if not self.empty:
+            response["ETag"] = self.etag
+            if self.last_modified is not None:
+                response["Last-Modified"] = http_date(self.last_modified)
+        if self.cache_control:
+            response["Cache-Control"] = self.cache_control
+        return response
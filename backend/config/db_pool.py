@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def get_pool_stats(alias: str = DEFAULT_DB_ALIAS) -> dict:
+    connection = connections[alias]
+    pool = getattr(connection, "pool", None) if settings.DB_POOL_ENABLED else None
+    if pool is None:
+        return {
+            "mode": "persistent",
+            "conn_max_age": connection.settings_dict.get("CONN_MAX_AGE"),
+            "conn_health_checks": connection.settings_dict.get("CONN_HEALTH_CHECKS"),
+        }
+    return {"mode": "pool", **pool.get_stats()}
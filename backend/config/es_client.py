@@ -1,6 +1,37 @@
+import os
+import threading
+
+from django.conf import settings
 from elasticsearch import Elasticsearch
 
-es_client = Elasticsearch(
-    hosts=["http://elasticsearch:9200"],
-    verify_certs=False
-)
+_client: Elasticsearch | None = None
+_lock = threading.Lock()
+
+
+def get_es_client() -> Elasticsearch:
+    """Return this process's Elasticsearch client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = Elasticsearch(
+                    hosts=settings.ELASTICSEARCH_HOSTS,
+                    verify_certs=settings.ELASTICSEARCH_VERIFY_CERTS,
+                    connections_per_node=settings.ELASTICSEARCH_POOL_MAXSIZE,
+                    request_timeout=settings.ELASTICSEARCH_TIMEOUT,
+                    max_retries=settings.ELASTICSEARCH_MAX_RETRIES,
+                    retry_on_timeout=settings.ELASTICSEARCH_RETRY_ON_TIMEOUT,
+                    sniff_on_start=False,
+                    sniff_on_node_failure=False,
+                )
+    return _client
+
+
+def _reset_after_fork() -> None:
+    # Pooled sockets must not be shared with a forked worker.
+    global _client, _lock
+    _client = None
+    _lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,67 @@
+from operator import attrgetter, itemgetter
+from typing import Any, Callable
+
+from django.db.models import Manager
+from rest_framework import serializers
+from rest_framework.settings import ISO_8601, api_settings
+
+
+def compile_serializer(serializer: serializers.Serializer) -> Callable[[Any], dict]:
+    """Turn a read-only output serializer into a plain function ``entity -> dict``.
+
+    Field lookups and conversions are resolved once, here, into a list of ``(name, getter,
+    converter)`` entries that the returned closure walks per row, so no field objects are
+    touched while serializing. The result follows the serializer's JSON contract (key order,
+    None handling, nested serializers, SerializerMethodField) for entities with plain attributes
+    or ``values()`` dict rows; field types without a dedicated converter fall back to their own
+    ``to_representation``.
+    """
+    fields = [(name, field) for name, field in serializer.fields.items() if not field.write_only]
+    converters = [_converter(field) for _, field in fields]
+    by_attr = [(name, _getter(field.source_attrs, attrgetter), convert)
+               for (name, field), convert in zip(fields, converters)]
+    by_key = [(name, _getter(field.source_attrs, itemgetter), convert)
+              for (name, field), convert in zip(fields, converters)]
+
+    def to_dict(instance):
+        plan = by_key if isinstance(instance, dict) else by_attr
+        return {name: None if (value := get(instance)) is None else convert(value) for name, get, convert in plan}
+
+    return to_dict
+
+
+def _getter(attrs: list[str], getter: type[attrgetter] | type[itemgetter]) -> Callable[[Any], Any]:
+    if not attrs:
+        return lambda instance: instance
+    if len(attrs) == 1:
+        return getter(attrs[0])
+    return _nested_getter(attrs)
+
+
+def _nested_getter(attrs: list[str]) -> Callable[[Any], Any]:
+    """Dotted ``source``: follow each step; a None along the way reads as None (DRF needs allow_null)."""
+    def get(instance):
+        for attr in attrs:
+            instance = instance[attr] if isinstance(instance, dict) else getattr(instance, attr)
+            if instance is None:
+                return None
+        return instance
+
+    return get
+
+
+def _converter(field: serializers.Field) -> Callable[[Any], Any]:
+    if isinstance(field, serializers.ListSerializer):
+        child = compile_serializer(field.child)
+        return lambda value: [child(item) for item in (value.all() if isinstance(value, Manager) else value)]
+    if isinstance(field, serializers.Serializer):
+        return compile_serializer(field)
+    if isinstance(field, serializers.SerializerMethodField):
+        return getattr(field.parent, field.method_name)
+    if type(field) is serializers.IntegerField:
+        return int
+    if type(field) is serializers.CharField:
+        return str
+    if type(field) is serializers.DateField and getattr(field, "format", api_settings.DATE_FORMAT) == ISO_8601:
+        return lambda value: value if isinstance(value, str) else (value.isoformat() if value else None)
+    return field.to_representation
@@ -0,0 +1,25 @@
+def parse_fieldset(fields: str | None, exclude: str | None, allowed: frozenset[str]) -> frozenset[str] | None:
+    """Resolve ``?fields=`` / ``?exclude=`` into the top-level keys to return; ``None`` means all of them."""
+    if fields is None and exclude is None:
+        return None
+
+    selected = _split(fields) if fields is not None else allowed
+    excluded = _split(exclude) if exclude is not None else frozenset()
+    unknown = (selected | excluded) - allowed
+    if unknown:
+        raise ValueError(f"Invalid fields: {', '.join(sorted(unknown))}")
+    return selected - excluded
+
+
+def _split(raw: str) -> frozenset[str]:
+    return frozenset(value.strip() for value in raw.split(",") if value.strip())
+
+
+class SparseFieldsetMixin:
+    """Serializer mixin taking ``fields=`` (a set from parse_fieldset) and dropping every other field."""
+
+    def __init__(self, *args, fields: frozenset[str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - fields:
+                self.fields.pop(name)
@@ -0,0 +1,23 @@
+import multiprocessing
+import os
+
+# Production server settings, used by `gunicorn -c config/gunicorn.conf.py`.
+# SERVER_MODE=wsgi (default) serves config.wsgi with threaded sync workers, which suits the
+# blocking ORM views; SERVER_MODE=asgi serves config.asgi with uvicorn workers.
+
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi")
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn_worker.UvicornWorker" if SERVER_MODE == "asgi" else "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+backlog = int(os.getenv("GUNICORN_BACKLOG", "2048"))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
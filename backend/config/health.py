@@ -0,0 +1,120 @@
+import logging
+import math
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime, timezone
+from typing import Callable
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from config.es_client import get_es_client
+
+
+def check_database(timeout: float) -> None:
+    # A dedicated connection bypasses CONN_MAX_AGE/pool reuse and lets libpq and the server
+    # enforce the timeout, so a hung Postgres can't pin the checker thread.
+    wrapper = connections[DEFAULT_DB_ALIAS]
+    params = {**wrapper.get_connection_params(), "connect_timeout": max(1, math.ceil(timeout))}
+    connection = wrapper.Database.connect(**params)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL statement_timeout = %s", [max(1, int(timeout * 1000))])
+            cursor.execute("SELECT 1")
+    finally:
+        connection.close()
+
+
+def check_broker(timeout: float) -> None:
+    url = urlparse(settings.DRAMATIQ_BROKER["OPTIONS"]["url"])
+    with socket.create_connection((url.hostname or "localhost", url.port or 5672), timeout=timeout):
+        pass
+
+
+def check_elasticsearch(timeout: float) -> None:
+    if not get_es_client().options(request_timeout=timeout).ping():
+        raise ConnectionError("ping failed")
+
+
+class HealthChecker:
+    """Runs dependency checks at most once per ``ttl`` seconds and serves the last result.
+
+    The first call blocks on a check round; afterwards a stale snapshot is returned immediately
+    while a single background thread refreshes it, so probes never wait on dependencies. Checks
+    run on one long-lived pool with a thread per check and must honour their own timeout.
+    """
+
+    def __init__(self, checks: dict[str, tuple[Callable[[float], None], float]], ttl: float):
+        self.checks = checks
+        self.ttl = ttl
+        self._snapshot: dict | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="health")
+        self.logger = logging.getLogger(__name__)
+
+    def status(self) -> dict:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._refresh()
+            return self._snapshot
+
+        if time.monotonic() - self._checked_at >= self.ttl and self._lock.acquire(blocking=False):
+            threading.Thread(target=self._refresh_and_release, daemon=True).start()
+        return snapshot
+
+    def _refresh_and_release(self) -> None:
+        try:
+            self._refresh()
+        finally:
+            self._lock.release()
+
+    def _refresh(self) -> None:
+        results = {}
+        started = time.monotonic()
+        futures = {
+            name: self._executor.submit(self._timed, check, timeout)
+            for name, (check, timeout) in self.checks.items()
+        }
+        for name, future in futures.items():
+            timeout = self.checks[name][1]
+            try:
+                results[name] = {"ok": True, "latency_ms": future.result(timeout=timeout)}
+            except FutureTimeout:
+                # Still queued behind a slow run of the same check: drop it rather than stack it up.
+                future.cancel()
+                results[name] = {"ok": False, "error": f"timed out after {timeout}s"}
+            except Exception as e:
+                results[name] = {"ok": False, "error": str(e) or type(e).__name__}
+
+        healthy = all(result["ok"] for result in results.values())
+        if not healthy:
+            self.logger.warning(f"[HealthChecker] Unhealthy dependencies: {results}")
+        self._snapshot = {
+            "status": "ok" if healthy else "fail",
+            "checks": results,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round((time.monotonic() - started) * 1000, 2),
+        }
+        self._checked_at = time.monotonic()
+
+    @staticmethod
+    def _timed(check: Callable[[float], None], timeout: float) -> float:
+        started = time.monotonic()
+        check(timeout)
+        return round((time.monotonic() - started) * 1000, 2)
+
+
+readiness = HealthChecker(
+    checks={
+        "database": (check_database, settings.HEALTH_CHECK_DB_TIMEOUT),
+        "broker": (check_broker, settings.HEALTH_CHECK_BROKER_TIMEOUT),
+        "elasticsearch": (check_elasticsearch, settings.HEALTH_CHECK_ES_TIMEOUT),
+    },
+    ttl=settings.HEALTH_CHECK_TTL,
+)
@@ -0,0 +1,91 @@
+import json
+import logging
+import statistics
+import time
+from datetime import date
+
+import orjson
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from author.domain.author_entities import Author
+from book.domain.book_entities import Book
+from book.interface.serializer.book_output_serializer import BookOutputSerializer, book_output_encoder
+from book_category.domain.book_category_entities import BookCategory
+from config.renderers import ORJSONRenderer
+
+
+class Command(BaseCommand):
+    help = (
+        "Serialize and render a synthetic book listing (DRF serializer vs compiled encoder, "
+        "DRF JSONRenderer vs ORJSONRenderer) and compare timings."
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.logger = logging.getLogger(__name__)
+
+    def add_arguments(self, parser):
+        parser.add_argument("--books", type=int, default=10000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        books = self.make_books(options["books"])
+        self.logger.info(f"[BenchmarkJson] Serializing and rendering {options['books']} books x{options['repeat']}")
+
+        encode = book_output_encoder()
+        payloads, best = {}, {}
+        for name, serialize in (
+            ("drf", lambda: BookOutputSerializer(books, many=True).data),
+            ("compiled", lambda: [encode(book) for book in books]),
+        ):
+            timings = []
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                payloads[name] = serialize()
+                timings.append(time.perf_counter() - started)
+            best[name] = min(timings)
+            self.stdout.write(
+                f"{name:>8}: best {best[name] * 1000:8.1f} ms  median {statistics.median(timings) * 1000:8.1f} ms"
+            )
+
+        if payloads["drf"] != payloads["compiled"]:
+            raise CommandError("Serializers produced different payloads")
+        self.stdout.write(f"serialization speedup: {best['drf'] / max(best['compiled'], 1e-9):.1f}x")
+
+        payload, bodies = payloads["compiled"], {}
+        for name, renderer in (("drf", JSONRenderer()), ("orjson", ORJSONRenderer())):
+            timings = []
+            for _ in range(options["repeat"]):
+                started = time.perf_counter()
+                bodies[name] = renderer.render(payload, "application/json", {})
+                timings.append(time.perf_counter() - started)
+            best[name] = min(timings)
+            self.stdout.write(
+                f"{name:>8}: best {best[name] * 1000:8.1f} ms  median {statistics.median(timings) * 1000:8.1f} ms  "
+                f"{len(bodies[name]) / 1024:8.0f} KiB"
+            )
+
+        if json.loads(bodies["drf"]) != orjson.loads(bodies["orjson"]):
+            raise CommandError("Renderers produced different documents")
+        self.stdout.write(f"rendering speedup: {best['drf'] / max(best['orjson'], 1e-9):.1f}x")
+
+    @staticmethod
+    def make_books(count: int) -> list[Book]:
+        synopsis = "A practical handbook about software craftsmanship, naming and testing. " * 12
+        return [
+            Book(
+                id=i,
+                title=f"Book {i}: Clean Code Édition",
+                isbn=f"{9780000000000 + i}",
+                publisher="Prentice Hall",
+                edition="1st",
+                language="English",
+                book_type="physical",
+                synopsis=synopsis,
+                publication_date=date(2008, 8, 1),
+                authors=[Author(id=i % 500, name=f"Author {i % 500}"), Author(id=500, name="Robert C. Martin")],
+                categories=[BookCategory(id=i % 20, name=f"Category {i % 20}")],
+            )
+            for i in range(1, count + 1)
+        ]
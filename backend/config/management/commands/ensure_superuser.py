@@ -0,0 +1,26 @@
+import logging
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Create the default superuser from DJANGO_SUPERUSER_* env vars if it does not exist."
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.logger = logging.getLogger(__name__)
+
+    def handle(self, *args, **options):
+        username = os.getenv("DJANGO_SUPERUSER_USERNAME", "admin")
+        password = os.getenv("DJANGO_SUPERUSER_PASSWORD", "admin123")
+        email = os.getenv("DJANGO_SUPERUSER_EMAIL", "admin@example.com")
+
+        User = get_user_model()
+        if User.objects.filter(username=username).exists():
+            self.logger.info(f"[EnsureSuperuser] Superuser {username} already exists")
+            return
+
+        User.objects.create_superuser(username, email, password)
+        self.logger.info(f"[EnsureSuperuser] Superuser {username} created")
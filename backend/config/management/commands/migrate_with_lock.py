@@ -0,0 +1,36 @@
+import logging
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    help = "Apply committed migrations while holding a Postgres advisory lock, so only one replica migrates at a time."
+
+    # Arbitrary application-wide key for pg_advisory_lock.
+    LOCK_ID = 7_316_604_021
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.logger = logging.getLogger(__name__)
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument("--lock-id", type=int, default=self.LOCK_ID)
+
+    def handle(self, *args, **options):
+        database = options["database"]
+        lock_id = options["lock_id"]
+        connection = connections[database]
+
+        self.logger.info(f"[MigrateWithLock] Waiting for advisory lock {lock_id}")
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(%s)", [lock_id])
+        try:
+            self.logger.info("[MigrateWithLock] Lock acquired, applying migrations")
+            call_command("migrate", database=database, interactive=False, verbosity=options["verbosity"])
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+            self.logger.info(f"[MigrateWithLock] Released advisory lock {lock_id}")
@@ -0,0 +1,47 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.migrations.executor import MigrationExecutor
+
+
+class Command(BaseCommand):
+    help = "Block until every committed migration has been applied (by the migrate role) or the timeout expires."
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.logger = logging.getLogger(__name__)
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument("--timeout", type=float, default=120.0)
+        parser.add_argument("--interval", type=float, default=1.0)
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        deadline = time.monotonic() + options["timeout"]
+
+        while True:
+            try:
+                pending = self.pending_migrations(connection)
+            except Exception as e:
+                pending = None
+                self.logger.warning(f"[WaitForSchema] Database not reachable yet: {e}")
+
+            if pending == []:
+                self.logger.info("[WaitForSchema] Schema is up to date")
+                return
+            if pending:
+                self.logger.info(f"[WaitForSchema] Waiting for {len(pending)} migrations, next: {pending[0]}")
+            if time.monotonic() >= deadline:
+                raise CommandError("Timed out waiting for migrations to be applied")
+
+            connection.close()
+            time.sleep(options["interval"])
+
+    @staticmethod
+    def pending_migrations(connection) -> list[str]:
+        executor = MigrationExecutor(connection)
+        plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        return [f"{migration.app_label}.{migration.name}" for migration, _ in plan]
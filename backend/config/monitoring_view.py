@@ -0,0 +1,24 @@
+import logging
+
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.db_pool import get_pool_stats
+
+
+class DatabasePoolView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, request):
+        self.logger.info("[DatabasePoolView] GET /monitoring/db-pool requested")
+        try:
+            return Response(get_pool_stats())
+        except Exception:
+            self.logger.exception("[DatabasePoolView] Error reading database pool stats")
+            return Response({"detail": "Error reading pool stats"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
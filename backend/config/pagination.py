@@ -0,0 +1,78 @@
+import base64
+import binascii
+import json
+import math
+
+from django.conf import settings
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(last_id: int) -> str:
+    return _encode({"id": last_id})
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    if not cursor:
+        return None
+    try:
+        last_id = _decode(cursor)["id"]
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor("Invalid cursor")
+    # Only ids this module encoded are accepted; "5", 5.7 or true must not be coerced into a key.
+    if not _is_int(last_id):
+        raise InvalidCursor("Invalid cursor")
+    return last_id
+
+
+def encode_search_after(sort_values: list) -> str:
+    return _encode({"after": sort_values})
+
+
+def decode_search_after(cursor: str | None) -> list | None:
+    if not cursor:
+        return None
+    try:
+        sort_values = _decode(cursor)["after"]
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor("Invalid cursor")
+    # Search sorts on [_score, id]; anything else would only come back from Elasticsearch as an error.
+    if not (isinstance(sort_values, list) and len(sort_values) == 2
+            and _is_number(sort_values[0]) and _is_int(sort_values[1])):
+        raise InvalidCursor("Invalid cursor")
+    return sort_values
+
+
+def resolve_page_size(raw_limit: str | None) -> int:
+    if raw_limit in (None, ""):
+        return settings.API_PAGE_SIZE
+    try:
+        limit = int(raw_limit)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid limit")
+    if limit < 1:
+        raise ValueError("Invalid limit")
+    return min(limit, settings.API_MAX_PAGE_SIZE)
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value) -> bool:
+    return _is_int(value) or (isinstance(value, float) and math.isfinite(value))
+
+
+def _encode(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
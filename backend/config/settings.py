@@ -1,6 +1,7 @@
 import os
 from datetime import timedelta
 from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -16,8 +17,10 @@ SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "unsafe-default")
 INSTALLED_APPS = [
     'django.contrib.auth',
     'django.contrib.contenttypes',
+    'django.contrib.postgres',
     'rest_framework',
     'django_dramatiq',
+    'config',
     'branch',
     'author',
     'book.apps.BookConfig',
@@ -27,6 +30,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'config.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -38,6 +42,20 @@ ROOT_URLCONF = 'config.urls'
 WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database
+# Connections persist for DB_CONN_MAX_AGE seconds and are health-checked before
+# reuse. DB_POOL_ENABLED=True switches to psycopg 3's connection pool instead
+# (Django requires CONN_MAX_AGE=0 then): each process keeps DB_POOL_SIZE
+# connections open and grows by up to DB_POOL_MAX_OVERFLOW under load, waiting
+# at most DB_POOL_TIMEOUT seconds for a free one.
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "False") == "True"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "8"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+# Under ASGI (SERVER_MODE=asgi) sync views run on executor threads, and a persistent
+# connection left on one of them is neither reused nor closed; only the pool is safe.
+SERVER_MODE = os.getenv("SERVER_MODE", "wsgi")
+DB_PERSISTENT_CONNECTIONS = not DB_POOL_ENABLED and SERVER_MODE != "asgi"
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -46,19 +64,93 @@ DATABASES = {
         'PASSWORD': os.getenv("POSTGRES_PASSWORD", "password"),
         'HOST': os.getenv("POSTGRES_HOST", "postgres"),
         'PORT': os.getenv("POSTGRES_PORT", "5432"),
+        'CONN_MAX_AGE': int(os.getenv("DB_CONN_MAX_AGE", "60")) if DB_PERSISTENT_CONNECTIONS else 0,
+        'CONN_HEALTH_CHECKS': os.getenv("DB_CONN_HEALTH_CHECKS", "True") == "True",
     }
 }
 
+if DB_POOL_ENABLED:
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': DB_POOL_SIZE,
+            'max_size': DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW,
+            'timeout': DB_POOL_TIMEOUT,
+        },
+    }
+
+# Cache
+# Single-book payloads are cached in the "books" alias, which must be shared by
+# every web and worker process: writes invalidate it from whichever process made
+# them. Without BOOK_CACHE_URL (e.g. redis://redis:6379/1) the book cache is
+# disabled rather than kept per process, where invalidations would not reach it.
+BOOK_CACHE_ALIAS = "books"
+BOOK_CACHE_URL = os.getenv("BOOK_CACHE_URL")
+BOOK_CACHE_TTL = int(os.getenv("BOOK_CACHE_TTL", "300"))
+
+# Typeahead answers are kept per process in a small LRU (LocMemCache evicts
+# least recently used keys once BOOK_SUGGEST_CACHE_MAX_ENTRIES is reached).
+BOOK_SUGGEST_CACHE_ALIAS = "suggest"
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    BOOK_CACHE_ALIAS: {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': BOOK_CACHE_URL,
+        'TIMEOUT': BOOK_CACHE_TTL,
+        'KEY_PREFIX': 'bookmanager',
+    } if BOOK_CACHE_URL else {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    BOOK_SUGGEST_CACHE_ALIAS: {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'suggest',
+        'TIMEOUT': int(os.getenv("BOOK_SUGGEST_CACHE_TTL", "60")),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv("BOOK_SUGGEST_CACHE_MAX_ENTRIES", "1000")),
+            'CULL_FREQUENCY': 10,
+        },
+    },
+}
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
 USE_TZ = True
 
+# Response compression (config.compression.CompressionMiddleware). Encodings are listed in
+# server preference order; levels: gzip 1-9, brotli 0-11, zstd 1-22.
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "True") == "True"
+COMPRESSION_ENCODINGS = [e.strip() for e in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if e.strip()]
+if set(COMPRESSION_ENCODINGS) - {"gzip", "br", "zstd"}:
+    raise ImproperlyConfigured("COMPRESSION_ENCODINGS accepts only gzip, br and zstd")
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_LEVEL = int(os.getenv("COMPRESSION_BROTLI_LEVEL", "4"))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
 # REST Framework
+# JSON encoding for the API: "orjson" (config.renderers/config.parsers) or
+# "stdlib" for DRF's own JSONRenderer/JSONParser.
+API_JSON_BACKEND = os.getenv("API_JSON_BACKEND", "orjson")
+API_JSON_CLASSES = {
+    "orjson": ('config.renderers.ORJSONRenderer', 'config.parsers.ORJSONParser'),
+    "stdlib": ('rest_framework.renderers.JSONRenderer', 'rest_framework.parsers.JSONParser'),
+}
+if API_JSON_BACKEND not in API_JSON_CLASSES:
+    raise ImproperlyConfigured(f"API_JSON_BACKEND must be one of {sorted(API_JSON_CLASSES)}")
+API_JSON_RENDERER, API_JSON_PARSER = API_JSON_CLASSES[API_JSON_BACKEND]
+
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        API_JSON_RENDERER,
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        API_JSON_PARSER,
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -68,6 +160,68 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Keyset pagination for list endpoints
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "200"))
+
+# Cache-Control sent with the ETag/Last-Modified of catalog endpoints (empty string: no header)
+API_CACHE_CONTROL = os.getenv("API_CACHE_CONTROL", "private, no-cache")
+BOOK_HTTP_CACHE_CONTROL = os.getenv("BOOK_HTTP_CACHE_CONTROL", API_CACHE_CONTROL)
+AUTHOR_HTTP_CACHE_CONTROL = os.getenv("AUTHOR_HTTP_CACHE_CONTROL", API_CACHE_CONTROL)
+BOOK_CATEGORY_HTTP_CACHE_CONTROL = os.getenv("BOOK_CATEGORY_HTTP_CACHE_CONTROL", API_CACHE_CONTROL)
+BRANCH_HTTP_CACHE_CONTROL = os.getenv("BRANCH_HTTP_CACHE_CONTROL", API_CACHE_CONTROL)
+
+# Streaming catalog export
+BOOK_EXPORT_CHUNK_SIZE = int(os.getenv("BOOK_EXPORT_CHUNK_SIZE", "500"))
+
+# Fuzzy search fallback (pg_trgm)
+BOOK_TRIGRAM_THRESHOLD = float(os.getenv("BOOK_TRIGRAM_THRESHOLD", "0.3"))
+
+# Buckets returned per facet by /api/book/search/?facets=
+BOOK_FACET_SIZE = int(os.getenv("BOOK_FACET_SIZE", "20"))
+
+# Typeahead
+BOOK_SUGGEST_SIZE = int(os.getenv("BOOK_SUGGEST_SIZE", "5"))
+BOOK_SUGGEST_MAX_SIZE = int(os.getenv("BOOK_SUGGEST_MAX_SIZE", "20"))
+
+# Bulk book ingestion
+BOOK_BULK_BATCH_SIZE = int(os.getenv("BOOK_BULK_BATCH_SIZE", "500"))
+BOOK_BULK_MAX_ITEMS = int(os.getenv("BOOK_BULK_MAX_ITEMS", "10000"))
+BOOK_STOCK_BULK_MAX_ITEMS = int(os.getenv("BOOK_STOCK_BULK_MAX_ITEMS", "10000"))
+
+# Search index mutations are queued in an outbox and flushed to Elasticsearch in
+# bulk; changes within BOOK_INDEX_FLUSH_WINDOW_MS are coalesced into one request.
+BOOK_INDEX_FLUSH_WINDOW_MS = int(os.getenv("BOOK_INDEX_FLUSH_WINDOW_MS", "500"))
+BOOK_INDEX_BATCH_SIZE = int(os.getenv("BOOK_INDEX_BATCH_SIZE", "500"))
+# Failed documents are retried after RETRY_DELAY_MS, doubling up to RETRY_MAX_DELAY_MS; only
+# document-level errors (not cluster outages) count towards MAX_ATTEMPTS before dead-lettering.
+BOOK_INDEX_MAX_ATTEMPTS = int(os.getenv("BOOK_INDEX_MAX_ATTEMPTS", "8"))
+BOOK_INDEX_RETRY_DELAY_MS = int(os.getenv("BOOK_INDEX_RETRY_DELAY_MS", "5000"))
+BOOK_INDEX_RETRY_MAX_DELAY_MS = int(os.getenv("BOOK_INDEX_RETRY_MAX_DELAY_MS", "300000"))
+# How long a flush owns the rows it claimed; should exceed the Elasticsearch bulk timeout.
+BOOK_INDEX_CLAIM_TTL_MS = int(os.getenv("BOOK_INDEX_CLAIM_TTL_MS", "60000"))
+
+# Elasticsearch client, created lazily once per process
+ELASTICSEARCH_HOSTS = os.getenv("ELASTICSEARCH_HOSTS", "http://elasticsearch:9200").split(",")
+ELASTICSEARCH_VERIFY_CERTS = os.getenv("ELASTICSEARCH_VERIFY_CERTS", "False") == "True"
+ELASTICSEARCH_POOL_MAXSIZE = int(os.getenv("ELASTICSEARCH_POOL_MAXSIZE", "10"))
+ELASTICSEARCH_TIMEOUT = float(os.getenv("ELASTICSEARCH_TIMEOUT", "5"))
+ELASTICSEARCH_MAX_RETRIES = int(os.getenv("ELASTICSEARCH_MAX_RETRIES", "2"))
+ELASTICSEARCH_RETRY_ON_TIMEOUT = os.getenv("ELASTICSEARCH_RETRY_ON_TIMEOUT", "True") == "True"
+
+# books index template; the stemmed title/synopsis subfields use a built-in language analyzer.
+ELASTICSEARCH_BOOKS_SHARDS = int(os.getenv("ELASTICSEARCH_BOOKS_SHARDS", "1"))
+ELASTICSEARCH_BOOKS_REPLICAS = int(os.getenv("ELASTICSEARCH_BOOKS_REPLICAS", "1"))
+ELASTICSEARCH_BOOKS_REFRESH_INTERVAL = os.getenv("ELASTICSEARCH_BOOKS_REFRESH_INTERVAL", "1s")
+ELASTICSEARCH_BOOKS_LANGUAGE = os.getenv("ELASTICSEARCH_BOOKS_LANGUAGE", "english")
+
+# Readiness probe: dependency checks run at most once per HEALTH_CHECK_TTL
+# seconds, each bounded by its own timeout; /readyz serves the cached result.
+HEALTH_CHECK_TTL = float(os.getenv("HEALTH_CHECK_TTL", "5"))
+HEALTH_CHECK_DB_TIMEOUT = float(os.getenv("HEALTH_CHECK_DB_TIMEOUT", "1"))
+HEALTH_CHECK_BROKER_TIMEOUT = float(os.getenv("HEALTH_CHECK_BROKER_TIMEOUT", "1"))
+HEALTH_CHECK_ES_TIMEOUT = float(os.getenv("HEALTH_CHECK_ES_TIMEOUT", "1"))
+
 # JWT Settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=30),
@@ -84,6 +238,7 @@ DRAMATIQ_BROKER = {
         "dramatiq.middleware.TimeLimit",
         "dramatiq.middleware.Callbacks",
         "dramatiq.middleware.Retries",
+        "django_dramatiq.middleware.DbConnectionsMiddleware",
     ]
 }
 
@@ -0,0 +1,89 @@
+import gzip
+import zlib
+
+import brotli
+import pytest
+import zstandard
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from config.compression import CompressionMiddleware, negotiate
+
+BODY = b'{"results": [' + b",".join(b'{"id": %d, "title": "Clean Code"}' % i for i in range(200)) + b"]}"
+
+
+def run(response, accept_encoding="gzip"):
+    request = RequestFactory().get("/api/book/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(lambda _: response)(request)
+
+
+def json_response(body=BODY, **headers):
+    return HttpResponse(body, content_type="application/json", headers=headers)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, br, zstd", "zstd"),
+    ("gzip;q=1.0, br;q=0.5", "gzip"),
+    ("br;q=0.8, gzip;q=0.8", "br"),
+    ("*", "zstd"),
+    ("*;q=0.1, zstd;q=0", "br"),
+    ("identity", None),
+    ("", None),
+])
+def test_negotiate_prefers_client_weight_then_server_order(header, expected):
+    assert negotiate(header, ["zstd", "br", "gzip"]) == expected
+
+
+@pytest.mark.parametrize("encoding, decompress", [
+    ("gzip", gzip.decompress),
+    ("br", brotli.decompress),
+    ("zstd", lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)),
+])
+def test_compresses_large_json_with_negotiated_encoding(encoding, decompress):
+    response = run(json_response(), encoding)
+
+    assert response["Content-Encoding"] == encoding
+    assert response["Vary"] == "Accept-Encoding"
+    assert int(response["Content-Length"]) == len(response.content) < len(BODY)
+    assert decompress(response.content) == BODY
+
+
+def test_small_responses_are_left_alone(settings):
+    settings.COMPRESSION_MIN_SIZE = len(BODY) + 1
+
+    response = run(json_response())
+
+    assert not response.has_header("Content-Encoding")
+    assert response.content == BODY
+
+
+def test_disabled_or_uncompressible_responses_are_left_alone(settings):
+    assert not run(HttpResponse(BODY, content_type="image/png")).has_header("Content-Encoding")
+    settings.COMPRESSION_ENABLED = False
+    assert not run(json_response()).has_header("Content-Encoding")
+
+
+def test_strong_etag_is_weakened_once_compressed():
+    response = run(json_response(ETag='"abc"'))
+
+    assert response["ETag"] == 'W/"abc"'
+
+
+def test_not_modified_carries_the_same_validator_and_vary_as_the_compressed_200():
+    response = run(HttpResponse(status=304, headers={"ETag": '"abc"'}))
+
+    assert response["ETag"] == 'W/"abc"'
+    assert response["Vary"] == "Accept-Encoding"
+
+
+def test_streaming_response_is_compressed_chunk_by_chunk():
+    chunks = [b'{"id": %d}\n' % i * 50 for i in range(5)]
+    response = run(StreamingHttpResponse(iter(chunks), content_type="application/x-ndjson"))
+
+    assert response["Content-Encoding"] == "gzip"
+    assert not response.has_header("Content-Length")
+    decompressor = zlib.decompressobj(31)
+    received = [decompressor.decompress(part) for part in response.streaming_content]
+    # Each compressed part is flushed, so every input chunk is readable as soon as it arrives.
+    assert received[:len(chunks)] == chunks
+    assert b"".join(received) == b"".join(chunks)
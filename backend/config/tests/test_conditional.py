@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from config.conditional import ConditionalGet, ResourceVersion
+
+STAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def test_combine_takes_latest_timestamp_and_sums_counts():
+    combined = ResourceVersion.combine(
+        ResourceVersion(last_modified=STAMP, count=2),
+        ResourceVersion(last_modified=None, count=0),
+        ResourceVersion(last_modified=datetime(2023, 1, 1, tzinfo=timezone.utc), count=1),
+    )
+
+    assert combined == ResourceVersion(last_modified=STAMP, count=3)
+
+
+def test_if_modified_since_only_answers_single_row_validators():
+    factory = RequestFactory()
+    headers = {"HTTP_IF_MODIFIED_SINCE": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    single = ConditionalGet(factory.get("/api/author/1/", **headers), ResourceVersion(STAMP, 1), "")
+    many = ConditionalGet(factory.get("/api/author/", **headers), ResourceVersion(STAMP, 5), "")
+
+    assert single.not_modified().status_code == 304
+    assert many.not_modified() is None
+
+
+def test_etag_tracks_version_and_path():
+    factory = RequestFactory()
+
+    def etag(path, version):
+        return ConditionalGet(factory.get(path), version, "").etag
+
+    assert etag("/api/branch/", ResourceVersion(STAMP, 2)) == etag("/api/branch/", ResourceVersion(STAMP, 2))
+    assert etag("/api/branch/", ResourceVersion(STAMP, 2)) != etag("/api/branch/", ResourceVersion(STAMP, 1))
+    assert etag("/api/branch/", ResourceVersion(STAMP, 2)) != etag("/api/branch/?x=1", ResourceVersion(STAMP, 2))
+
+
+def test_apply_skips_empty_cache_control():
+    response = ConditionalGet(RequestFactory().get("/"), ResourceVersion(None, 1), "").apply(HttpResponse())
+
+    assert response["ETag"]
+    assert "Last-Modified" not in response
+    assert "Cache-Control" not in response
+
+
+def test_etag_is_weak_and_matches_weakly():
+    factory = RequestFactory()
+    etag = ConditionalGet(factory.get("/api/branch/"), ResourceVersion(STAMP, 2), "").etag
+
+    conditional = ConditionalGet(factory.get("/api/branch/", HTTP_IF_NONE_MATCH=etag), ResourceVersion(STAMP, 2), "")
+
+    assert etag.startswith('W/"')
+    assert conditional.not_modified()["ETag"] == etag
+
+
+def test_no_rows_are_never_not_modified():
+    request = RequestFactory().get("/api/book/99/", HTTP_IF_NONE_MATCH="*")
+    conditional = ConditionalGet(request, ResourceVersion(None, 0), "private")
+
+    assert conditional.not_modified() is None
+    response = conditional.apply(HttpResponse(status=404))
+    assert "ETag" not in response
+    assert response["Cache-Control"] == "private"
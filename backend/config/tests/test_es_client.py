@@ -0,0 +1,36 @@
+import pytest
+
+from config import es_client
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    es_client._reset_after_fork()
+    yield
+    es_client._reset_after_fork()
+
+
+def test_get_es_client_is_lazy_and_reused(mocker, settings):
+    settings.ELASTICSEARCH_HOSTS = ["http://es-1:9200", "http://es-2:9200"]
+    settings.ELASTICSEARCH_TIMEOUT = 2.5
+    mock_cls = mocker.patch("config.es_client.Elasticsearch")
+
+    first = es_client.get_es_client()
+    second = es_client.get_es_client()
+
+    assert first is second
+    mock_cls.assert_called_once()
+    kwargs = mock_cls.call_args.kwargs
+    assert kwargs["hosts"] == ["http://es-1:9200", "http://es-2:9200"]
+    assert kwargs["request_timeout"] == 2.5
+    assert kwargs["sniff_on_start"] is False
+
+
+def test_reset_after_fork_drops_client(mocker):
+    mock_cls = mocker.patch("config.es_client.Elasticsearch")
+
+    es_client.get_es_client()
+    es_client._reset_after_fork()
+    es_client.get_es_client()
+
+    assert mock_cls.call_count == 2
@@ -0,0 +1,34 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from rest_framework import serializers
+
+from config.fast_serializer import compile_serializer
+
+
+class ShelfSerializer(serializers.Serializer):
+    label = serializers.CharField()
+
+
+class ItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    price = serializers.DecimalField(max_digits=6, decimal_places=2)
+    shelf_label = serializers.CharField(source="shelf.label", allow_null=True)
+    shelf = ShelfSerializer(allow_null=True)
+    secret = serializers.CharField(write_only=True)
+
+
+def test_compiled_serializer_matches_drf_for_dotted_sources_and_fallback_fields():
+    items = [
+        SimpleNamespace(id="1", price=Decimal("9.5"), shelf=SimpleNamespace(label="A1"), secret="x"),
+        SimpleNamespace(id=2, price=None, shelf=None, secret="x"),
+    ]
+    encode = compile_serializer(ItemSerializer())
+
+    assert [encode(item) for item in items] == ItemSerializer(items, many=True).data
+
+
+def test_compiled_serializer_reads_dict_rows():
+    row = {"id": 3, "price": Decimal("1"), "shelf": {"label": "B2"}, "secret": "x"}
+
+    assert compile_serializer(ItemSerializer())(row) == ItemSerializer(row).data
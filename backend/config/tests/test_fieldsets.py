@@ -0,0 +1,19 @@
+import pytest
+
+from config.fieldsets import parse_fieldset
+
+ALLOWED = frozenset({"id", "title", "synopsis"})
+
+
+def test_no_params_means_all_fields():
+    assert parse_fieldset(None, None, ALLOWED) is None
+
+
+def test_fields_and_exclude_combine():
+    assert parse_fieldset("id, title,synopsis", "synopsis", ALLOWED) == frozenset({"id", "title"})
+    assert parse_fieldset(None, "synopsis", ALLOWED) == frozenset({"id", "title"})
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError, match="Invalid fields: price, stock"):
+        parse_fieldset("title,stock", "price", ALLOWED)
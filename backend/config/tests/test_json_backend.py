@@ -0,0 +1,61 @@
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO, StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils.functional import lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from config.parsers import ORJSONParser
+from config.renderers import ORJSONRenderer
+
+
+def test_renderer_matches_drf_for_serializer_payloads():
+    lazy_str = lazy(lambda: "lazy", str)()
+    data = {
+        "id": 1, "title": "Clean Çode", "tags": ["a", "b"], "nested": {"n": None, "ok": True},
+        "price": Decimal("10.50"), "ttl": timedelta(seconds=90), "label": lazy_str, 7: "int key",
+    }
+
+    assert json.loads(ORJSONRenderer().render(data)) == json.loads(JSONRenderer().render(data))
+
+
+def test_renderer_encodes_dates_natively():
+    key = uuid.uuid4()
+    body = ORJSONRenderer().render({
+        "day": date(2008, 8, 1), "at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "key": key,
+    })
+
+    assert json.loads(body) == {"day": "2008-08-01", "at": "2026-01-02T03:04:05Z", "key": str(key)}
+
+
+def test_renderer_none_and_indent():
+    renderer = ORJSONRenderer()
+
+    assert renderer.render(None) == b""
+    assert renderer.render({"a": 1}, "application/json; indent=4") == b'{\n  "a": 1\n}'
+    assert renderer.render({"a": 1}, "application/json") == b'{"a":1}'
+
+
+def test_parser_reads_json_and_rejects_garbage():
+    parser = ORJSONParser()
+
+    assert parser.parse(BytesIO(b'{"title": "Clean Code"}')) == {"title": "Clean Code"}
+    with pytest.raises(ParseError):
+        parser.parse(BytesIO(b"{not json"))
+
+
+def test_benchmark_json_command_reports_serializers_and_renderers():
+    out = StringIO()
+
+    call_command("benchmark_json", books=20, repeat=1, stdout=out)
+
+    output = out.getvalue()
+    assert "compiled:" in output
+    assert "orjson:" in output
+    assert "serialization speedup:" in output
+    assert "rendering speedup:" in output
@@ -0,0 +1,70 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from config.management.commands.wait_for_schema import Command as WaitForSchemaCommand
+
+
+def test_migrate_with_lock_wraps_migrate_in_advisory_lock(mocker):
+    mock_connections = mocker.patch("config.management.commands.migrate_with_lock.connections")
+    cursor = mock_connections.__getitem__.return_value.cursor.return_value.__enter__.return_value
+    mock_migrate = mocker.patch("config.management.commands.migrate_with_lock.call_command")
+
+    call_command("migrate_with_lock", lock_id=42)
+
+    statements = [c.args for c in cursor.execute.call_args_list]
+    assert statements == [("SELECT pg_advisory_lock(%s)", [42]), ("SELECT pg_advisory_unlock(%s)", [42])]
+    mock_migrate.assert_called_once_with("migrate", database="default", interactive=False, verbosity=1)
+
+
+def test_migrate_with_lock_releases_lock_on_failure(mocker):
+    mock_connections = mocker.patch("config.management.commands.migrate_with_lock.connections")
+    cursor = mock_connections.__getitem__.return_value.cursor.return_value.__enter__.return_value
+    mocker.patch("config.management.commands.migrate_with_lock.call_command", side_effect=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError):
+        call_command("migrate_with_lock", lock_id=42)
+
+    assert cursor.execute.call_args_list[-1].args == ("SELECT pg_advisory_unlock(%s)", [42])
+
+
+def test_wait_for_schema_returns_once_migrations_applied(mocker):
+    mocker.patch("config.management.commands.wait_for_schema.connections")
+    mock_sleep = mocker.patch("config.management.commands.wait_for_schema.time.sleep")
+    mocker.patch.object(
+        WaitForSchemaCommand, "pending_migrations",
+        side_effect=[Exception("connection refused"), ["book.0003_x"], []],
+    )
+
+    call_command("wait_for_schema", interval=0)
+
+    assert mock_sleep.call_count == 2
+
+
+def test_wait_for_schema_times_out(mocker):
+    mocker.patch("config.management.commands.wait_for_schema.connections")
+    mocker.patch("config.management.commands.wait_for_schema.time.sleep")
+    mocker.patch.object(WaitForSchemaCommand, "pending_migrations", return_value=["book.0003_x"])
+
+    with pytest.raises(CommandError, match="Timed out"):
+        call_command("wait_for_schema", timeout=0)
+
+
+def test_ensure_superuser_skips_existing(mocker):
+    mock_user = mocker.patch("config.management.commands.ensure_superuser.get_user_model").return_value
+    mock_user.objects.filter.return_value.exists.return_value = True
+
+    call_command("ensure_superuser")
+
+    mock_user.objects.create_superuser.assert_not_called()
+
+
+def test_ensure_superuser_creates_from_env(mocker, monkeypatch):
+    monkeypatch.setenv("DJANGO_SUPERUSER_USERNAME", "root")
+    monkeypatch.setenv("DJANGO_SUPERUSER_PASSWORD", "secret")
+    mock_user = mocker.patch("config.management.commands.ensure_superuser.get_user_model").return_value
+    mock_user.objects.filter.return_value.exists.return_value = False
+
+    call_command("ensure_superuser")
+
+    mock_user.objects.create_superuser.assert_called_once_with("root", "admin@example.com", "secret")
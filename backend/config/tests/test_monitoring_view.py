@@ -0,0 +1,58 @@
+import pytest
+from rest_framework.test import APIClient
+
+from config import db_pool
+
+
+@pytest.fixture
+def client(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock(is_staff=True))
+    return client
+
+
+def test_db_pool_stats(client, mocker):
+    mocker.patch(
+        "config.monitoring_view.get_pool_stats",
+        return_value={"mode": "pool", "pool_size": 4, "pool_available": 3, "requests_waiting": 0},
+    )
+
+    response = client.get("/api/monitoring/db-pool/")
+
+    assert response.status_code == 200
+    assert response.data["pool_available"] == 3
+
+
+def test_db_pool_stats_requires_staff(mocker):
+    client = APIClient()
+    client.force_authenticate(user=mocker.Mock(is_staff=False))
+
+    response = client.get("/api/monitoring/db-pool/")
+
+    assert response.status_code == 403
+
+
+def test_db_pool_stats_exception(client, mocker):
+    mocker.patch("config.monitoring_view.get_pool_stats", side_effect=Exception("pool closed"))
+
+    response = client.get("/api/monitoring/db-pool/")
+
+    assert response.status_code == 500
+
+
+def test_get_pool_stats_persistent_mode(settings):
+    settings.DB_POOL_ENABLED = False
+
+    stats = db_pool.get_pool_stats()
+
+    assert stats["mode"] == "persistent"
+    assert "conn_max_age" in stats
+
+
+def test_get_pool_stats_pool_mode(settings, mocker):
+    settings.DB_POOL_ENABLED = True
+    connection = mocker.Mock()
+    connection.pool.get_stats.return_value = {"pool_size": 4}
+    mocker.patch.object(db_pool, "connections", {"default": connection})
+
+    assert db_pool.get_pool_stats() == {"mode": "pool", "pool_size": 4}
@@ -4,7 +4,12 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 
+from config.health_view import LivenessView, ReadinessView
+from config.monitoring_view import DatabasePoolView
+
 urlpatterns = [
+    path('healthz', LivenessView.as_view()),
+    path('readyz', ReadinessView.as_view()),
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('api/book/', include('book.interface.book_urls')),
@@ -12,4 +17,5 @@ urlpatterns = [
     path('api/bookstock/', include('book_stock.interface.book_stock_urls')),
     path('api/author/', include('author.interface.author_urls')),
     path('api/branch/', include('branch.interface.branch_urls')),
+    path('api/monitoring/db-pool/', DatabasePoolView.as_view()),
 ]
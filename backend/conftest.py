@@ -0,0 +1,21 @@
+import pytest
+from django.core.cache import caches
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in caches.all():
+        cache.clear()
+    yield
+
+
+@pytest.fixture
+def shared_book_cache(settings):
+    """Stand-in for the Redis book cache, which is disabled when BOOK_CACHE_URL is unset."""
+    settings.CACHES = {
+        **settings.CACHES,
+        settings.BOOK_CACHE_ALIAS: {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "books"},
+    }
+    cache = caches[settings.BOOK_CACHE_ALIAS]
+    cache.clear()
+    yield cache
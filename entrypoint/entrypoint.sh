@@ -23,36 +23,46 @@ RABBITMQ_PORT="${RABBITMQ_PORT:-5672}"
 wait_for_service "$POSTGRES_HOST" "$POSTGRES_PORT" "PostgreSQL"
 wait_for_service "$RABBITMQ_HOST" "$RABBITMQ_PORT" "RabbitMQ"
 
-if [ "$ROLE" = "web" ]; then
-  echo "Running migrations..."
-  python manage.py makemigrations author
-  python manage.py makemigrations branch
-  python manage.py makemigrations book_category
-  python manage.py makemigrations book
-  python manage.py makemigrations book_stock
-  python manage.py makemigrations
-  python manage.py migrate
-
-  echo "Creating default superuser (if not exists)..."
-  python manage.py shell << EOF
-from django.contrib.auth import get_user_model
-User = get_user_model()
-username = "admin"
-password = "admin123"
-email = "admin@example.com"
-if not User.objects.filter(username=username).exists():
-    User.objects.create_superuser(username, email, password)
-    print("Superuser created.")
-else:
-    print("Superuser already exists.")
-EOF
-
-  echo "Starting Django server..."
-  exec python manage.py runserver 0.0.0.0:8000
+run_migrations() {
+  echo "Applying migrations (advisory-locked)..."
+  python manage.py migrate_with_lock
+  python manage.py ensure_superuser
+  python manage.py ensure_books_index || echo "Elasticsearch unavailable; run ensure_books_index or reindex_books later"
+}
+
+wait_for_schema() {
+  echo "Waiting for database schema..."
+  python manage.py wait_for_schema --timeout "${SCHEMA_WAIT_TIMEOUT:-120}"
+}
+
+if [ "$ROLE" = "migrate" ]; then
+  run_migrations
+  exit 0
+
+elif [ "$ROLE" = "web" ]; then
+  if [ "${RUN_MIGRATIONS:-False}" = "True" ]; then
+    run_migrations
+  else
+    wait_for_schema
+  fi
+
+  SERVER_MODE="${SERVER_MODE:-wsgi}"
+  if [ "$SERVER_MODE" = "dev" ]; then
+    echo "Starting Django development server..."
+    exec python manage.py runserver 0.0.0.0:8000
+  elif [ "$SERVER_MODE" = "asgi" ]; then
+    echo "Starting gunicorn with uvicorn workers (ASGI)..."
+    exec gunicorn config.asgi:application -c config/gunicorn.conf.py
+  else
+    echo "Starting gunicorn (WSGI)..."
+    exec gunicorn config.wsgi:application -c config/gunicorn.conf.py
+  fi
 
 elif [ "$ROLE" = "worker" ]; then
+  wait_for_schema
+  # Mutations left in the outbox by a previous run would otherwise wait for the next write.
+  python manage.py flush_book_index || echo "Could not schedule a search index flush"
   echo "Starting Dramatiq worker..."
-  sleep 5
   python manage.py rundramatiq --processes 1 --threads 1
 else
   echo "Unknown ROLE: $ROLE"